@@ -2,8 +2,8 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from power_grid_model_ds._core.load_flow import PowerGridModelInterface
+from power_grid_model_ds._core.load_flow import PowerGridModelInterface, Profile
 from power_grid_model_ds._core.model.graphs.container import GraphContainer
 from power_grid_model_ds._core.model.grids.base import Grid
 
-__all__ = ["Grid", "GraphContainer", "PowerGridModelInterface"]
+__all__ = ["Grid", "GraphContainer", "PowerGridModelInterface", "Profile"]
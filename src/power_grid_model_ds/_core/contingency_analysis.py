@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""N-1 contingency analysis"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from power_grid_model import CalculationMethod, ComponentType, DatasetType, initialize_array
+
+from power_grid_model_ds._core.load_flow import PowerGridModelInterface
+from power_grid_model_ds._core.model.arrays import IdArray
+from power_grid_model_ds._core.model.constants import empty
+
+BRANCH_COMPONENTS = [ComponentType.line, ComponentType.link, ComponentType.transformer]
+
+
+class ContingencyArray(IdArray):
+    """Summary of the power flow result per contingency. The id is the id of the branch that is switched off.
+
+    Islanding contingencies (after which part of the grid is no longer connected) are not calculated,
+    their results are nan.
+    """
+
+    is_islanding: NDArray[np.bool_]  # whether switching off the branch disconnects part of the grid
+    is_converged: NDArray[np.bool_]  # whether the power flow calculation succeeded
+    max_loading: NDArray[np.float64]  # highest loading of all branches
+    max_loading_branch: NDArray[np.int32]  # id of the branch with the highest loading
+    nr_overloaded_branches: NDArray[np.int32]  # number of branches with a loading above the maximum
+    min_u_pu: NDArray[np.float64]  # lowest voltage of all energized nodes
+    max_u_pu: NDArray[np.float64]  # highest voltage of all energized nodes
+    nr_voltage_violations: NDArray[np.int32]  # number of energized nodes with a voltage outside the limits
+
+    _defaults = {
+        "is_islanding": False,
+        "is_converged": False,
+        "max_loading": np.nan,
+        "max_loading_branch": empty,
+        "nr_overloaded_branches": 0,
+        "min_u_pu": np.nan,
+        "max_u_pu": np.nan,
+        "nr_voltage_violations": 0,
+    }
+
+
+class ContingencyAnalysis:
+    """N-1 contingency analysis: the effect of switching off each branch (line, link or transformer) of the grid.
+
+    All contingencies are calculated in a single batch calculation, in which each scenario switches off one branch.
+    Contingencies that disconnect part of the grid (islanding, e.g. all branches of a radial feeder) are detected from
+    the active graph up front and not calculated.
+
+    Example:
+        >>> analysis = ContingencyAnalysis(PowerGridModelInterface(grid=grid), max_loading=1.0)
+        >>> results = analysis.run(threading=0)
+        >>> results[results.nr_overloaded_branches > 0]
+    """
+
+    def __init__(
+        self,
+        core_interface: PowerGridModelInterface,
+        max_loading: float = 1.0,
+        min_u_pu: float = 0.9,
+        max_u_pu: float = 1.1,
+    ):
+        self.core_interface = core_interface
+        self.max_loading = max_loading
+        self.min_u_pu = min_u_pu
+        self.max_u_pu = max_u_pu
+
+    def get_contingencies(self, branch_ids: Optional[ArrayLike] = None) -> ContingencyArray:
+        """Return the contingencies of the active branches, with is_islanding set.
+
+        Args:
+            branch_ids: the branches to consider. Defaults to all active branches. Inactive branches are ignored.
+        """
+        grid = self.core_interface.grid
+        branches = grid.branches
+        branches = branches[branches.is_active]
+        if branch_ids is not None:
+            branches = branches[np.isin(branches.id, branch_ids)]
+
+        bridges = np.sort(grid.graphs.active_graph.get_bridges(), axis=1)
+        node_pairs = np.sort(np.column_stack([branches.from_node, branches.to_node]), axis=1)
+        is_islanding = _rows_in(node_pairs, bridges)
+
+        return ContingencyArray(id=branches.id, is_islanding=is_islanding)
+
+    def run(
+        self,
+        branch_ids: Optional[ArrayLike] = None,
+        threading: int = -1,
+        calculation_method: CalculationMethod = CalculationMethod.newton_raphson,
+    ) -> ContingencyArray:
+        """Run the contingency analysis.
+
+        Args:
+            branch_ids: the branches to switch off. Defaults to all active branches.
+            threading: the number of threads of the batch calculation (-1: sequential, 0: number of hardware threads)
+            calculation_method: the calculation method
+
+        Returns:
+            the summary per contingency
+        """
+        contingencies = self.get_contingencies(branch_ids)
+        calculated = contingencies[~contingencies.is_islanding]
+        if not calculated.size:
+            return contingencies
+
+        model = self.core_interface.get_synced_model()
+        output = model.calculate_power_flow(
+            calculation_method=calculation_method,
+            update_data=self._create_update_data(calculated.id),
+            threading=threading,
+            continue_on_batch_error=True,
+            output_component_types=[ComponentType.node, *BRANCH_COMPONENTS],
+        )
+        is_converged = np.ones(calculated.size, dtype=np.bool_)
+        if model.batch_error is not None:
+            is_converged[model.batch_error.failed_scenarios] = False
+
+        self._summarize(calculated, output, is_converged)
+        contingencies[~contingencies.is_islanding] = calculated
+        return contingencies
+
+    def _create_update_data(self, branch_ids: NDArray[np.int64]) -> Dict[ComponentType, Dict[str, NDArray]]:
+        """Create sparse batch update data, in which scenario i switches off branch_ids[i]"""
+        grid = self.core_interface.grid
+        update_data = {}
+        for component in BRANCH_COMPONENTS:
+            scenarios = np.flatnonzero(np.isin(branch_ids, getattr(grid, component).id))
+            if not scenarios.size:
+                continue
+            update_array = initialize_array(DatasetType.update, component, scenarios.size)
+            update_array["id"] = branch_ids[scenarios]
+            update_array["from_status"] = 0
+            update_array["to_status"] = 0
+            nr_updates = np.bincount(scenarios, minlength=branch_ids.size)
+            indptr = np.concatenate([[0], np.cumsum(nr_updates)]).astype(np.int64)
+            update_data[component] = {"data": update_array, "indptr": indptr}
+        return update_data
+
+    def _summarize(
+        self, contingencies: ContingencyArray, output: Dict[ComponentType, NDArray], is_converged: NDArray
+    ) -> None:
+        """Fill the summary of each contingency from the batch output"""
+        branch_output = [output[name] for name in BRANCH_COMPONENTS if name in output and output[name].size]
+        loading = np.concatenate([branch["loading"] for branch in branch_output], axis=1)
+        branch_ids = np.concatenate([branch["id"][0] for branch in branch_output])
+        max_index = np.argmax(np.nan_to_num(loading, nan=-np.inf), axis=1)
+        contingencies.max_loading = np.take_along_axis(loading, max_index[:, np.newaxis], axis=1)[:, 0]
+        contingencies.max_loading_branch = branch_ids[max_index]
+        contingencies.nr_overloaded_branches = np.count_nonzero(loading > self.max_loading, axis=1)
+
+        u_pu = np.where(output[ComponentType.node]["energized"] == 1, output[ComponentType.node]["u_pu"], np.nan)
+        contingencies.min_u_pu = np.fmin.reduce(u_pu, axis=1)
+        contingencies.max_u_pu = np.fmax.reduce(u_pu, axis=1)
+        contingencies.nr_voltage_violations = np.count_nonzero((u_pu < self.min_u_pu) | (u_pu > self.max_u_pu), axis=1)
+
+        # the output of failed scenarios is meaningless
+        contingencies.is_converged = is_converged
+        contingencies[~is_converged] = ContingencyArray(id=contingencies.id[~is_converged])
+
+
+def _rows_in(rows: NDArray[np.int64], other_rows: NDArray[np.int64]) -> NDArray[np.bool_]:
+    """Return for each row of a (n, 2) array whether it occurs in the other (m, 2) array"""
+    if not rows.size or not other_rows.size:
+        return np.zeros(len(rows), dtype=np.bool_)
+    return np.isin(_as_row_values(rows), _as_row_values(other_rows))
+
+
+def _as_row_values(rows: NDArray[np.int64]) -> NDArray[np.void]:
+    # each row is viewed as a single (raw bytes) value, so that rows are compared without combining the ids
+    rows = np.ascontiguousarray(rows, dtype=np.int64)
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
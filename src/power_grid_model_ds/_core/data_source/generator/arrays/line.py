@@ -36,11 +36,8 @@ class LineGenerator(BaseGenerator):
         else:
             self.line_array = self.grid.line
 
-        # while not all connected, add lines from a connected node to an unconnected node
         self.set_unconnected_nodes()
-        while any(self.unconnected_nodes):
-            self.connect_nodes()
-            self.set_unconnected_nodes()
+        self.connect_all_nodes()
 
         number_of_nops = amount
         if number_of_nops > 0:
@@ -95,11 +92,56 @@ class LineGenerator(BaseGenerator):
         new_line.i_n = capacity
         self.line_array = fp.concatenate(self.line_array, new_line)
 
+    def connect_all_nodes(self):
+        """Connect all unconnected nodes with lines, such that each voltage level forms a random tree.
+
+        The unconnected nodes are connected in random order, each to a random connected node of the same voltage.
+        This is equivalent to calling connect_nodes until all nodes are connected, but without a pass over all nodes
+        per line: within a voltage level, the k-th node in the random order is connected to one of the initially
+        connected nodes or one of the k - 1 nodes before it.
+        """
+        if not self.unconnected_nodes:
+            return
+        nodes = self.grid.node
+        unconnected_indices = self.rng.permutation(np.flatnonzero(np.isin(nodes.id, self.unconnected_nodes)))
+        unconnected_nodes = nodes.id[unconnected_indices]
+        from_nodes = np.empty_like(unconnected_nodes)
+        for voltage in np.unique(nodes.u_rated[unconnected_indices]):
+            voltage_mask = nodes.u_rated[unconnected_indices] == voltage
+            from_nodes[voltage_mask] = self._pick_from_nodes(unconnected_nodes[voltage_mask], voltage)
+
+        number_of_lines = unconnected_nodes.size
+        new_lines = self.grid.line.__class__.zeros(number_of_lines)
+        new_lines.id = 1 + max(self.line_array.id.max(initial=0), self.grid.max_id) + np.arange(number_of_lines)
+        new_lines.from_node = from_nodes
+        new_lines.to_node = unconnected_nodes
+        new_lines.from_status = 1
+        new_lines.to_status = 1
+        new_lines.r1 = self.rng.exponential(0.2, number_of_lines)
+        new_lines.x1 = self.rng.exponential(0.02, number_of_lines)
+        new_lines.i_n = 100 + self.rng.exponential(200, number_of_lines)
+        self.line_array = fp.concatenate(self.line_array, new_lines)
+        self.connected_nodes = self.connected_nodes + unconnected_nodes.tolist()
+        self.unconnected_nodes = []
+
+    def _pick_from_nodes(self, to_nodes: np.ndarray, voltage: float) -> np.ndarray:
+        """Pick a random from_node for each of the (randomly ordered) to_nodes of the voltage level"""
+        same_voltage_mask = np.isin(self.grid.node.id, self.connected_nodes) & (self.grid.node.u_rated == voltage)
+        options = np.concatenate((self.grid.node.id[same_voltage_mask], to_nodes))
+        nr_initial_options = options.size - to_nodes.size
+        if nr_initial_options == 0:
+            raise ValueError(f"Cannot connect the nodes of {voltage} V: none of them is connected yet")
+        nr_options = nr_initial_options + np.arange(to_nodes.size)
+        return options[(self.rng.random(to_nodes.size) * nr_options).astype(np.int64)]
+
     def create_nop_lines(self, number_of_nops: int):
         """Create the inactive lines between different routes (Normally Open Points)"""
-        nops = [self.rng.choice(self.grid.node.id, 2, replace=False) for _ in range(number_of_nops)]
-        from_nodes = [nop[0] for nop in nops]
-        to_nodes = [nop[1] for nop in nops]
+        # two distinct random nodes per nop: the to_node is a random other node than the from_node
+        nr_nodes = self.grid.node.size
+        from_indices = self.rng.integers(0, nr_nodes, number_of_nops)
+        to_indices = (from_indices + self.rng.integers(1, nr_nodes, number_of_nops)) % nr_nodes
+        from_nodes = self.grid.node.id[from_indices]
+        to_nodes = self.grid.node.id[to_indices]
         capacities = 100 + self.rng.exponential(200, number_of_nops)
         nop_lines = self.grid.line.__class__.zeros(number_of_nops)
         nop_lines.id = 1 + self.line_array.id.max() + np.arange(number_of_nops)
@@ -114,18 +156,15 @@ class LineGenerator(BaseGenerator):
 
     def set_unconnected_nodes(self) -> None:
         """From a line array and total set of nodes determine which are not yet connected"""
-        connected_link_mask = np.logical_or(
-            np.isin(self.grid.node.id, self.line_array.from_node),
-            np.isin(self.grid.node.id, self.line_array.to_node),
-        )
-        connected_trafo_mask = np.logical_or(
-            np.isin(self.grid.node.id, self.trafo_array.from_node),
-            np.isin(self.grid.node.id, self.trafo_array.to_node),
-        )
-        connected_mask = np.logical_or(
-            connected_link_mask,
-            connected_trafo_mask,
+        branch_nodes = np.concatenate(
+            (
+                self.line_array.from_node,
+                self.line_array.to_node,
+                self.trafo_array.from_node,
+                self.trafo_array.to_node,
+            )
         )
+        connected_mask = np.isin(self.grid.node.id, branch_nodes)
         connected_nodes = self.grid.node.id[connected_mask]
         unconnected_nodes = self.grid.node.id[~connected_mask]
 
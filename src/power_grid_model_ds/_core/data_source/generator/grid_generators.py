@@ -4,14 +4,20 @@
 
 """Generators for the grid"""
 
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Generic, Type, TypeVar
 
 import numpy as np
+from numpy.typing import NDArray
 
 from power_grid_model_ds._core.data_source.generator.arrays.line import LineGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.transformer import TransformerGenerator
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.graphs.models.rustworkx import RustworkxGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
@@ -20,6 +26,21 @@ from power_grid_model_ds._core.model.grids.base import Grid
 
 T = TypeVar("T", bound=Grid)
 
+# the columns that contain (references to) ids, which are offset when the areas are combined into one grid
+_ID_COLUMNS = (
+    "id",
+    "node",
+    "from_node",
+    "to_node",
+    "node_1",
+    "node_2",
+    "node_3",
+    "measured_object",
+    "regulated_object",
+    "feeder_branch_id",
+    "feeder_node_id",
+)
+
 
 class RadialGridGenerator(Generic[T]):
     """Generates a random but structurally correct radial grid with the given specifications"""
@@ -78,3 +99,103 @@ class RadialGridGenerator(Generic[T]):
             grid.append(lines[~np.isin(lines.id, grid.line.id)])
 
         return grid
+
+
+class GridCorpusGenerator(Generic[T]):
+    """Generates a large random grid that consists of independent substation areas.
+
+    Each area is a random radial grid (see RadialGridGenerator) with its own sources. The areas are generated in
+    worker processes, each with a seed derived from the given seed, so the result does not depend on the number of
+    workers. The areas are then combined into one grid by offsetting their ids.
+
+    Example:
+        >>> generator = GridCorpusGenerator(grid_class=Grid, nr_areas=100, nr_nodes_per_area=10_000)
+        >>> cache_path = generator.cache(cache_dir=Path("corpus"), cache_name="1M_nodes", seed=0)
+        >>> grid = Grid.from_cache(cache_path)
+    """
+
+    def __init__(
+        self,
+        grid_class: Type[T],
+        nr_areas: int = 10,
+        nr_nodes_per_area: int = 1000,
+        nr_sources_per_area: int = 1,
+        nr_nops_per_area: int = 10,
+        graph_model: type[BaseGraphModel] = RustworkxGraphModel,
+    ):
+        self.grid_class = grid_class
+        self.graph_model = graph_model
+        self.nr_areas = nr_areas
+        self.area_generator = RadialGridGenerator(
+            grid_class=grid_class,
+            nr_nodes=nr_nodes_per_area,
+            nr_sources=nr_sources_per_area,
+            nr_nops=nr_nops_per_area,
+            graph_model=graph_model,
+        )
+
+    def run(self, seed=None, max_workers: int | None = None, build_graphs: bool = True) -> T:
+        """Generate the areas and combine them into one grid.
+
+        Args:
+            seed: the seed to derive the seeds of the areas from
+            max_workers: the number of worker processes. Defaults to the number of processors.
+                If 1, the areas are generated in this process.
+            build_graphs: whether to build the graphs of the grid. Not needed if the grid is only cached.
+        """
+        area_seeds = [int(area_seed) for area_seed in np.random.SeedSequence(seed).generate_state(self.nr_areas)]
+        if max_workers == 1:
+            areas = [_generate_area(self.area_generator, area_seed) for area_seed in area_seeds]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                areas = list(executor.map(_generate_area, [self.area_generator] * self.nr_areas, area_seeds))
+
+        grid = self._combine_areas(areas)
+        if build_graphs:
+            grid.graphs = GraphContainer.from_arrays(grid, graph_model=self.graph_model)
+        return grid
+
+    def cache(
+        self,
+        cache_dir: Path,
+        cache_name: str,
+        seed=None,
+        max_workers: int | None = None,
+        compress: bool = False,
+        cache_graphs: bool = True,
+    ) -> Path:
+        """Generate the grid and save it as a columnar cache (see Grid.cache).
+
+        Returns:
+            Path: the path to the cache directory
+        """
+        grid = self.run(seed=seed, max_workers=max_workers, build_graphs=cache_graphs)
+        return grid.cache(cache_dir, cache_name, compress=compress, columnar=True, cache_graphs=cache_graphs)
+
+    def _combine_areas(self, areas: list[tuple[int, dict[str, NDArray]]]) -> T:
+        grid = self.grid_class.empty(graph_model=self.graph_model)
+        id_offsets = np.cumsum([0] + [max_id for max_id, _ in areas])
+        for field in dataclasses.fields(grid):
+            array = getattr(grid, field.name)
+            if not isinstance(array, FancyArray):
+                continue
+            area_arrays = [array.__class__(data=area_data[field.name]) for _, area_data in areas]
+            for area_array, id_offset in zip(area_arrays, id_offsets):
+                for column in _ID_COLUMNS:
+                    if column in area_array.columns:
+                        area_array[column] = np.where(
+                            area_array.is_empty(column), area_array[column], area_array[column] + id_offset
+                        )
+            setattr(grid, field.name, array.__class__(data=np.concatenate([area.data for area in area_arrays])))
+        grid._id_counter = int(id_offsets[-1])  # pylint: disable=protected-access
+        return grid
+
+
+def _generate_area(area_generator: RadialGridGenerator, seed: int) -> tuple[int, dict[str, NDArray]]:
+    """Generate the grid of one area (in a worker process) and return its max id and its arrays"""
+    area = area_generator.run(seed=seed)
+    return area.max_id, {
+        field.name: getattr(area, field.name).data
+        for field in dataclasses.fields(area)
+        if isinstance(getattr(area, field.name), FancyArray)
+    }
@@ -23,7 +23,13 @@ def concatenate(fancy_array: T, *other_arrays: Union[T, np.ndarray]) -> T:
         concatenated = np.concatenate([fancy_array.data] + np_arrays)
     except TypeError as error:
         raise TypeError("Cannot append arrays: mismatching dtypes.") from error
-    return fancy_array.__class__(data=concatenated)
+    concatenated_array = fancy_array.__class__(data=concatenated)
+    if fancy_array.id_index is not None:
+        # pylint: disable=protected-access
+        concatenated_array._id_index = fancy_array.id_index.extend(
+            fancy_array.data["id"], concatenated["id"][fancy_array.size :]
+        )
+    return concatenated_array
 
 
 def unique(array: T, **kwargs):
@@ -42,6 +48,7 @@ def unique(array: T, **kwargs):
 def sort(array: T, axis=-1, kind=None, order=None) -> T:
     """Sort the array in-place and return sorted array."""
     array.data.sort(axis=axis, kind=kind, order=order)
+    array._register_change(ids_changed=True)  # pylint: disable=protected-access
     return array
 
 
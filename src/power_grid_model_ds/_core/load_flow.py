@@ -5,12 +5,14 @@
 """Power flow functions and classes"""
 
 import warnings
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
 
 import numpy as np
 from numpy.typing import NDArray
-from power_grid_model import CalculationMethod, PowerGridModel, initialize_array
+from power_grid_model import CalculationMethod, DatasetType, PowerGridModel, initialize_array, power_grid_meta_data
 
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.grids.base import Grid
 
 PGM_ARRAYS = [
@@ -28,11 +30,31 @@ PGM_ARRAYS = [
     "asym_voltage_sensor",
 ]
 
+# pylint: disable=protected-access
+
 
 class PGMCoreException(Exception):
     """Raised when there is an error in running the power grid model"""
 
 
+@dataclass
+class Profile:
+    """Values of an attribute of a component for a series of scenarios (e.g. a time series of load powers).
+
+    Args:
+        component: the pgm component (e.g. "sym_load")
+        attribute: the attribute that is updated (e.g. "p_specified")
+        values: array of shape (nr_scenarios, nr_ids). Can be a np.memmap, only the rows of a chunk are read.
+        ids: the ids of the records the columns belong to.
+            Defaults to all records of the component in the grid (in the order of the grid array).
+    """
+
+    component: str
+    attribute: str
+    values: NDArray
+    ids: Optional[NDArray] = None
+
+
 class PowerGridModelInterface:
     """Interface between the Grid and the PowerGridModel (pgm).
 
@@ -40,6 +62,12 @@ class PowerGridModelInterface:
     - Can calculate power flow
     - Can do batch calculations using pgm
     - Can update grid with output from power flow
+
+    When the input is created from the grid, the interface keeps track of the grid arrays the model was built from.
+    Before each calculation, changes to the grid are applied to the existing model:
+    changes to values that can be updated in the PowerGridModel (e.g. load powers, switch statuses, tap positions)
+    are applied with PowerGridModel.update, other (structural) changes rebuild the model.
+    Changed arrays are found by their version, see sync_model for changes that are made through views on the data.
     """
 
     def __init__(
@@ -54,6 +82,8 @@ class PowerGridModelInterface:
         self._input_data = input_data or {}
         self.output_data: dict[str, NDArray] = {}
         self.model: Optional[PowerGridModel] = None
+        # the grid arrays the input data was created from, together with their version at that time
+        self._synced_arrays: dict[str, tuple[FancyArray, int]] = {}
 
     @property
     def input_data(self) -> Dict[str, NDArray]:
@@ -73,6 +103,8 @@ class PowerGridModelInterface:
         for array_name in PGM_ARRAYS:
             pgm_array = self._create_power_grid_array(array_name=array_name)
             self._input_data[array_name] = pgm_array
+            array = getattr(self.grid, array_name)
+            self._synced_arrays[array_name] = (array, array._version)
         return self._input_data
 
     def create_grid_from_input_data(self, check_ids: bool = True) -> Grid:
@@ -104,16 +136,83 @@ class PowerGridModelInterface:
         """Initialize the PowerGridModel and calculate power flow over input data.
 
         If input data is not available, self.create_input_from_grid() will be called to create it.
+        If the model was created from the grid, changes to the grid since the last calculation are applied first.
 
         Returns output of the power flow calculation (also stored in self.output_data)
         """
-        self.model = self.model or self.setup_model()
+        self.model = self.get_synced_model()
 
         self.output_data = self.model.calculate_power_flow(
             calculation_method=calculation_method, update_data=update_data, **kwargs
         )
         return self.output_data
 
+    def calculate_power_flow_profiles(
+        self,
+        profiles: list[Profile],
+        chunk_size: int = 1000,
+        threading: int = -1,
+        calculation_method: CalculationMethod = CalculationMethod.newton_raphson,
+        **kwargs,
+    ) -> Iterator[tuple[slice, Dict[str, NDArray]]]:
+        """Calculate power flow for the scenarios of the profiles, in batch calculations of chunk_size scenarios.
+
+        The update data is created per chunk and the output of a chunk is yielded before the next chunk is
+        calculated, so the memory usage depends on the chunk size and not on the number of scenarios.
+        The output is not stored in self.output_data.
+
+        Args:
+            profiles: the profiles to update the model with. All profiles should have the same number of scenarios.
+            chunk_size: the number of scenarios per batch calculation
+            threading: the number of threads per batch calculation (-1: sequential, 0: number of hardware threads)
+            calculation_method: the calculation method
+            **kwargs: passed to PowerGridModel.calculate_power_flow (e.g. output_component_types)
+
+        Returns:
+            an iterator over the chunks, yielding the scenarios of the chunk (as a slice) and the batch output of
+            those scenarios
+
+        Raises:
+            ValueError: if the profiles do not match each other or the grid (when called, before any calculation)
+
+        Example:
+            >>> p_profile = Profile("sym_load", "p_specified", p_values)  # shape (nr_scenarios, grid.sym_load.size)
+            >>> for scenarios, output in core_interface.calculate_power_flow_profiles([p_profile], chunk_size=96):
+            >>>     max_loading[scenarios] = output["line"]["loading"].max(axis=1)
+        """
+        # the input is validated here, the chunks are calculated when the returned iterator is consumed
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size should be at least 1 (got {chunk_size})")
+        nr_scenarios = _get_nr_scenarios(profiles)
+        component_ids = self._get_profile_ids(profiles)
+        chunks = [slice(start, min(start + chunk_size, nr_scenarios)) for start in range(0, nr_scenarios, chunk_size)]
+        return self._calculate_profile_chunks(
+            profiles, component_ids, chunks, calculation_method=calculation_method, threading=threading, **kwargs
+        )
+
+    def _calculate_profile_chunks(
+        self, profiles: list[Profile], component_ids: dict[str, NDArray], chunks: list[slice], **kwargs
+    ) -> Iterator[tuple[slice, Dict[str, NDArray]]]:
+        model = self.get_synced_model()
+        for scenarios in chunks:
+            update_data = _create_profile_update_data(profiles, component_ids, scenarios)
+            yield scenarios, model.calculate_power_flow(update_data=update_data, **kwargs)
+
+    def _get_profile_ids(self, profiles: list[Profile]) -> dict[str, NDArray]:
+        """Return the ids of the records that are updated per component"""
+        component_ids: dict[str, NDArray] = {}
+        for profile in profiles:
+            ids = getattr(self.grid, profile.component).id if profile.ids is None else np.asarray(profile.ids)
+            if profile.values.ndim != 2 or profile.values.shape[1] != ids.size:
+                raise ValueError(
+                    f"Profile {profile.component}.{profile.attribute} should have shape (nr_scenarios, {ids.size}) "
+                    f"(got {profile.values.shape})"
+                )
+            if profile.component in component_ids and not np.array_equal(component_ids[profile.component], ids):
+                raise ValueError(f"Profiles of {profile.component} should have the same ids")
+            component_ids[profile.component] = ids
+        return component_ids
+
     def _create_power_grid_array(self, array_name: str) -> np.ndarray:
         """Create power grid model array"""
         internal_array = getattr(self.grid, array_name)
@@ -144,21 +243,33 @@ class PowerGridModelInterface:
             >>>    'line': update_line
             >>> }
 
-
+        Note:
+            The update is applied to the model only, not to the grid. It is lost when the model is rebuilt
+            because of a structural change to the grid (see sync_model).
         """
-        self.model = self.model or self.setup_model()
+        self.model = self.get_synced_model()
         self.model.update(update_data=update_data)
 
-    def update_grid(self) -> None:
+    def update_grid(self, output_data: Optional[Dict[str, NDArray]] = None, scenario: Optional[int] = None) -> None:
         """
         Fills the output values in the grid for the values that are present
+
+        Args:
+            output_data: the output to fill in, e.g. a scenario or statistic from a ResultStore.
+                Defaults to self.output_data.
+            scenario: the scenario to fill in, if the output is the output of a batch calculation
         """
-        if not self.output_data:
+        output_data = self.output_data if output_data is None else output_data
+        if not output_data:
             raise PGMCoreException("Can not update grid without output_data")
         for array_name in PGM_ARRAYS:
-            if array_name in self.output_data.keys():
+            if array_name in output_data.keys():
                 internal_array = getattr(self.grid, array_name)
-                pgm_output_array = self.output_data[array_name]
+                pgm_output_array = output_data[array_name]
+                if pgm_output_array.ndim == 2:
+                    if scenario is None:
+                        raise PGMCoreException("Can not update grid with batch output without a scenario")
+                    pgm_output_array = pgm_output_array[scenario]
                 fields = self._match_dtypes(pgm_output_array.dtype, internal_array.dtype)
                 internal_array[fields] = pgm_output_array[fields]
 
@@ -171,3 +282,116 @@ class PowerGridModelInterface:
         self._input_data = self._input_data or self.create_input_from_grid()
         self.model = PowerGridModel(self._input_data, system_frequency=self.system_frequency)
         return self.model
+
+    def sync_model(self, check_content: bool = False) -> None:
+        """Apply the changes to the grid since the model was built (or last synced) to the model.
+
+        Changes to values that can be updated in the PowerGridModel are applied with PowerGridModel.update.
+        If records were added or removed, or other values were changed, the model is rebuilt. In that case,
+        updates applied earlier with update_model are lost.
+        Does nothing if the model was not created from the grid.
+
+        Args:
+            check_content: whether to compare the contents of all arrays with the model input.
+                By default, only arrays that were replaced or changed through the FancyArray API (e.g. update_by_id,
+                grid.sym_load.p_specified = ...) are compared, so that syncing an unchanged grid is cheap.
+                Changes through views on the data (e.g. grid.sym_load.p_specified[0] = ...) are only found with
+                check_content=True.
+        """
+        if self.model is None or not self._synced_arrays:
+            return
+
+        update_data = {}
+        is_structural = False
+        for array_name in PGM_ARRAYS:
+            array = getattr(self.grid, array_name)
+            synced_array, synced_version = self._synced_arrays[array_name]
+            if not check_content and array is synced_array and array._version == synced_version:
+                continue
+
+            old_input = self._input_data[array_name]
+            new_input = self._create_power_grid_array(array_name=array_name)
+            self._input_data[array_name] = new_input
+            self._synced_arrays[array_name] = (array, array._version)
+            if is_structural:
+                continue
+
+            update_array = _create_update_array(array_name, old_input, new_input)
+            if update_array is None:
+                is_structural = True
+            elif update_array.size:
+                update_data[array_name] = update_array
+
+        if is_structural:
+            self.model = PowerGridModel(self._input_data, system_frequency=self.system_frequency)
+        elif update_data:
+            self.model.update(update_data=update_data)
+
+    def get_synced_model(self) -> PowerGridModel:
+        """Return the PowerGridModel of the grid, for calculations that are not wrapped by this interface
+        (e.g. with custom update data or output components).
+
+        The model is set up if it does not exist yet, or synced with the changes to the grid otherwise (see sync_model).
+        """
+        if self.model is None:
+            return self.setup_model()
+        self.sync_model()
+        return self.model
+
+
+def _get_nr_scenarios(profiles: list[Profile]) -> int:
+    nr_scenarios = {len(profile.values) for profile in profiles}
+    if len(nr_scenarios) != 1:
+        raise ValueError(f"All profiles should have the same number of scenarios (got {sorted(nr_scenarios)})")
+    return nr_scenarios.pop()
+
+
+def _create_profile_update_data(
+    profiles: list[Profile], component_ids: dict[str, NDArray], scenarios: slice
+) -> Dict[str, NDArray]:
+    """Create the batch update data for the scenarios of the profiles"""
+    nr_scenarios = scenarios.stop - scenarios.start
+    update_data = {}
+    for component, ids in component_ids.items():
+        update_array = initialize_array(DatasetType.update, component, (nr_scenarios, ids.size))
+        update_array["id"] = ids
+        update_data[component] = update_array
+    for profile in profiles:
+        update_data[profile.component][profile.attribute] = profile.values[scenarios]
+    return update_data
+
+
+def _create_update_array(array_name: str, old_input: NDArray, new_input: NDArray) -> Optional[NDArray]:
+    """Create a pgm update array with the records (and attributes) that changed from old_input to new_input.
+
+    Returns None if the change cannot be applied as an update (i.e. the model has to be rebuilt).
+    """
+    if old_input.size != new_input.size or not np.array_equal(old_input["id"], new_input["id"]):
+        return None
+
+    update_columns = power_grid_meta_data[DatasetType.update][array_name].dtype.names or ()
+    changed_rows = np.zeros(new_input.size, dtype=np.bool_)
+    changed_columns = []
+    for column in new_input.dtype.names or ():
+        is_changed = _get_changed_mask(old_input[column], new_input[column])
+        if not is_changed.any():
+            continue
+        if column not in update_columns:
+            return None
+        changed_rows |= is_changed
+        changed_columns.append(column)
+
+    update_array = initialize_array(DatasetType.update, array_name, int(np.count_nonzero(changed_rows)))
+    update_array["id"] = new_input["id"][changed_rows]
+    for column in changed_columns:
+        update_array[column] = new_input[column][changed_rows]
+    return update_array
+
+
+def _get_changed_mask(old_column: NDArray, new_column: NDArray) -> NDArray[np.bool_]:
+    is_changed = old_column != new_column
+    if new_column.dtype.kind == "f":
+        is_changed &= ~(np.isnan(old_column) & np.isnan(new_column))
+    if is_changed.ndim > 1:  # asymmetric attributes
+        is_changed = is_changed.any(axis=tuple(range(1, is_changed.ndim)))
+    return is_changed
@@ -7,6 +7,7 @@ from typing import Any, Iterable, Literal
 import numpy as np
 from numpy.typing import NDArray
 
+from power_grid_model_ds._core.model.arrays.base._index import IdIndex
 from power_grid_model_ds._core.model.arrays.base.errors import MultipleRecordsReturned, RecordDoesNotExist
 from power_grid_model_ds._core.utils.misc import is_sequence
 
@@ -15,17 +16,21 @@ def get_filter_mask(
     *args: int | Iterable[int] | np.ndarray,
     array: np.ndarray,
     mode_: Literal["AND", "OR"],
+    index_: IdIndex | None = None,
     **kwargs: Any | list[Any] | np.ndarray,
 ) -> np.ndarray:
-    """Returns a mask that matches the input parameters."""
+    """Returns a mask that matches the input parameters.
+    If an IdIndex is provided, it is used to build the mask for the 'id' column."""
     parsed_kwargs = _parse(args, kwargs)
-
-    if invalid_kwargs := set(parsed_kwargs.keys()) - set(array.dtype.names or ()):
-        raise ValueError(f"Invalid kwargs: {invalid_kwargs}")
+    _check_kwargs(array, parsed_kwargs)
 
     filter_mask = _initialize_filter_mask(mode_, array.size)
     for field, values in parsed_kwargs.items():
-        field_mask = _build_filter_mask_for_field(array, field, values)
+        if field == "id" and (index_values := _get_index_values(index_, values)) is not None:
+            field_mask = np.full(array.size, False)
+            field_mask[index_.lookup(array["id"], index_values)] = True  # type: ignore[union-attr]
+        else:
+            field_mask = _build_filter_mask_for_field(array, field, values)
         if mode_ == "AND":
             filter_mask &= field_mask
         elif mode_ == "OR":
@@ -39,36 +44,36 @@ def apply_filter(
     *args: int | Iterable[int] | np.ndarray,
     array: np.ndarray,
     mode_: Literal["AND", "OR"],
+    index_: IdIndex | None = None,
     **kwargs: Any | list[Any] | np.ndarray,
 ) -> np.ndarray:
     """Return an array with the records that match the input parameters.
+    If an IdIndex is provided and the records are (also) filtered on 'id', the index is used to avoid a full scan.
     Note: output could be an empty array."""
-    filter_mask = get_filter_mask(*args, array=array, mode_=mode_, **kwargs)
+    parsed_kwargs = _parse(args, kwargs)
+    if "id" in parsed_kwargs and (mode_ == "AND" or (mode_ == "OR" and len(parsed_kwargs) == 1)):
+        _check_kwargs(array, parsed_kwargs)
+        if (index_values := _get_index_values(index_, parsed_kwargs["id"])) is not None:
+            filtered_array = array[index_.lookup(array["id"], index_values)]  # type: ignore[union-attr]
+            if other_kwargs := {field: values for field, values in parsed_kwargs.items() if field != "id"}:
+                return filtered_array[get_filter_mask(array=filtered_array, mode_=mode_, **other_kwargs)]
+            return filtered_array
+
+    filter_mask = get_filter_mask(array=array, mode_=mode_, index_=index_, **parsed_kwargs)
     return array[filter_mask]
 
 
-def apply_exclude(
-    *args: int | Iterable[int] | np.ndarray,
-    array: np.ndarray,
-    mode_: Literal["AND", "OR"],
-    **kwargs: Any | list[Any] | np.ndarray,
-) -> np.ndarray:
-    """Return an array without records that match the input parameters.
-    Note: output could be an empty array."""
-    filter_mask = get_filter_mask(*args, array=array, mode_=mode_, **kwargs)
-    return array[~filter_mask]
-
-
 def apply_get(
     *args: int | Iterable[int] | np.ndarray,
     array: np.ndarray,
     mode_: Literal["AND", "OR"],
+    index_: IdIndex | None = None,
     **kwargs: Any | list[Any] | np.ndarray,
 ) -> np.ndarray:
     """Returns a record that matches the input parameters.
     If no or multiple records match the input parameters, an error is raised.
     """
-    filtered_array = apply_filter(*args, array=array, mode_=mode_, **kwargs)
+    filtered_array = apply_filter(*args, array=array, mode_=mode_, index_=index_, **kwargs)
     if filtered_array.size == 1:
         return filtered_array
 
@@ -79,6 +84,25 @@ def apply_get(
     raise MultipleRecordsReturned(f"Found more than one record! {args_str}{kwargs_str}")
 
 
+def _get_index_values(index_: IdIndex | None, values) -> np.ndarray | None:
+    """Returns the values as integer array if they can be looked up using the index, otherwise None."""
+    if index_ is None:
+        return None
+    if not is_sequence(values):
+        values = [values]
+    if isinstance(values, set):
+        values = list(values)
+    values = np.asarray(values)
+    if values.size and values.dtype.kind not in "iu":
+        return None
+    return values.astype(np.int64, copy=False).ravel()
+
+
+def _check_kwargs(array: np.ndarray, kwargs: dict[str, Any]) -> None:
+    if invalid_kwargs := set(kwargs.keys()) - set(array.dtype.names or ()):
+        raise ValueError(f"Invalid kwargs: {invalid_kwargs}")
+
+
 def _build_filter_mask_for_field(array: np.ndarray, field: str, values) -> np.ndarray:
     if not is_sequence(values):
         # Note: is_sequence() does not consider a string as a sequence.
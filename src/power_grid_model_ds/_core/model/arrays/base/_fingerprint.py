@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Content fingerprints of (structured) arrays.
+
+A fingerprint is a blake2b digest of the names and dtypes of the columns and the raw bytes of each column.
+It does not depend on the process (unlike hash()), so it can be used to key caches that are shared between processes
+or stored on disk.
+"""
+
+import hashlib
+
+import numpy as np
+from numpy.typing import NDArray
+
+DIGEST_SIZE = 16
+
+
+def new_hasher() -> "hashlib.blake2b":
+    """Return a new hasher to combine fingerprints with."""
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def get_fingerprint(data: NDArray, name: str = "") -> str:
+    """Return the fingerprint of a (structured) array.
+
+    NaN values are normalized, so that arrays with equal values (nan == nan) have equal fingerprints.
+
+    Args:
+        data: the array
+        name: an optional name (e.g. the class name) that is included in the fingerprint
+    """
+    hasher = new_hasher()
+    hasher.update(f"{name} {_get_dtype_header(data.dtype)} {data.shape}".encode())
+    if data.dtype.names is None:
+        hasher.update(_get_column_bytes(data))
+    else:
+        for column in data.dtype.names:
+            hasher.update(_get_column_bytes(data[column]))
+    return hasher.hexdigest()
+
+
+def _get_dtype_header(dtype: np.dtype) -> list[tuple[str, str, tuple[int, ...]]]:
+    """Return the names and base dtypes of the columns, without the offsets and padding of the dtype,
+    so that a view on some of the columns and a packed copy of it have the same header."""
+    if dtype.names is None:
+        return [("", dtype.base.str, dtype.shape)]
+    column_dtypes = [dtype.fields[column][0] for column in dtype.names]  # type: ignore[index]
+    return [
+        (column, column_dtype.base.str, column_dtype.shape) for column, column_dtype in zip(dtype.names, column_dtypes)
+    ]
+
+
+def _get_column_bytes(column: NDArray) -> bytes:
+    if column.dtype.kind in "fc":
+        is_nan = np.isnan(column)
+        if is_nan.any():
+            # nan values can have different bit patterns
+            column = np.where(is_nan, np.nan, column)
+    return np.ascontiguousarray(column).tobytes()
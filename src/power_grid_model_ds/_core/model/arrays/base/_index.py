@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Contains the IdIndex class"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class IdIndex:
+    """Sorted index on the id column of an array.
+
+    The index stores the permutation that sorts the id column, so that rows can be looked up by id using
+    binary search (np.searchsorted) instead of scanning the whole column.
+    The index does not hold a reference to the array itself, the id column is passed on each lookup.
+    When the index is invalidated, it is rebuilt lazily on the next lookup.
+    """
+
+    def __init__(self, sorter: NDArray[np.int64] | None = None, sorted_ids: NDArray | None = None):
+        self._sorter = sorter
+        self._sorted_ids = sorted_ids
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index is currently built (i.e. not invalidated)."""
+        return self._sorter is not None
+
+    def invalidate(self) -> None:
+        """Invalidate the index. It will be rebuilt on the next lookup."""
+        self._sorter = None
+        self._sorted_ids = None
+
+    def copy(self) -> "IdIndex":
+        """Return a new index sharing the (read-only) index data."""
+        return IdIndex(sorter=self._sorter, sorted_ids=self._sorted_ids)
+
+    def lookup(self, id_column: NDArray, ids: NDArray) -> NDArray[np.int64]:
+        """Return the (ascending) row positions in id_column of all records matching one of the ids.
+
+        Args:
+            id_column: the id column the index belongs to.
+            ids: the ids to look up. Duplicate ids are ignored.
+
+        Returns:
+            row positions, sorted so that the original order of the array is preserved.
+        """
+        sorter, sorted_ids = self._get_index(id_column)
+        ids = _as_dtype(np.unique(ids), sorted_ids.dtype)
+        left = np.searchsorted(sorted_ids, ids, side="left")
+        right = np.searchsorted(sorted_ids, ids, side="right")
+        counts = right - left
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # expand the [left, right) ranges into positions within sorted_ids
+        offsets = np.cumsum(counts) - counts
+        positions = np.arange(total) - np.repeat(offsets - left, counts)
+        rows = sorter[positions]
+        rows.sort()
+        return rows
+
+    def extend(self, id_column: NDArray, new_ids: NDArray) -> "IdIndex":
+        """Return the index of id_column after new_ids are appended to it.
+
+        If all new ids are larger than or equal to the current ids, the index is patched.
+        Otherwise, an invalidated index is returned.
+        """
+        if not self._is_built_for(id_column):
+            return IdIndex()
+        sorter, sorted_ids = self._get_index(id_column)
+        if not new_ids.size:
+            return self.copy()
+        new_sorter = np.argsort(new_ids, kind="stable")
+        new_sorted_ids = new_ids[new_sorter]
+        if sorted_ids.size and new_sorted_ids[0] < sorted_ids[-1]:
+            return IdIndex()
+        return IdIndex(
+            sorter=np.concatenate([sorter, new_sorter + len(id_column)]),
+            sorted_ids=np.concatenate([sorted_ids, new_sorted_ids]),
+        )
+
+    def subset(self, id_column: NDArray, keep_mask: NDArray[np.bool_]) -> "IdIndex":
+        """Return the index of id_column[keep_mask] without sorting again."""
+        if not self._is_built_for(id_column):
+            return IdIndex()
+        sorter, sorted_ids = self._get_index(id_column)
+        kept_in_sort_order = keep_mask[sorter]
+        new_positions = np.cumsum(keep_mask) - 1
+        return IdIndex(sorter=new_positions[sorter[kept_in_sort_order]], sorted_ids=sorted_ids[kept_in_sort_order])
+
+    def _is_built_for(self, id_column: NDArray) -> bool:
+        return self._sorted_ids is not None and len(self._sorted_ids) == len(id_column)
+
+    def _get_index(self, id_column: NDArray) -> tuple[NDArray[np.int64], NDArray]:
+        if self._sorter is None or self._sorted_ids is None or not self._is_built_for(id_column):
+            self._sorter = np.argsort(id_column, kind="stable")
+            self._sorted_ids = id_column[self._sorter]
+        return self._sorter, self._sorted_ids
+
+
+def _as_dtype(ids: NDArray, dtype: np.dtype) -> NDArray:
+    """Cast ids to dtype, dropping ids that do not fit.
+    This prevents np.searchsorted from casting the (large) sorted id column to the dtype of the ids."""
+    if ids.dtype == dtype or dtype.kind not in "iu":
+        return ids
+    dtype_info = np.iinfo(dtype)
+    return ids[(ids >= dtype_info.min) & (ids <= dtype_info.max)].astype(dtype)
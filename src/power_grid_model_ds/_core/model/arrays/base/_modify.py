@@ -7,6 +7,8 @@
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
+from power_grid_model_ds._core.model.arrays.base._index import IdIndex
+
 
 def re_order(array: np.ndarray, new_order: ArrayLike, column: str = "id") -> np.ndarray:
     """Re-order an id-array by the id column so that it follows a new_order.
@@ -25,26 +27,36 @@ def re_order(array: np.ndarray, new_order: ArrayLike, column: str = "id") -> np.
     return array[new_order_indices]
 
 
-def update_by_id(array: np.ndarray, ids: ArrayLike, allow_missing: bool, **kwargs) -> NDArray[np.bool_]:
+def update_by_id(
+    array: np.ndarray, ids: ArrayLike, allow_missing: bool, index_: IdIndex | None = None, **kwargs
+) -> NDArray[np.bool_]:
     """Update values in an array by id
 
     Args:
         array: the array to update
         ids: the ids to update
         allow_missing: whether to allow ids that do not exist in the array
+        index_: optional IdIndex of the array, used to find the ids without scanning the id column
         **kwargs: the columns to update and their new values
     Returns:
         mask: the mask on the original array for the provided ids
     """
-    mask = np.isin(array["id"], ids)
-    if not allow_missing:
+    ids = np.asarray(ids)
+    if index_ is not None and ids.dtype.kind in "iu":
+        rows = index_.lookup(array["id"], ids)
+        mask = np.full(array.size, False)
+        mask[rows] = True
+        nr_hits = rows.size
+    else:
+        mask = rows = np.isin(array["id"], ids)
         nr_hits = np.sum(mask)
+    if not allow_missing:
         nr_ids = np.unique(ids).size  # ignore edge cases with duplicate ids
         if nr_hits != nr_ids:
             raise ValueError("One or more ids do not exist. Provide allow_missing=True if this is intended.")
 
     for name, values in kwargs.items():
-        array[name][mask] = values
+        array[name][rows] = values
     return mask
 
 
@@ -12,7 +12,9 @@ import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
 from power_grid_model_ds._core.model.arrays.base._build import build_array
-from power_grid_model_ds._core.model.arrays.base._filters import apply_exclude, apply_filter, apply_get, get_filter_mask
+from power_grid_model_ds._core.model.arrays.base._filters import apply_filter, apply_get, get_filter_mask
+from power_grid_model_ds._core.model.arrays.base._fingerprint import get_fingerprint
+from power_grid_model_ds._core.model.arrays.base._index import IdIndex
 from power_grid_model_ds._core.model.arrays.base._modify import check_ids, re_order, update_by_id
 from power_grid_model_ds._core.model.arrays.base._optional import pandas
 from power_grid_model_ds._core.model.arrays.base._string import convert_array_to_string
@@ -24,6 +26,8 @@ from power_grid_model_ds._core.utils.misc import get_inherited_attrs
 
 _RESERVED_COLUMN_NAMES: set = set(dir(np.array([]))).union({"data"})
 _DEFAULT_STR_LENGTH: int = 50
+_CAPACITY_GROWTH_FACTOR: float = 1.5
+_MIN_CAPACITY: int = 16
 
 Column = NDArray
 
@@ -53,11 +57,38 @@ class FancyArray(ABC):
 
     Extra note on string-columns:
         Where possible, it is recommended use IntEnum's instead of string-columns to reduce memory usage.
+
+    Note on the id index:
+        For large arrays that are queried by id many times, a sorted index on the id column can be enabled.
+        get/filter/exclude/update_by_id will then use binary search instead of scanning the id column.
+
+    Example:
+        >>> array.enable_id_index()
+        >>> array.get(id=42)  # O(log n) instead of O(n)
+
+        The index is kept up to date when ids are changed through the FancyArray (e.g. array.id = ...) and is
+        carried over by fp.concatenate, exclude and copy. Changes to the id column through views on .data
+        (e.g. array.data["id"][0] = 1) are not tracked, call invalidate_id_index() after such changes.
+
+    Note on capacity-backed storage:
+        When records are appended one (or a few) at a time, an array can be made capacity-backed.
+        The records are then stored in an over-allocated buffer that grows geometrically, so that append() is
+        amortized O(1) instead of copying the whole array on every call. The data property always returns a
+        view with the correct length. FancyArrayContainer.append() appends in-place to capacity-backed arrays.
+
+    Example:
+        >>> array.reserve(1_000_000)
+        >>> for record in records:
+        >>>     array.append(record)
+        >>> array.shrink_to_fit()
     """
 
     _data: NDArray = np.ndarray([])
     _defaults: dict[str, Any] = {}
     _str_lengths: dict[str, int] = {}
+    _id_index: IdIndex | None = None
+    _buffer: NDArray | None = None
+    _version: int = 0
 
     def __init__(self: Self, *args, data: NDArray | None = None, **kwargs):
         if data is None:
@@ -69,6 +100,86 @@ class FancyArray(ABC):
     def data(self: Self) -> NDArray:
         return self._data
 
+    @property
+    def id_index(self: Self) -> IdIndex | None:
+        """The sorted index on the id column, or None if the index is not enabled."""
+        return self._id_index
+
+    def enable_id_index(self: Self) -> None:
+        """Enable a sorted index on the id column. The index is built on the first lookup."""
+        if "id" not in self.get_dtype().names:
+            raise AttributeError(f"Cannot enable id index: {self.__class__.__name__} has no 'id' column.")
+        if self._id_index is None:
+            self._id_index = IdIndex()
+
+    def disable_id_index(self: Self) -> None:
+        """Disable (and drop) the sorted index on the id column."""
+        self._id_index = None
+
+    def invalidate_id_index(self: Self) -> None:
+        """Invalidate the id index (if enabled), so that it will be rebuilt on the next lookup."""
+        if self._id_index is not None:
+            self._id_index.invalidate()
+
+    def fingerprint(self: Self) -> str:
+        """Return a digest of the class and the contents of the array, that is stable across processes.
+        Arrays of the same class with equal contents (nan == nan) have the same fingerprint.
+
+        The contents are hashed on every call, so that changes through views on the data
+        (e.g. array.from_status[0] = 0) are included.
+        """
+        return get_fingerprint(self._data, name=self.__class__.__name__)
+
+    @property
+    def is_capacity_backed(self: Self) -> bool:
+        """Whether the records are stored in an over-allocated buffer (see reserve)."""
+        return self._buffer is not None and self._data.base is self._buffer
+
+    @property
+    def capacity(self: Self) -> int:
+        """The number of records the array can hold before its storage has to be reallocated."""
+        if self.is_capacity_backed:
+            return len(self._buffer)  # type: ignore[arg-type]
+        return len(self._data)
+
+    def reserve(self: Self, capacity: int = 0) -> None:
+        """Make the array capacity-backed, with room for at least 'capacity' records."""
+        if self.is_capacity_backed and self.capacity >= capacity:
+            return
+        self._set_buffer(max(capacity, len(self._data)))
+
+    def shrink_to_fit(self: Self) -> None:
+        """Release the unused capacity. The array remains capacity-backed."""
+        if self.is_capacity_backed and self.capacity > len(self._data):
+            self._set_buffer(len(self._data))
+
+    def append(self: Self, *arrays: "FancyArray | NDArray") -> None:
+        """Append the records of the given arrays in-place.
+
+        The array is made capacity-backed (if it is not already), so that repeated appends are amortized O(1).
+        Use fp.concatenate to create a new array instead.
+        """
+        np_arrays = [array.data if isinstance(array, FancyArray) else array for array in arrays]
+        if any(np_array.dtype != self._data.dtype for np_array in np_arrays):
+            raise TypeError("Cannot append arrays: mismatching dtypes.")
+        new_data = np.concatenate(np_arrays) if len(np_arrays) != 1 else np_arrays[0]
+        if not new_data.size:
+            return
+
+        size = len(self._data)
+        new_size = size + new_data.size
+        if new_size > self.capacity or not self.is_capacity_backed:
+            # copy new_data first, it could be a view on the current buffer
+            new_data = new_data.copy()
+            self._set_buffer(max(new_size, int(self.capacity * _CAPACITY_GROWTH_FACTOR), _MIN_CAPACITY))
+
+        buffer: NDArray = self._buffer  # type: ignore[assignment]
+        buffer[size:new_size] = new_data
+        old_id_column = self._data["id"] if self._id_index is not None else None
+        self._data = buffer[:new_size]
+        if self._id_index is not None:
+            self._id_index = self._id_index.extend(old_id_column, new_data["id"])  # type: ignore[arg-type]
+
     @classmethod
     @lru_cache
     def get_defaults(cls) -> dict[str, Any]:
@@ -144,13 +255,16 @@ class FancyArray(ABC):
         return getattr(self._data, attr)
 
     def __setattr__(self: Self, attr: str, value: object) -> None:
-        if attr in ["_data", "_defaults"]:
+        if attr in ["_data", "_defaults", "_id_index", "_buffer", "_version"]:
             super().__setattr__(attr, value)
+            if attr == "_data":
+                self._version += 1
             return
         try:
             self._data[attr] = value  # type: ignore[call-overload]
         except (AttributeError, ValueError) as error:
             raise AttributeError(f"Cannot set attribute {attr} on {self.__class__.__name__}") from error
+        self._register_change(ids_changed=attr == "id")
 
     def __getitem__(self: Self, item):
         """Used by for-loops, slicing [0:3], column-access ['id'], row-access [0], multi-column access.
@@ -170,6 +284,7 @@ class FancyArray(ABC):
     def __setitem__(self: Self, key, value):
         if isinstance(value, FancyArray):
             value = value.data
+        self._register_change(ids_changed=_may_change_ids(key))
         return self._data.__setitem__(key, value)
 
     def __contains__(self: Self, item: Self) -> bool:
@@ -178,13 +293,22 @@ class FancyArray(ABC):
         return False
 
     def __hash__(self: Self):
-        return hash(f"{self.__class__} {self}")
+        return hash(self.fingerprint())
 
     def __eq__(self: Self, other):
         return self._data.__eq__(other.data)
 
+    def __getstate__(self: Self) -> dict[str, Any]:
+        # the unused capacity of the buffer is not stored
+        state = self.__dict__.copy()
+        state.pop("_buffer", None)
+        return state
+
     def __copy__(self: Self):
-        return self.__class__(data=copy(self._data))
+        copied = self.__class__(data=copy(self._data))
+        if self._id_index is not None:
+            copied._id_index = self._id_index.copy()
+        return copied
 
     def copy(self: Self):
         """Return a copy of this array including its data"""
@@ -239,6 +363,7 @@ class FancyArray(ABC):
         """Set a column to its 'empty' value."""
         array_dtype = self.get_dtype()
         self._data[column] = empty(array_dtype[column])  # type: ignore[call-overload]
+        self._register_change(ids_changed=column == "id")
 
     @property
     def columns(self) -> list[str]:
@@ -262,7 +387,8 @@ class FancyArray(ABC):
         mode_: Literal["AND", "OR"] = "AND",
         **kwargs: Any | list[Any] | np.ndarray,
     ) -> Self:
-        return self.__class__(data=apply_filter(*args, array=self._data, mode_=mode_, **kwargs))
+        filtered = apply_filter(*args, array=self._data, mode_=mode_, index_=self._id_index, **kwargs)
+        return self.__class__(data=filtered)
 
     def exclude(
         self: Self,
@@ -270,7 +396,11 @@ class FancyArray(ABC):
         mode_: Literal["AND", "OR"] = "AND",
         **kwargs: Any | list[Any] | np.ndarray,
     ) -> Self:
-        return self.__class__(data=apply_exclude(*args, array=self._data, mode_=mode_, **kwargs))
+        keep_mask = self.exclude_mask(*args, mode_=mode_, **kwargs)
+        excluded = self.__class__(data=self._data[keep_mask])
+        if self._id_index is not None:
+            excluded._id_index = self._id_index.subset(self._data["id"], keep_mask)  # pylint: disable=protected-access
+        return excluded
 
     def get(
         self: Self,
@@ -278,7 +408,7 @@ class FancyArray(ABC):
         mode_: Literal["AND", "OR"] = "AND",
         **kwargs: Any | list[Any] | np.ndarray,
     ) -> Self:
-        return self.__class__(data=apply_get(*args, array=self._data, mode_=mode_, **kwargs))
+        return self.__class__(data=apply_get(*args, array=self._data, mode_=mode_, index_=self._id_index, **kwargs))
 
     def filter_mask(
         self: Self,
@@ -286,7 +416,7 @@ class FancyArray(ABC):
         mode_: Literal["AND", "OR"] = "AND",
         **kwargs: Any | list[Any] | np.ndarray,
     ) -> np.ndarray:
-        return get_filter_mask(*args, array=self._data, mode_=mode_, **kwargs)
+        return get_filter_mask(*args, array=self._data, mode_=mode_, index_=self._id_index, **kwargs)
 
     def exclude_mask(
         self: Self,
@@ -294,20 +424,36 @@ class FancyArray(ABC):
         mode_: Literal["AND", "OR"] = "AND",
         **kwargs: Any | list[Any] | np.ndarray,
     ) -> np.ndarray:
-        return ~get_filter_mask(*args, array=self._data, mode_=mode_, **kwargs)
+        return ~get_filter_mask(*args, array=self._data, mode_=mode_, index_=self._id_index, **kwargs)
+
+    def _register_change(self: Self, ids_changed: bool) -> None:
+        """Register a change of the data made through the FancyArray API.
+        The version is used by e.g. Grid to detect that derived data (such as Grid.branches) is outdated."""
+        self._version += 1
+        if ids_changed:
+            self.invalidate_id_index()
+
+    def _set_buffer(self: Self, capacity: int) -> None:
+        size = len(self._data)
+        buffer = np.empty(capacity, dtype=self._data.dtype)
+        buffer[:size] = self._data
+        self._buffer = buffer
+        self._data = buffer[:size]
 
     def re_order(self: Self, new_order: ArrayLike, column: str = "id") -> Self:
         return self.__class__(data=re_order(self._data, new_order, column=column))
 
     def update_by_id(self: Self, ids: ArrayLike, allow_missing: bool = False, **kwargs) -> None:
         try:
-            _ = update_by_id(self._data, ids, allow_missing, **kwargs)
+            _ = update_by_id(self._data, ids, allow_missing, index_=self._id_index, **kwargs)
         except ValueError as error:
             raise ValueError(f"Cannot update {self.__class__.__name__}. {error}") from error
+        self._register_change(ids_changed="id" in kwargs)
 
     def get_updated_by_id(self: Self, ids: ArrayLike, allow_missing: bool = False, **kwargs) -> Self:
         try:
-            mask = update_by_id(self._data, ids, allow_missing, **kwargs)
+            mask = update_by_id(self._data, ids, allow_missing, index_=self._id_index, **kwargs)
+            self._register_change(ids_changed="id" in kwargs)
             return self.__class__(data=self._data[mask])
         except ValueError as error:
             raise ValueError(f"Cannot update {self.__class__.__name__}. {error}") from error
@@ -331,3 +477,12 @@ class FancyArray(ABC):
             raise TypeError(f"Extended array must be of type {cls.__name__}, got {type(extended).__name__}")
         dtype = cls.get_dtype()
         return cls(data=np.array(extended[list(dtype.names)], dtype=dtype))
+
+
+def _may_change_ids(key) -> bool:
+    """Whether setting array[key] could change the values in the id column."""
+    if isinstance(key, str):
+        return key == "id"
+    if isinstance(key, (list, tuple)) and key and all(isinstance(column, str) for column in key):
+        return "id" in key
+    return True
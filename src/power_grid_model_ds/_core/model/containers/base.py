@@ -13,6 +13,7 @@ from typing import Type, TypeVar
 import numpy as np
 
 from power_grid_model_ds._core import fancypy as fp
+from power_grid_model_ds._core.model.arrays.base._fingerprint import new_hasher
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
 from power_grid_model_ds._core.model.constants import EMPTY_ID
@@ -48,6 +49,16 @@ class FancyArrayContainer:
             if isinstance(attribute, FancyArray):
                 yield attribute
 
+    def fingerprint(self) -> str:
+        """Returns a digest of the contents of all arrays in the container, that is stable across processes."""
+        hasher = new_hasher()
+        hasher.update(self.__class__.__name__.encode())
+        for field in dataclasses.fields(self):
+            attribute = getattr(self, field.name)
+            if isinstance(attribute, FancyArray):
+                hasher.update(f"{field.name} {attribute.fingerprint()}".encode())
+        return hasher.hexdigest()
+
     @classmethod
     def find_array_field(cls, array_type: Type[FancyArray]) -> dataclasses.Field:
         """Find the Field that holds an array of type array_type.
@@ -111,6 +122,9 @@ class FancyArrayContainer:
     def append(self, array: FancyArray, check_max_id: bool = True) -> None:
         """Append the given asset_array to the corresponding field of ArrayContainer and generate ids.
 
+        If the array in the container is capacity-backed (see FancyArray.reserve), the records are appended in-place.
+        Otherwise, the array in the container is replaced by a new (concatenated) array.
+
         Args:
             array(FancyArray): the asset_array to be appended (e.g. a NodeArray instance).
             check_max_id(bool): whether to check max(array.id) with the id counter
@@ -188,6 +202,9 @@ class FancyArrayContainer:
 
         # Add the given asset_array to the corresponding array in the Grid.
         array_attr = getattr(self, array_field.name)
+        if array_attr.is_capacity_backed:
+            array_attr.append(array)
+            return
         appended = fp.concatenate(array_attr, array)
         setattr(self, array_field.name, appended)
 
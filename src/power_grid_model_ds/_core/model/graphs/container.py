@@ -113,11 +113,11 @@ class GraphContainer:
                 graph.delete_branch(from_ext_node_id=from_node, to_ext_node_id=to_node)
 
     @classmethod
-    def from_arrays(cls, arrays: "Grid") -> "GraphContainer":
+    def from_arrays(cls, arrays: "Grid", graph_model: type[BaseGraphModel] = RustworkxGraphModel) -> "GraphContainer":
         """Build from arrays"""
         cls._validate_branches(arrays=arrays)
 
-        new_container = cls.empty()
+        new_container = cls.empty(graph_model=graph_model)
         for graph_field in new_container.graph_attributes:
             graph = getattr(new_container, graph_field.name)
             new_graph = graph.from_arrays(arrays, active_only=graph.active_only)
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Contains the NodeIdMap class"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from power_grid_model_ds._core.model.graphs.errors import MissingNodeError
+
+_GROWTH_FACTOR: float = 1.5
+_MIN_CAPACITY: int = 16
+# the lookup is a dense table when the range of the external ids is at most this factor times the number of ids
+_MAX_DENSE_RATIO: int = 4
+# additions are kept in a dict until they outnumber the nodes in the lookup (with this minimum)
+_MIN_PENDING: int = 1024
+
+
+class NodeIdMap:
+    """Bidirectional mapping between external node ids and internal (graph) node ids, backed by numpy arrays.
+
+    internal -> external is stored in an array indexed by the internal id.
+    external -> internal is stored in a lookup that is either
+        - a dense table indexed by (external id - smallest external id), when the external ids are compact
+        - the sorted external ids with their internal ids (searchsorted), otherwise
+
+    Every lookup result is verified against the internal -> external array, so removals only have to update that
+    array. Additions are kept in a dict and merged into the lookup once there are many of them or when a
+    vectorized lookup is requested.
+    """
+
+    def __init__(self) -> None:
+        self._externals: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._in_use: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
+        self._nr_ids: int = 0
+
+        self._pending: dict[int, int] = {}
+        self._offset: int = 0
+        self._table: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+        self._sorted_externals: NDArray[np.int64] | None = None
+
+    def __len__(self) -> int:
+        return self._nr_ids
+
+    @property
+    def external_ids(self) -> NDArray[np.int64]:
+        """All external ids, ordered by internal id."""
+        return self._externals[self._in_use]
+
+    def add(self, external_ids: ArrayLike, internal_ids: ArrayLike) -> None:
+        """Add the mapping between the external ids and the internal ids."""
+        external_ids = np.asarray(external_ids, dtype=np.int64).ravel()
+        internal_ids = np.asarray(internal_ids, dtype=np.int64).ravel()
+        if not internal_ids.size:
+            return
+        self._reserve(int(internal_ids.max()) + 1)
+        self._nr_ids += int(np.count_nonzero(~self._in_use[internal_ids]))
+        self._externals[internal_ids] = external_ids
+        self._in_use[internal_ids] = True
+
+        if len(self._pending) + internal_ids.size > max(_MIN_PENDING, self._nr_ids // 2):
+            self._build_lookup()
+        else:
+            self._pending.update(zip(external_ids.tolist(), internal_ids.tolist()))
+
+    def remove(self, internal_ids: ArrayLike) -> None:
+        """Remove the mapping of the internal ids."""
+        internal_ids = np.asarray(internal_ids, dtype=np.int64).ravel()
+        internal_ids = internal_ids[internal_ids < len(self._in_use)]
+        self._nr_ids -= int(np.count_nonzero(self._in_use[internal_ids]))
+        self._in_use[internal_ids] = False
+
+    def get_internal(self, external_id: int) -> int:
+        """Return the internal id of a single external id.
+
+        Raises:
+            MissingNodeError: if the external id does not exist
+        """
+        internal_id = self._pending.get(external_id)
+        if internal_id is not None and self._is_current(internal_id, external_id):
+            return internal_id
+        internal_id = self._lookup_single(external_id)
+        if internal_id is not None and self._is_current(internal_id, external_id):
+            return internal_id
+        raise MissingNodeError(f"External node id '{external_id}' does NOT exist!")
+
+    def get_external(self, internal_id: int) -> int:
+        """Return the external id of a single internal id."""
+        if not self._is_current(internal_id):
+            raise KeyError(internal_id)
+        return int(self._externals[internal_id])
+
+    def contains(self, external_ids: ArrayLike) -> NDArray[np.bool_]:
+        """Return for each external id whether it exists."""
+        return self._lookup(np.asarray(external_ids, dtype=np.int64)) >= 0
+
+    def to_internal(self, external_ids: ArrayLike) -> NDArray[np.int64]:
+        """Convert an array of external ids to internal ids.
+
+        Raises:
+            MissingNodeError: if one of the external ids does not exist
+        """
+        external_ids = np.asarray(external_ids, dtype=np.int64)
+        internal_ids = self._lookup(external_ids)
+        if internal_ids.size and internal_ids.min() < 0:
+            missing_id = external_ids[internal_ids < 0].flat[0]
+            raise MissingNodeError(f"External node id '{missing_id}' does NOT exist!")
+        return internal_ids
+
+    def to_external(self, internal_ids: ArrayLike) -> NDArray[np.int64]:
+        """Convert an array of internal ids to external ids."""
+        internal_ids = np.asarray(internal_ids, dtype=np.int64)
+        if internal_ids.size and not self._in_use[internal_ids].all():
+            raise KeyError("Not all internal node ids exist")
+        return self._externals[internal_ids]
+
+    def _is_current(self, internal_id: int, external_id: int | None = None) -> bool:
+        if not 0 <= internal_id < len(self._in_use) or not self._in_use[internal_id]:
+            return False
+        return external_id is None or self._externals[internal_id] == external_id
+
+    def _lookup(self, external_ids: NDArray[np.int64]) -> NDArray[np.int64]:
+        # returns the internal id of each external id, or -1 if it does not exist
+        if self._pending:
+            self._build_lookup()
+
+        if self._sorted_externals is None:
+            positions = external_ids - self._offset
+            in_range = (positions >= 0) & (positions < len(self._table))
+            internal_ids = np.full(external_ids.shape, -1, dtype=np.int64)
+            internal_ids[in_range] = self._table[positions[in_range]]
+        else:
+            if not self._sorted_externals.size:
+                return np.full(external_ids.shape, -1, dtype=np.int64)
+            positions = np.searchsorted(self._sorted_externals, external_ids, side="right") - 1
+            positions = np.maximum(positions, 0)
+            found = self._sorted_externals[positions] == external_ids
+            internal_ids = np.where(found, self._table[positions], -1)
+
+        # verify the result, the lookup can still contain ids that have been removed since it was built
+        is_current = internal_ids >= 0
+        is_current[is_current] = self._in_use[internal_ids[is_current]]
+        is_current[is_current] = self._externals[internal_ids[is_current]] == external_ids[is_current]
+        return np.where(is_current, internal_ids, -1)
+
+    def _lookup_single(self, external_id: int) -> int | None:
+        if self._sorted_externals is None:
+            position = external_id - self._offset
+            if 0 <= position < len(self._table):
+                return int(self._table[position])
+            return None
+        position = int(np.searchsorted(self._sorted_externals, external_id, side="right")) - 1
+        if position >= 0 and self._sorted_externals[position] == external_id:
+            return int(self._table[position])
+        return None
+
+    def _build_lookup(self) -> None:
+        self._pending = {}
+        internal_ids = np.flatnonzero(self._in_use)
+        external_ids = self._externals[internal_ids]
+        if not external_ids.size:
+            self._offset = 0
+            self._table = np.zeros(0, dtype=np.int64)
+            self._sorted_externals = None
+            return
+
+        self._offset = int(external_ids.min())
+        id_range = int(external_ids.max()) - self._offset + 1
+        if id_range <= _MAX_DENSE_RATIO * external_ids.size:
+            self._table = np.full(id_range, -1, dtype=np.int64)
+            self._table[external_ids - self._offset] = internal_ids
+            self._sorted_externals = None
+        else:
+            sorter = np.argsort(external_ids, kind="stable")
+            self._table = internal_ids[sorter]
+            self._sorted_externals = external_ids[sorter]
+
+    def _reserve(self, capacity: int) -> None:
+        if capacity <= len(self._in_use):
+            return
+        new_capacity = max(capacity, int(len(self._in_use) * _GROWTH_FACTOR), _MIN_CAPACITY)
+        externals = np.zeros(new_capacity, dtype=np.int64)
+        externals[: len(self._externals)] = self._externals
+        in_use = np.zeros(new_capacity, dtype=np.bool_)
+        in_use[: len(self._in_use)] = self._in_use
+        self._externals = externals
+        self._in_use = in_use
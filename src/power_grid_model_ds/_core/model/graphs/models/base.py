@@ -2,10 +2,12 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import itertools
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Generator
 
+import numpy as np
 from numpy._typing import NDArray
 
 from power_grid_model_ds._core.model.arrays.pgm_arrays import Branch3Array, BranchArray, NodeArray
@@ -24,8 +26,12 @@ if TYPE_CHECKING:
 class BaseGraphModel(ABC):
     """Base class for graph models"""
 
+    # incremented on every change of the graph, so that derived data (e.g. Grid.feeder_tree) can detect it is outdated
+    _version: int = 0
+
     def __init__(self, active_only=False) -> None:
         self.active_only = active_only
+        self._version = 0
 
     @property
     @abstractmethod
@@ -45,6 +51,10 @@ class BaseGraphModel(ABC):
             for source, target in self._all_branches()
         )
 
+    def get_edges(self) -> NDArray[np.int64]:
+        """Returns all branches in the graph as an array of shape (nr_branches, 2) with the external node ids."""
+        return self._internals_to_externals(self._get_edges().ravel()).reshape(-1, 2)
+
     @abstractmethod
     def external_to_internal(self, ext_node_id: int) -> int:
         """Convert external node id to internal node id (internal)
@@ -90,6 +100,7 @@ class BaseGraphModel(ABC):
             return
 
         self._add_node(ext_node_id)
+        self._version += 1
 
     def delete_node(self, ext_node_id: int, raise_on_fail: bool = True) -> None:
         """Remove a node from the graph.
@@ -109,17 +120,28 @@ class BaseGraphModel(ABC):
             return
 
         self._delete_node(node_id=internal_node_id)
+        self._version += 1
 
     def add_node_array(self, node_array: NodeArray, raise_on_fail: bool = True) -> None:
         """Add all nodes in the node array to the graph."""
-        if raise_on_fail and any(self.has_node(x) for x in node_array["id"]):
+        if raise_on_fail and self._has_nodes(node_array["id"]).any():
             raise GraphError("At least one node id already exists in the Graph.")
         self._add_nodes(node_array["id"].tolist())
+        self._version += 1
 
     def delete_node_array(self, node_array: NodeArray, raise_on_fail: bool = True) -> None:
-        """Delete all nodes in node_array from the graph"""
-        for node in node_array:
-            self.delete_node(node.id.item(), raise_on_fail=raise_on_fail)
+        """Delete all nodes in node_array (and their branches) from the graph
+
+        Raises:
+            MissingNodeError: if one of the nodes does not exist in the graph and ``raise_on_fail=True``
+        """
+        node_ids = np.unique(node_array["id"])
+        if not raise_on_fail:
+            node_ids = node_ids[self._has_nodes(node_ids)]
+        if not node_ids.size:
+            return
+        self._delete_nodes(self._externals_to_internals(node_ids))
+        self._version += 1
 
     def has_branch(self, from_ext_node_id: int, to_ext_node_id: int) -> bool:
         """Check if a branch exists between two nodes."""
@@ -137,6 +159,7 @@ class BaseGraphModel(ABC):
             from_node_id=self.external_to_internal(from_ext_node_id),
             to_node_id=self.external_to_internal(to_ext_node_id),
         )
+        self._version += 1
 
     def delete_branch(self, from_ext_node_id: int, to_ext_node_id: int, raise_on_fail: bool = True) -> None:
         """Remove an existing branch from the graph.
@@ -154,6 +177,7 @@ class BaseGraphModel(ABC):
                 from_node_id=self.external_to_internal(from_ext_node_id),
                 to_node_id=self.external_to_internal(to_ext_node_id),
             )
+            self._version += 1
         except (MissingNodeError, MissingBranchError) as error:
             if raise_on_fail:
                 raise MissingBranchError(
@@ -167,25 +191,45 @@ class BaseGraphModel(ABC):
             if not branch_array.size:
                 return
 
-        from_node_ids = self._externals_to_internals(branch_array["from_node"].tolist())
-        to_node_ids = self._externals_to_internals(branch_array["to_node"].tolist())
+        from_node_ids = self._externals_to_internals(branch_array["from_node"])
+        to_node_ids = self._externals_to_internals(branch_array["to_node"])
         self._add_branches(from_node_ids, to_node_ids)
+        self._version += 1
 
     def add_branch3_array(self, branch3_array: Branch3Array) -> None:
         """Add all branch3s in the branch3 array to the graph."""
-        for branch3 in branch3_array:
-            self.add_branch_array(branch3.as_branches())
+        if branch3_array.size:
+            self.add_branch_array(branch3_array.as_branches())
 
     def delete_branch_array(self, branch_array: BranchArray, raise_on_fail: bool = True) -> None:
-        """Delete all branches in branch_array from the graph."""
-        for branch in branch_array:
-            if self._branch_is_relevant(branch):
-                self.delete_branch(branch.from_node.item(), branch.to_node.item(), raise_on_fail=raise_on_fail)
+        """Delete all branches in branch_array from the graph.
+
+        Raises:
+            MissingBranchError: if one of the branches does not exist in the graph and ``raise_on_fail=True``
+        """
+        if self.active_only:
+            branch_array = branch_array[branch_array.is_active]
+        if not branch_array.size:
+            return
+
+        if not raise_on_fail:
+            for branch in branch_array:
+                self.delete_branch(branch.from_node.item(), branch.to_node.item(), raise_on_fail=False)
+            return
+
+        try:
+            from_node_ids = self._externals_to_internals(branch_array["from_node"])
+            to_node_ids = self._externals_to_internals(branch_array["to_node"])
+            self._delete_branches(from_node_ids, to_node_ids)
+        except (MissingNodeError, MissingBranchError) as error:
+            raise MissingBranchError("At least one of the branches does NOT exist in the Graph.") from error
+        finally:
+            self._version += 1
 
     def delete_branch3_array(self, branch3_array: Branch3Array, raise_on_fail: bool = True) -> None:
         """Delete all branch3s in the branch3 array from the graph."""
-        for branch3 in branch3_array:
-            self.delete_branch_array(branch3.as_branches(), raise_on_fail=raise_on_fail)
+        if branch3_array.size:
+            self.delete_branch_array(branch3_array.as_branches(), raise_on_fail=raise_on_fail)
 
     @contextmanager
     def tmp_remove_nodes(self, nodes: list[int]) -> Generator:
@@ -196,20 +240,22 @@ class BaseGraphModel(ABC):
             >>> assert graph.has_node(1)
         In practice, this is useful when you want to e.g. calculate the shortest path between two nodes without
         considering certain nodes.
-        """
-        edge_list = []
-        for node in nodes:
-            edge_list += list(self.in_branches(node))
-            self.delete_node(node)
-
-        yield
-
-        for node in nodes:
-            self.add_node(int(node))  # convert to int to avoid type issues when input is e.g. a numpy array
-        for source, target in edge_list:
-            self.add_branch(source, target)
 
-    def get_shortest_path(self, ext_start_node_id: int, ext_end_node_id: int) -> tuple[list[int], int]:
+        Note:
+            Depending on the graph model, the nodes are masked instead of deleted (see _tmp_mask_nodes).
+            In that case, the graph itself is not modified, the nodes are only hidden in the current thread
+            and changes made inside the context are kept.
+        """
+        with self._tmp_mask_nodes(self._externals_to_internals(nodes)):
+            self._version += 1
+            try:
+                yield
+            finally:
+                self._version += 1
+
+    def get_shortest_path(
+        self, ext_start_node_id: int, ext_end_node_id: int, nodes_to_ignore: list[int] | None = None
+    ) -> tuple[list[int], int]:
         """Calculate the shortest path between two nodes
 
         Example:
@@ -217,6 +263,12 @@ class BaseGraphModel(ABC):
 
             >>> graph.get_shortest_path(1, 4) == [1, 2, 3, 4], 3
             >>> graph.get_shortest_path(1, 1) == [1], 0
+            >>> graph.get_shortest_path(1, 4, nodes_to_ignore=[3])  # raises NoPathBetweenNodes
+
+        Args:
+            ext_start_node_id: id of the start node
+            ext_end_node_id: id of the end node
+            nodes_to_ignore: list of node ids the path cannot pass through
 
         Returns:
             tuple[list[int], int]: a tuple where the first element is a list of external nodes from start to end.
@@ -229,10 +281,12 @@ class BaseGraphModel(ABC):
             return [ext_start_node_id], 0
 
         try:
-            internal_path, distance = self._get_shortest_path(
-                source=self.external_to_internal(ext_start_node_id), target=self.external_to_internal(ext_end_node_id)
+            internal_path, distance = self._get_shortest_path_ignoring(
+                source=self.external_to_internal(ext_start_node_id),
+                target=self.external_to_internal(ext_end_node_id),
+                nodes_to_ignore=self._externals_to_internals(nodes_to_ignore or []).tolist(),
             )
-            return self._internals_to_externals(internal_path), distance
+            return self._internals_to_externals(internal_path).tolist(), distance
         except NoPathBetweenNodes as e:
             raise NoPathBetweenNodes(f"No path between nodes {ext_start_node_id} and {ext_end_node_id}") from e
 
@@ -248,24 +302,41 @@ class BaseGraphModel(ABC):
             target=self.external_to_internal(ext_end_node_id),
         )
 
-        return [self._internals_to_externals(path) for path in internal_paths]
+        return [self._internals_to_externals(path).tolist() for path in internal_paths]
 
-    def get_components(self) -> list[list[int]]:
+    def get_components(
+        self, as_array: bool = False, nodes_to_ignore: list[int] | None = None
+    ) -> list[list[int]] | list[NDArray[np.int64]]:
         """Returns all separate components when the substation_nodes are removed of the graph as lists
 
         If you want to get the components of the graph without certain nodes,
-        use the `tmp_remove_nodes` context manager.
+        pass them as nodes_to_ignore or use the `tmp_remove_nodes` context manager.
+
+        Args:
+            as_array: whether to return each component as a numpy array instead of a list
+            nodes_to_ignore: list of node ids to leave out of the graph while determining the components
 
         Example:
-        >>> with graph.tmp_remove_nodes(substation_nodes):
-        >>>    components = graph.get_components()
+        >>> components = graph.get_components(nodes_to_ignore=substation_nodes)
         """
-        internal_components = self._get_components()
-        return [self._internals_to_externals(component) for component in internal_components]
+        internal_components = self._get_components_ignoring(
+            nodes_to_ignore=self._externals_to_internals(nodes_to_ignore or []).tolist()
+        )
+
+        # convert all components at once and split the result afterward
+        sizes = np.array([len(component) for component in internal_components], dtype=np.int64)
+        internal_nodes = np.fromiter(
+            itertools.chain.from_iterable(internal_components), dtype=np.int64, count=int(sizes.sum())
+        )
+        external_nodes = self._internals_to_externals(internal_nodes)
+        components = np.split(external_nodes, np.cumsum(sizes)[:-1]) if sizes.size else []
+        if as_array:
+            return components
+        return [component.tolist() for component in components]
 
     def get_connected(
-        self, node_id: int, nodes_to_ignore: list[int] | None = None, inclusive: bool = False
-    ) -> list[int]:
+        self, node_id: int, nodes_to_ignore: list[int] | None = None, inclusive: bool = False, as_array: bool = False
+    ) -> list[int] | NDArray[np.int64]:
         """Find all nodes connected to the node_id
 
         Args:
@@ -274,6 +345,7 @@ class BaseGraphModel(ABC):
             nodes_to_ignore: list of node ids to ignore while traversing the graph.
                               Any nodes connected to `node_id` (solely) through these nodes will
                               not be included in the result
+            as_array: whether to return a numpy array instead of a list
         Returns:
             nodes: list of node ids sorted by distance, connected to the node id
         """
@@ -282,11 +354,12 @@ class BaseGraphModel(ABC):
 
         nodes = self._get_connected(
             node_id=self.external_to_internal(node_id),
-            nodes_to_ignore=self._externals_to_internals(nodes_to_ignore),
+            nodes_to_ignore=self._externals_to_internals(nodes_to_ignore).tolist(),
             inclusive=inclusive,
         )
 
-        return self._internals_to_externals(nodes)
+        external_nodes = self._internals_to_externals(nodes)
+        return external_nodes if as_array else external_nodes.tolist()
 
     def find_first_connected(self, node_id: int, candidate_node_ids: list[int]) -> int:
         """Find the first connected node to the node_id from the candidate_node_ids
@@ -300,12 +373,14 @@ class BaseGraphModel(ABC):
             ValueError: if the node_id is in candidate_node_ids
         """
         internal_node_id = self.external_to_internal(node_id)
-        internal_candidates = self._externals_to_internals(candidate_node_ids)
+        internal_candidates = self._externals_to_internals(candidate_node_ids).tolist()
         if internal_node_id in internal_candidates:
             raise ValueError("node_id cannot be in candidate_node_ids")
         return self.internal_to_external(self._find_first_connected(internal_node_id, internal_candidates))
 
-    def get_downstream_nodes(self, node_id: int, start_node_ids: list[int], inclusive: bool = False) -> list[int]:
+    def get_downstream_nodes(
+        self, node_id: int, start_node_ids: list[int], inclusive: bool = False, as_array: bool = False
+    ) -> list[int] | NDArray[np.int64]:
         """Find all nodes downstream of the node_id with respect to the start_node_ids
 
         Example:
@@ -317,6 +392,7 @@ class BaseGraphModel(ABC):
             node_id: node id to start the search from
             start_node_ids: list of node ids considered 'above' the node_id
             inclusive: whether to include the given node id in the result
+            as_array: whether to return a numpy array instead of a list
         returns:
             list of node ids sorted by distance, downstream of to the node id
         """
@@ -326,7 +402,53 @@ class BaseGraphModel(ABC):
             path  # path is at least 2 elements long or find_first_connected would have raised an error
         )
 
-        return self.get_connected(node_id, [upstream_node], inclusive)
+        return self.get_connected(node_id, [upstream_node], inclusive, as_array=as_array)
+
+    def get_bfs_tree(
+        self, start_node_ids: list[int] | NDArray
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Breadth-first search from multiple start nodes at once.
+        Every node connected to one of the start nodes is visited once, from the nearest start node.
+
+        Example:
+            given this graph: [1] - [2] - [3] - [4], with start nodes [1, 4]
+
+            >>> node_ids, parents, depths = graph.get_bfs_tree([1, 4])
+            >>> node_ids == [1, 4, 2, 3]
+            >>> parents == [-1, -1, 0, 1]
+            >>> depths == [0, 0, 1, 1]
+
+        Returns:
+            tuple of three arrays:
+                node_ids: the visited node ids in breadth-first order, starting with the start nodes
+                parents: for each visited node, the position in node_ids of the node it was reached from
+                    (-1 for the start nodes)
+                depths: for each visited node, the distance in number of edges to the nearest start node
+        """
+        internal_start_nodes = np.unique(self._externals_to_internals(start_node_ids))
+        internal_nodes, parents, depths = self._get_bfs_tree(internal_start_nodes)
+        return self._internals_to_externals(internal_nodes), parents, depths
+
+    def get_bridges(self) -> NDArray[np.int64]:
+        """Returns the branches that are the only connection between two parts of the graph (i.e. removing the branch
+        increases the number of components), as an array of shape (nr_bridges, 2) with the external node ids.
+        Parallel branches are never bridges.
+
+        Example:
+            given this graph: [1] - [2] - [3] = [4] (two parallel branches between 3 and 4)
+
+            >>> graph.get_bridges() == [[1, 2], [2, 3]]  # in any order
+        """
+        bridges = np.sort(self._get_bridges(), axis=1)
+        edges, counts = np.unique(np.sort(self._get_edges(), axis=1), axis=0, return_counts=True)
+        parallel_edges = edges[counts > 1]
+        if parallel_edges.size and bridges.size:
+            nr_nodes = max(bridges.max(), parallel_edges.max()) + 1
+            is_parallel = np.isin(
+                bridges[:, 0] * nr_nodes + bridges[:, 1], parallel_edges[:, 0] * nr_nodes + parallel_edges[:, 1]
+            )
+            bridges = bridges[~is_parallel]
+        return self._internals_to_externals(bridges.ravel()).reshape(-1, 2)
 
     def find_fundamental_cycles(self) -> list[list[int]]:
         """Find all fundamental cycles in the graph.
@@ -334,7 +456,7 @@ class BaseGraphModel(ABC):
             list[list[int]]: list of cycles, each cycle is a list of (external) node ids
         """
         internal_cycles = self._find_fundamental_cycles()
-        return [self._internals_to_externals(nodes) for nodes in internal_cycles]
+        return [self._internals_to_externals(nodes).tolist() for nodes in internal_cycles]
 
     @classmethod
     def from_arrays(cls, arrays: "Grid", active_only=False) -> "BaseGraphModel":
@@ -347,13 +469,151 @@ class BaseGraphModel(ABC):
 
         return new_graph
 
-    def _internals_to_externals(self, internal_nodes: list[int]) -> list[int]:
-        """Convert a list of internal nodes to external nodes"""
-        return [self.internal_to_external(node_id) for node_id in internal_nodes]
+    @classmethod
+    def from_edges(cls, node_ids: list[int] | NDArray, edges: NDArray[np.int64], active_only=False) -> "BaseGraphModel":
+        """Build from node ids and the branches between them (see get_edges)"""
+        new_graph = cls(active_only=active_only)
+        new_graph._add_nodes(np.asarray(node_ids).tolist())
+        if edges.size:
+            new_graph._add_branches(
+                new_graph._externals_to_internals(edges[:, 0]), new_graph._externals_to_internals(edges[:, 1])
+            )
+        return new_graph
+
+    def _internals_to_externals(self, internal_nodes: list[int] | NDArray) -> NDArray[np.int64]:
+        """Convert an array of internal nodes to external nodes.
+        Graph models with a vectorized id mapping should override this method."""
+        return np.array([self.internal_to_external(node_id) for node_id in internal_nodes], dtype=np.int64)
+
+    def _externals_to_internals(self, external_nodes: list[int] | NDArray) -> NDArray[np.int64]:
+        """Convert an array of external nodes to internal nodes.
+        Graph models with a vectorized id mapping should override this method."""
+        return np.array([self.external_to_internal(node_id) for node_id in external_nodes], dtype=np.int64)
+
+    def _has_nodes(self, ext_node_ids: list[int] | NDArray) -> NDArray[np.bool_]:
+        """Check for each external node whether it exists.
+        Graph models with a vectorized id mapping should override this method."""
+        return np.array([self.has_node(node_id) for node_id in ext_node_ids], dtype=np.bool_)
+
+    @contextmanager
+    def _tmp_mask_nodes(self, internal_nodes: NDArray[np.int64]) -> Generator:
+        """Temporarily remove the (internal) nodes and their branches from the graph.
 
-    def _externals_to_internals(self, external_nodes: list[int] | NDArray) -> list[int]:
-        """Convert a list of external nodes to internal nodes"""
-        return [self.external_to_internal(node_id) for node_id in external_nodes]
+        This default implementation deletes the nodes and adds them (and their branches) back afterward.
+        Graph models that can exclude nodes without modifying the graph should override this method.
+        """
+        if not internal_nodes.size:
+            yield
+            return
+
+        external_nodes = self._internals_to_externals(internal_nodes).tolist()
+        edge_list = []
+        for node in external_nodes:
+            edge_list += list(self.in_branches(node))
+            self.delete_node(node)
+        try:
+            yield
+        finally:
+            for node in external_nodes:
+                self.add_node(node)
+            for source, target in edge_list:
+                self.add_branch(source, target)
+
+    def _get_shortest_path_ignoring(
+        self, source: int, target: int, nodes_to_ignore: list[int]
+    ) -> tuple[list[int], int]:
+        """Return the shortest path between two (internal) nodes that does not pass through the nodes to ignore.
+
+        This default implementation masks the nodes to ignore (see _tmp_mask_nodes) and calls _get_shortest_path.
+        Graph models that can skip nodes while searching should override this method.
+        """
+        with self._tmp_mask_nodes(np.unique(np.array(nodes_to_ignore, dtype=np.int64))):
+            return self._get_shortest_path(source, target)
+
+    def _get_components_ignoring(self, nodes_to_ignore: list[int]) -> list[list[int]]:
+        """Return the (internal) components of the graph without the nodes to ignore.
+
+        This default implementation masks the nodes to ignore (see _tmp_mask_nodes) and calls _get_components.
+        Graph models that can skip nodes while searching should override this method.
+        """
+        with self._tmp_mask_nodes(np.unique(np.array(nodes_to_ignore, dtype=np.int64))):
+            return self._get_components()
+
+    def _get_edges(self) -> NDArray[np.int64]:
+        """Return all branches as an array of shape (nr_branches, 2) with the internal node ids.
+        Graph models that can export their edges in bulk should override this method."""
+        return np.array(list(self._all_branches()), dtype=np.int64).reshape(-1, 2)
+
+    def _delete_nodes(self, node_ids: NDArray[np.int64]) -> None:
+        """Delete the (internal) nodes and their branches.
+        Graph models that can delete nodes in bulk should override this method."""
+        for node_id in node_ids.tolist():
+            self._delete_node(node_id)
+
+    def _delete_branches(self, from_node_ids: NDArray[np.int64], to_node_ids: NDArray[np.int64]) -> None:
+        """Delete a branch between each pair of (internal) nodes.
+        Graph models that can delete branches in bulk should override this method.
+
+        Raises:
+            MissingBranchError: if one of the branches does not exist
+        """
+        for from_node_id, to_node_id in zip(from_node_ids.tolist(), to_node_ids.tolist()):
+            self._delete_branch(from_node_id, to_node_id)
+
+    def _get_bfs_tree(
+        self, start_node_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Breadth-first search from multiple (internal) start nodes. See get_bfs_tree.
+        Graph models that provide a native multi-source breadth-first search should override this method."""
+        nodes: list[int] = start_node_ids.tolist()
+        parents = [-1] * len(nodes)
+        depths = [0] * len(nodes)
+        positions = {node: position for position, node in enumerate(nodes)}
+        for position, node in enumerate(nodes):  # nodes is extended while iterating
+            for source, target in self._in_branches(node):
+                neighbour = target if source == node else source
+                if neighbour not in positions:
+                    positions[neighbour] = len(nodes)
+                    nodes.append(neighbour)
+                    parents.append(position)
+                    depths.append(depths[position] + 1)
+        return np.array(nodes, dtype=np.int64), np.array(parents, dtype=np.int64), np.array(depths, dtype=np.int64)
+
+    def _get_bridges(self) -> NDArray[np.int64]:
+        """Return the bridges as an array of shape (nr_bridges, 2) with the internal node ids. See get_bridges.
+        Parallel branches may be returned as bridges, they are filtered by get_bridges.
+        Graph models that provide a native bridge search should override this method."""
+        # iterative depth-first search (Tarjan): a branch to a child is a bridge if no node in the subtree of the
+        # child has a branch to the parent or to an ancestor of the parent.
+        order: dict[int, int] = {}
+        low: dict[int, int] = {}
+        bridges: list[tuple[int, int]] = []
+        for root in self._externals_to_internals(self.external_ids).tolist():
+            if root in order:
+                continue
+            order[root] = low[root] = len(order)
+            stack = [(root, -1, self._neighbours(root))]
+            while stack:
+                node, parent, neighbours = stack[-1]
+                for neighbour in neighbours:
+                    if neighbour == parent:
+                        continue
+                    if neighbour in order:
+                        low[node] = min(low[node], order[neighbour])
+                        continue
+                    order[neighbour] = low[neighbour] = len(order)
+                    stack.append((neighbour, node, self._neighbours(neighbour)))
+                    break
+                else:
+                    stack.pop()
+                    if parent >= 0:
+                        low[parent] = min(low[parent], low[node])
+                        if low[node] > order[parent]:
+                            bridges.append((parent, node))
+        return np.array(bridges, dtype=np.int64).reshape(-1, 2)
+
+    def _neighbours(self, int_node_id: int) -> Generator[int, None, None]:
+        return (target if source == int_node_id else source for source, target in self._in_branches(int_node_id))
 
     def _branch_is_relevant(self, branch: BranchArray) -> bool:
         """Check if a branch is relevant"""
@@ -389,7 +649,7 @@ class BaseGraphModel(ABC):
     def _add_branch(self, from_node_id: int, to_node_id: int) -> None: ...
 
     @abstractmethod
-    def _add_branches(self, from_node_ids: list[int], to_node_ids: list[int]) -> None: ...
+    def _add_branches(self, from_node_ids: NDArray[np.int64], to_node_ids: NDArray[np.int64]) -> None: ...
 
     @abstractmethod
     def _delete_branch(self, from_node_id, to_node_id) -> None:
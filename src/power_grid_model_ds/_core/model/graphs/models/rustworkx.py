@@ -2,68 +2,150 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import itertools
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Generator
 
+import numpy as np
 import rustworkx as rx
+from numpy.typing import NDArray
 from rustworkx import NoEdgeBetweenNodes
 from rustworkx.visit import BFSVisitor, PruneSearch, StopSearch
 
 from power_grid_model_ds._core.model.graphs.errors import MissingBranchError, MissingNodeError, NoPathBetweenNodes
+from power_grid_model_ds._core.model.graphs.models._id_map import NodeIdMap
 from power_grid_model_ds._core.model.graphs.models._rustworkx_search import find_fundamental_cycles_rustworkx
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 
 _logger = logging.getLogger(__name__)
 
 
+# The nodes masked by RustworkxGraphModel._tmp_mask_nodes, by id of the graph model.
+# A context variable is used, so that the mask is only visible in the thread (or task) that masks the nodes.
+_MASKED_NODES: ContextVar[dict[int, NDArray[np.int64]]] = ContextVar("masked_nodes", default={})
+
+
 class RustworkxGraphModel(BaseGraphModel):
     """A wrapper around the graph from the 'rustworkx' package"""
 
     def __init__(self, active_only=False) -> None:
         super().__init__(active_only=active_only)
         self._graph: rx.PyGraph = rx.PyGraph()
-        self._internal_to_external: dict[int, int] = {}
-        self._external_to_internal: dict[int, int] = {}
+        self._id_map = NodeIdMap()
 
     @property
     def nr_nodes(self):
-        return self._graph.num_nodes()
+        masked_nodes = self._get_masked_nodes()
+        return self._graph.num_nodes() - (0 if masked_nodes is None else masked_nodes.size)
 
     @property
     def nr_branches(self):
-        return self._graph.num_edges()
+        if self._get_masked_nodes() is None:
+            return self._graph.num_edges()
+        return len(self._get_edges())
 
     @property
     def external_ids(self) -> list[int]:
-        return list(self._external_to_internal.keys())
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is None:
+            return self._id_map.external_ids.tolist()
+        internal_ids = np.asarray(self._graph.node_indices(), dtype=np.int64)
+        return self._id_map.to_external(internal_ids[~np.isin(internal_ids, masked_nodes)]).tolist()
 
-    # pylint: disable=duplicate-code
     def external_to_internal(self, ext_node_id: int):
-        try:
-            return self._external_to_internal[ext_node_id]
-        except KeyError as error:
-            raise MissingNodeError(f"External node id '{ext_node_id}' does NOT exist!") from error
+        internal_id = self._id_map.get_internal(ext_node_id)
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is not None and internal_id in masked_nodes:
+            raise MissingNodeError(f"External node id '{ext_node_id}' does NOT exist!")
+        return internal_id
 
     def internal_to_external(self, int_node_id: int):
-        return self._internal_to_external[int_node_id]
+        return self._id_map.get_external(int_node_id)
+
+    def _externals_to_internals(self, external_nodes: list[int] | NDArray) -> NDArray[np.int64]:
+        internal_ids = self._id_map.to_internal(external_nodes)
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is not None and np.isin(internal_ids, masked_nodes).any():
+            raise MissingNodeError("At least one of the external node ids does NOT exist!")
+        return internal_ids
+
+    def _internals_to_externals(self, internal_nodes: list[int] | NDArray) -> NDArray[np.int64]:
+        return self._id_map.to_external(internal_nodes)
+
+    def _has_nodes(self, ext_node_ids: list[int] | NDArray) -> NDArray[np.bool_]:
+        has_nodes = self._id_map.contains(ext_node_ids)
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is not None:
+            has_nodes[has_nodes] = ~np.isin(self._id_map.to_internal(np.asarray(ext_node_ids)[has_nodes]), masked_nodes)
+        return has_nodes
+
+    @contextmanager
+    def _tmp_mask_nodes(self, internal_nodes: NDArray[np.int64]) -> Generator:
+        """Temporarily hide the (internal) nodes and their branches.
+
+        The graph itself is not modified: the mask is only visible in the current thread (or task) and the searches
+        skip the masked nodes. The internal ids (and the id mapping) remain valid and changes made to the graph while
+        the nodes are masked are kept.
+        """
+        if not internal_nodes.size:
+            yield
+            return
+
+        masks = _MASKED_NODES.get()
+        masked_nodes = masks.get(id(self))
+        internal_nodes = np.unique(internal_nodes) if masked_nodes is None else np.union1d(masked_nodes, internal_nodes)
+        token = _MASKED_NODES.set({**masks, id(self): internal_nodes})
+        try:
+            yield
+        finally:
+            _MASKED_NODES.reset(token)
+
+    def _get_masked_nodes(self) -> NDArray[np.int64] | None:
+        """Return the internal ids of the nodes masked in the current thread (None if no nodes are masked)"""
+        return _MASKED_NODES.get().get(id(self))
+
+    def _get_graph(self, nodes_to_ignore: list[int] | None = None) -> rx.PyGraph:
+        """Return the graph without the masked nodes and the nodes to ignore.
+
+        Only used by the searches that cannot skip nodes. If nodes have to be left out, a copy of the graph is made
+        for this search only.
+        """
+        ignored_nodes = self._get_ignored_nodes(nodes_to_ignore or [])
+        if not ignored_nodes:
+            return self._graph
+        graph = self._graph.copy()
+        graph.remove_nodes_from(list(ignored_nodes))
+        return graph
+
+    def _get_ignored_nodes(self, nodes_to_ignore: list[int]) -> set[int]:
+        """Return the nodes to ignore together with the masked nodes"""
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is None:
+            return set(nodes_to_ignore)
+        return set(nodes_to_ignore).union(masked_nodes.tolist())
 
     def _add_node(self, ext_node_id: int):
         graph_node_id = self._graph.add_node(ext_node_id)
-        self._external_to_internal[ext_node_id] = graph_node_id
-        self._internal_to_external[graph_node_id] = ext_node_id
+        self._id_map.add([ext_node_id], [graph_node_id])
 
     def _add_nodes(self, ext_node_ids: list[int]) -> None:
         graph_node_ids = self._graph.add_nodes_from(ext_node_ids)
-        for ext_node_id, graph_node_id in zip(ext_node_ids, graph_node_ids):
-            self._external_to_internal[ext_node_id] = graph_node_id
-            self._internal_to_external[graph_node_id] = ext_node_id
+        self._id_map.add(ext_node_ids, list(graph_node_ids))
 
     def _delete_node(self, node_id: int):
         self._graph.remove_node(node_id)
-        external_node_id = self._internal_to_external.pop(node_id)
-        self._external_to_internal.pop(external_node_id)
+        self._id_map.remove([node_id])
+
+    def _delete_nodes(self, node_ids: NDArray[np.int64]) -> None:
+        self._graph.remove_nodes_from(node_ids.tolist())
+        self._id_map.remove(node_ids)
 
     def _has_branch(self, from_node_id: int, to_node_id: int) -> bool:
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is not None and (from_node_id in masked_nodes or to_node_id in masked_nodes):
+            return False
         return self._graph.has_edge(from_node_id, to_node_id)
 
     def _has_node(self, node_id: int) -> bool:
@@ -72,9 +154,9 @@ class RustworkxGraphModel(BaseGraphModel):
     def _add_branch(self, from_node_id: int, to_node_id: int):
         self._graph.add_edge(from_node_id, to_node_id, None)
 
-    def _add_branches(self, from_node_ids: list[int], to_node_ids: list[int]):
-        edge_list = [(from_node_id, to_node_id, None) for from_node_id, to_node_id in zip(from_node_ids, to_node_ids)]
-        self._graph.add_edges_from(edge_list)
+    def _add_branches(self, from_node_ids: NDArray[np.int64], to_node_ids: NDArray[np.int64]):
+        edge_list = list(zip(from_node_ids.tolist(), to_node_ids.tolist()))
+        self._graph.add_edges_from_no_data(edge_list)
 
     def _delete_branch(self, from_node_id: int, to_node_id: int) -> None:
         try:
@@ -82,24 +164,50 @@ class RustworkxGraphModel(BaseGraphModel):
         except NoEdgeBetweenNodes as error:
             raise MissingBranchError(f"No edge between (internal) nodes {from_node_id} and {to_node_id}") from error
 
-    def _get_shortest_path(self, source: int, target: int) -> tuple[list[int], int]:
-        path_mapping = rx.dijkstra_shortest_paths(self._graph, source, target)
+    def _delete_branches(self, from_node_ids: NDArray[np.int64], to_node_ids: NDArray[np.int64]) -> None:
+        edge_list = list(zip(from_node_ids.tolist(), to_node_ids.tolist()))
+        try:
+            self._graph.remove_edges_from(edge_list)
+        except NoEdgeBetweenNodes as error:
+            raise MissingBranchError("No edge between at least one pair of (internal) nodes") from error
 
-        if target not in path_mapping:
+    def _get_shortest_path(self, source: int, target: int) -> tuple[list[int], int]:
+        return self._get_shortest_path_ignoring(source, target, nodes_to_ignore=[])
+
+    def _get_shortest_path_ignoring(
+        self, source: int, target: int, nodes_to_ignore: list[int]
+    ) -> tuple[list[int], int]:
+        ignored_nodes = self._get_ignored_nodes(nodes_to_ignore)
+        if not ignored_nodes:
+            path_mapping = rx.dijkstra_shortest_paths(self._graph, source, target)
+            if target not in path_mapping:
+                raise NoPathBetweenNodes(f"No path between internal nodes {source} and {target}")
+            path_nodes = list(path_mapping[target])
+            return path_nodes, len(path_nodes) - 1
+
+        # all branches have the same weight, so the breadth-first search tree contains a shortest path
+        visitor = _PathFinder(target=target, nodes_to_ignore=ignored_nodes)
+        if source not in ignored_nodes:
+            rx.bfs_search(self._graph, [source], visitor)
+        if target not in visitor.parents:
             raise NoPathBetweenNodes(f"No path between internal nodes {source} and {target}")
-
-        path_nodes = list(path_mapping[target])
-        return path_nodes, len(path_nodes) - 1
+        path_nodes = [target]
+        while path_nodes[-1] != source:
+            path_nodes.append(visitor.parents[path_nodes[-1]])
+        return path_nodes[::-1], len(path_nodes) - 1
 
     def _get_all_paths(self, source: int, target: int) -> list[list[int]]:
-        return list(rx.all_simple_paths(self._graph, source, target))
+        return list(rx.all_simple_paths(self._get_graph(), source, target))
 
     def _get_components(self) -> list[list[int]]:
-        components = rx.connected_components(self._graph)
+        return self._get_components_ignoring(nodes_to_ignore=[])
+
+    def _get_components_ignoring(self, nodes_to_ignore: list[int]) -> list[list[int]]:
+        components = rx.connected_components(self._get_graph(nodes_to_ignore))
         return [list(component) for component in components]
 
     def _get_connected(self, node_id: int, nodes_to_ignore: list[int], inclusive: bool = False) -> list[int]:
-        visitor = _NodeVisitor(nodes_to_ignore)
+        visitor = _NodeVisitor(self._get_ignored_nodes(nodes_to_ignore))
         rx.bfs_search(self._graph, [node_id], visitor)
         connected_nodes = visitor.nodes
         if not inclusive:
@@ -108,29 +216,73 @@ class RustworkxGraphModel(BaseGraphModel):
         return connected_nodes
 
     def _in_branches(self, int_node_id: int) -> Generator[tuple[int, int], None, None]:
-        return ((source, target) for source, target, _ in self._graph.in_edges(int_node_id))
+        masked_nodes = self._get_masked_nodes()
+        return (
+            (source, target)
+            for source, target, _ in self._graph.in_edges(int_node_id)
+            if masked_nodes is None or source not in masked_nodes
+        )
 
     def _find_first_connected(self, node_id: int, candidate_node_ids: list[int]) -> int:
-        visitor = _NodeFinder(candidate_nodes=candidate_node_ids)
+        visitor = _NodeFinder(candidate_nodes=candidate_node_ids, nodes_to_ignore=self._get_ignored_nodes([]))
         rx.bfs_search(self._graph, [node_id], visitor)
         if visitor.found_node is None:
             raise MissingNodeError(f"node {node_id} is not connected to any of the candidate nodes")
         return visitor.found_node
 
+    def _get_bfs_tree(
+        self, start_node_ids: NDArray[np.int64]
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        if not start_node_ids.size:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty.copy(), empty.copy()
+
+        layers = rx.bfs_layers(self._get_graph(), start_node_ids.tolist())
+        sizes = [len(layer) for layer in layers]
+        nodes = np.fromiter(itertools.chain.from_iterable(layers), dtype=np.int64, count=sum(sizes))
+        depths = np.repeat(np.arange(len(layers), dtype=np.int64), sizes)
+
+        # the parent of a node is a neighbour one layer closer to the start nodes
+        edges = self._get_edges()
+        positions = np.full(max(int(nodes.max()), int(edges.max()) if edges.size else 0) + 1, -1, dtype=np.int64)
+        positions[nodes] = np.arange(nodes.size)
+        parents = np.full(nodes.size, -1, dtype=np.int64)
+        for source_column, target_column in [(0, 1), (1, 0)]:
+            source_positions = positions[edges[:, source_column]]
+            target_positions = positions[edges[:, target_column]]
+            is_tree_edge = (source_positions >= 0) & (target_positions >= 0)
+            is_tree_edge[is_tree_edge] = (
+                depths[target_positions[is_tree_edge]] == depths[source_positions[is_tree_edge]] + 1
+            )
+            parents[target_positions[is_tree_edge]] = source_positions[is_tree_edge]
+        return nodes, parents, depths
+
     def _find_fundamental_cycles(self) -> list[list[int]]:
         """Find all fundamental cycles in the graph using Rustworkx.
 
         Returns:
             list[list[int]]: A list of cycles, each cycle is a list of node IDs.
         """
-        return find_fundamental_cycles_rustworkx(self._graph)
+        return find_fundamental_cycles_rustworkx(self._get_graph())
 
     def _all_branches(self) -> Generator[tuple[int, int], None, None]:
-        return ((source, target) for source, target in self._graph.edge_list())
+        if self._get_masked_nodes() is None:
+            return ((source, target) for source, target in self._graph.edge_list())
+        return ((source, target) for source, target in self._get_edges().tolist())
+
+    def _get_edges(self) -> NDArray[np.int64]:
+        edges = np.asarray(self._graph.edge_list(), dtype=np.int64).reshape(-1, 2)
+        masked_nodes = self._get_masked_nodes()
+        if masked_nodes is None:
+            return edges
+        return edges[~np.isin(edges, masked_nodes).any(axis=1)]
+
+    def _get_bridges(self) -> NDArray[np.int64]:
+        return np.array(list(rx.bridges(self._get_graph())), dtype=np.int64).reshape(-1, 2)
 
 
 class _NodeVisitor(BFSVisitor):
-    def __init__(self, nodes_to_ignore: list[int]):
+    def __init__(self, nodes_to_ignore: set[int]):
         self.nodes_to_ignore = nodes_to_ignore
         self.nodes: list[int] = []
 
@@ -143,11 +295,31 @@ class _NodeVisitor(BFSVisitor):
 class _NodeFinder(BFSVisitor):
     """Visitor that stops the search when a candidate node is found"""
 
-    def __init__(self, candidate_nodes: list[int]):
+    def __init__(self, candidate_nodes: list[int], nodes_to_ignore: set[int]):
         self.candidate_nodes = candidate_nodes
+        self.nodes_to_ignore = nodes_to_ignore
         self.found_node: int | None = None
 
     def discover_vertex(self, v):
+        if v in self.nodes_to_ignore:
+            raise PruneSearch
         if v in self.candidate_nodes:
             self.found_node = v
             raise StopSearch
+
+
+class _PathFinder(BFSVisitor):
+    """Visitor that records the parent of each reached node, skips the nodes to ignore and stops at the target"""
+
+    def __init__(self, target: int, nodes_to_ignore: set[int]):
+        self.target = target
+        self.nodes_to_ignore = nodes_to_ignore
+        self.parents: dict[int, int] = {}
+
+    def tree_edge(self, e):
+        source, target, _ = e
+        if target in self.nodes_to_ignore:
+            raise PruneSearch
+        self.parents[target] = source
+        if target == self.target:
+            raise StopSearch
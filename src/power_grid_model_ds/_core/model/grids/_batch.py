@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Contains the GridBatch class"""
+
+import dataclasses
+from copy import copy
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.arrays import Branch3Array, BranchArray, NodeArray
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.containers.base import FancyArrayContainer
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
+
+if TYPE_CHECKING:
+    from power_grid_model_ds._core.model.grids.base import Grid
+
+# pylint: disable=protected-access
+
+# the graphs are rebuilt from the arrays when more than this fraction of the nodes and branches has changed
+_REBUILD_FRACTION = 0.25
+
+# the columns that determine the graph representation of a record
+_GRAPH_COLUMNS = {
+    NodeArray: ["id"],
+    BranchArray: ["id", "from_node", "to_node", "from_status", "to_status"],
+    Branch3Array: ["id", "node_1", "node_2", "node_3", "status_1", "status_2", "status_3"],
+}
+
+
+class GridBatch:
+    """State of a batch edit session of a grid (see Grid.batch).
+
+    Keeps the arrays of the grid at the start of the session to roll back to, and the deletions that are deferred
+    until the session is committed. An array is only copied when it is modified in-place by the session.
+    """
+
+    def __init__(self, grid: FancyArrayContainer):
+        self._arrays = {
+            field.name: getattr(grid, field.name)
+            for field in dataclasses.fields(grid)
+            if isinstance(getattr(grid, field.name), FancyArray)
+        }
+        self._copies: dict[str, FancyArray] = {}
+        self._id_counter = grid._id_counter
+        self._node_ids: list[NDArray[np.int64]] = []
+        self._branch_ids: list[NDArray[np.int64]] = []
+
+    @property
+    def node_ids(self) -> NDArray[np.int64]:
+        """The ids of the nodes to delete."""
+        return np.unique(np.concatenate(self._node_ids)) if self._node_ids else np.empty(0, dtype=np.int64)
+
+    @property
+    def branch_ids(self) -> NDArray[np.int64]:
+        """The ids of the branches (and branch3s) to delete."""
+        return np.unique(np.concatenate(self._branch_ids)) if self._branch_ids else np.empty(0, dtype=np.int64)
+
+    def get_array(self, grid: FancyArrayContainer, field_name: str) -> FancyArray:
+        """Return the array of the grid to modify in-place.
+
+        The first time, the array of the grid is replaced by a capacity-backed copy (see FancyArray.reserve),
+        so that the array at the start of the session is not modified.
+        """
+        array = getattr(grid, field_name)
+        if self._copies.get(field_name) is not array:
+            array = copy(array)
+            array.reserve()
+            setattr(grid, field_name, array)
+            self._copies[field_name] = array
+        return array
+
+    def delete_nodes(self, node_ids: NDArray[np.int64]) -> None:
+        """Defer the deletion of the nodes until the session is committed."""
+        self._node_ids.append(node_ids)
+
+    def delete_branches(self, branch_ids: NDArray[np.int64]) -> None:
+        """Defer the deletion of the branches until the session is committed."""
+        self._branch_ids.append(branch_ids)
+
+    def commit(self, grid: FancyArrayContainer) -> None:
+        """Replace the capacity-backed copies by regular arrays, so that appending to the grid after the session
+        does not modify the arrays in-place."""
+        for field_name, array in self._copies.items():
+            if getattr(grid, field_name) is array:
+                setattr(grid, field_name, copy(array))
+
+    def update_graphs(self, grid: "Grid", graphs: GraphContainer) -> GraphContainer:
+        """Apply the changes of the session to the graphs.
+
+        The node and branch records that were added, removed or changed (e.g. in status) during the session are
+        determined by comparing the arrays to the arrays at the start of the session. The graphs are updated with
+        these records in bulk, or rebuilt from the arrays if that is cheaper.
+
+        Returns:
+            the updated (or rebuilt) graphs
+        """
+        changes: list[tuple[FancyArray, FancyArray]] = []
+        nr_records = 0
+        for field_name, columns in self._get_graph_fields(grid):
+            array = getattr(grid, field_name)
+            nr_records += array.size
+            if array is not self._arrays[field_name]:
+                changes.append(_get_changed_records(self._arrays[field_name], array, columns))
+
+        nr_changes = sum(removed.size + added.size for removed, added in changes)
+        if nr_changes > _REBUILD_FRACTION * nr_records:
+            return graphs.__class__.from_arrays(grid, graph_model=graphs.complete_graph.__class__)
+
+        # the nodes are deleted after their branches and added before them
+        for removed, _ in changes:
+            if isinstance(removed, BranchArray) and removed.size:
+                graphs.delete_branch(removed)
+            elif isinstance(removed, Branch3Array) and removed.size:
+                graphs.delete_branch3(removed)
+        for removed, added in changes:
+            if isinstance(removed, NodeArray) and removed.size:
+                graphs.delete_node(removed)
+            if isinstance(added, NodeArray) and added.size:
+                graphs.add_node_array(added)
+        for _, added in changes:
+            if isinstance(added, BranchArray) and added.size:
+                graphs.add_branch_array(added)
+            elif isinstance(added, Branch3Array) and added.size:
+                graphs.add_branch3_array(added)
+        return graphs
+
+    def _get_graph_fields(self, grid: "Grid") -> list[tuple[str, list[str]]]:
+        """Return the names of the node and branch arrays of the grid, together with their graph columns."""
+        graph_fields = []
+        for field_name, array in self._arrays.items():
+            for array_class, columns in _GRAPH_COLUMNS.items():
+                if isinstance(array, array_class) and isinstance(getattr(grid, field_name), array_class):
+                    graph_fields.append((field_name, columns))
+        return graph_fields
+
+    def rollback(self, grid: FancyArrayContainer) -> None:
+        """Restore the arrays of the grid to the state at the start of the session."""
+        for field_name, array in self._arrays.items():
+            setattr(grid, field_name, array)
+        grid._id_counter = self._id_counter
+
+
+def _get_changed_records(
+    old_array: FancyArray, new_array: FancyArray, columns: list[str]
+) -> tuple[FancyArray, FancyArray]:
+    """Return the records of old_array that are no longer in new_array and the records of new_array that are new.
+    A record of which one of the graph columns has changed is in both."""
+    _, old_rows, new_rows = np.intersect1d(old_array.data["id"], new_array.data["id"], return_indices=True)
+    is_unchanged = np.full(old_rows.size, True)
+    for column in columns:
+        is_unchanged &= old_array.data[column][old_rows] == new_array.data[column][new_rows]
+
+    is_removed = np.full(old_array.size, True)
+    is_removed[old_rows[is_unchanged]] = False
+    is_added = np.full(new_array.size, True)
+    is_added[new_rows[is_unchanged]] = False
+    return old_array[is_removed], new_array[is_added]
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Contains the BranchCache class"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.arrays import BranchArray
+
+# pylint: disable=protected-access
+
+
+class BranchCache:
+    """Combined view of the branch arrays of a grid, together with a per-row source map.
+
+    The cache remembers the branch arrays (and their versions) it was built from.
+    It is outdated as soon as one of the branch arrays is replaced, modified through the FancyArray API
+    or when the branch columns of one of the arrays no longer match the cached data (e.g. after
+    grid.line.from_status[0] = 0).
+    """
+
+    def __init__(self, branch_arrays: list[BranchArray]):
+        self._key = [(array, array._version) for array in branch_arrays]
+
+        branch_dtype = BranchArray.get_dtype()
+        sizes = np.array([len(array) for array in branch_arrays], dtype=np.int64)
+        offsets = np.cumsum(sizes) - sizes
+        data = np.empty(int(sizes.sum()), dtype=branch_dtype)
+        for array, offset, size in zip(branch_arrays, offsets, sizes):
+            for column in branch_dtype.names:
+                data[column][offset : offset + size] = array.data[column]
+        data.flags.writeable = False
+
+        self._offsets = offsets
+        self.branches = BranchArray(data=data)
+        self.array_index: NDArray[np.int64] = np.repeat(np.arange(len(branch_arrays), dtype=np.int64), sizes)
+        self.array_index.flags.writeable = False
+        self.row_index: NDArray[np.int64] = np.arange(len(data), dtype=np.int64) - np.repeat(offsets, sizes)
+        self.row_index.flags.writeable = False
+
+    def is_valid_for(self, branch_arrays: list[BranchArray]) -> bool:
+        """Whether the cache was built from (the current state of) the given branch arrays."""
+        if len(branch_arrays) != len(self._key):
+            return False
+        for array, (cached_array, version) in zip(branch_arrays, self._key):
+            if array is not cached_array or array._version != version:
+                return False
+        return all(self._is_equal_to(array, offset) for array, offset in zip(branch_arrays, self._offsets))
+
+    def _is_equal_to(self, array: BranchArray, offset: int) -> bool:
+        """Whether the branch columns of the array still match the cached data (without copying them)."""
+        data = self.branches.data
+        size = len(array)
+        if offset + size > len(data):
+            return False
+        return all(
+            np.array_equal(array.data[column], data[column][offset : offset + size])
+            for column in data.dtype.names or ()
+        )
@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Columnar cache format of a grid.
+
+A columnar cache is a directory with
+    - manifest.json: the id counter and other (json) attributes of the grid and per array its class, dtype and file.
+    - one file per array with its records in the numpy .npy format (.npy.gz if the cache is compressed).
+    - optionally, per graph the node ids and the edges (as external node ids) in the same format. Together with a
+      fingerprint of the topology columns of the arrays, so that a graph is only loaded if it matches the arrays.
+
+Uncompressed arrays are loaded as (copy-on-write) memory maps, so that only the parts of the arrays that are used
+are read from disk. Compressed arrays are (de)compressed while they are written/read, without temporary files.
+
+A cache is written to a temporary directory next to the cache directory, which then replaces the cache directory.
+This way, a grid that is memory mapped from the cache can be saved to the same cache.
+"""
+
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+
+from power_grid_model_ds._core.model.arrays import Branch3Array, BranchArray, NodeArray
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.containers.base import FancyArrayContainer
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+_JSON_TYPES = (bool, int, float, str, type(None))
+# the columns of the node and branch arrays that determine the topology of the graphs
+_TOPOLOGY_COLUMNS = (
+    "id",
+    "from_node",
+    "to_node",
+    "from_status",
+    "to_status",
+    "node_1",
+    "node_2",
+    "node_3",
+    "status_1",
+    "status_2",
+    "status_3",
+)
+
+_logger = logging.getLogger(__name__)
+
+G = TypeVar("G", bound=FancyArrayContainer)
+
+# pylint: disable=protected-access
+
+
+def is_columnar_cache(cache_path: Path) -> bool:
+    """Whether the path is a columnar cache directory"""
+    return cache_path.is_dir() and (cache_path / MANIFEST_NAME).is_file()
+
+
+def save_columnar_cache(
+    container: FancyArrayContainer, cache_path: Path, compress: bool = False, graphs: GraphContainer | None = None
+) -> Path:
+    """Save the arrays and attributes of the container to a columnar cache directory.
+
+    Args:
+        container: the container (e.g. Grid) to save
+        cache_path: the directory to save the cache to
+        compress: whether to gzip the arrays
+        graphs: the graphs of the container to save as well (optional)
+
+    Raises:
+        TypeError: if the container has an attribute that cannot be stored in the manifest
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(prefix=f".{cache_path.name}.", dir=cache_path.parent))
+    try:
+        _write_columnar_cache(container, tmp_path, compress=compress, graphs=graphs)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    _replace_directory(tmp_path, cache_path)
+    return cache_path
+
+
+def _write_columnar_cache(
+    container: FancyArrayContainer, cache_path: Path, compress: bool, graphs: GraphContainer | None
+) -> None:
+    manifest: dict[str, Any] = {
+        "format_version": FORMAT_VERSION,
+        "container_class": _get_class_path(container.__class__),
+        "id_counter": int(container._id_counter),
+        "attributes": {},
+        "arrays": {},
+    }
+    for field in dataclasses.fields(container):
+        value = getattr(container, field.name)
+        if isinstance(value, FancyArray):
+            file_name = f"{field.name}.npy.gz" if compress else f"{field.name}.npy"
+            _save_array(value.data, cache_path / file_name, compress=compress)
+            manifest["arrays"][field.name] = {
+                "class": _get_class_path(value.__class__),
+                "dtype": np.lib.format.dtype_to_descr(value.dtype),
+                "size": int(value.size),
+                "file": file_name,
+            }
+        elif isinstance(value, _JSON_TYPES) and field.name != "_id_counter":
+            manifest["attributes"][field.name] = value
+        elif field.init and field.name not in ("_id_counter", "graphs"):
+            raise TypeError(f"Cannot store attribute '{field.name}' ({type(value).__name__}) in a columnar cache.")
+
+    if graphs is not None:
+        manifest["graphs"] = {"fingerprint": get_topology_fingerprint(container)}
+        for field in graphs.graph_attributes:
+            graph = getattr(graphs, field.name)
+            suffix = ".npy.gz" if compress else ".npy"
+            nodes_file, edges_file = f"{field.name}.nodes{suffix}", f"{field.name}.edges{suffix}"
+            _save_array(np.asarray(graph.external_ids, dtype=np.int64), cache_path / nodes_file, compress=compress)
+            _save_array(graph.get_edges(), cache_path / edges_file, compress=compress)
+            manifest["graphs"][field.name] = {
+                "active_only": graph.active_only,
+                "nodes": nodes_file,
+                "edges": edges_file,
+            }
+
+    with open(cache_path / MANIFEST_NAME, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+
+
+def _replace_directory(source: Path, target: Path) -> None:
+    """Replace the target directory by the source directory.
+
+    The old target is moved aside before it is removed, so that files of the old target that are still memory mapped
+    remain readable (on Windows, these files are left behind until they are no longer in use).
+    """
+    if not target.exists():
+        os.replace(source, target)
+        return
+    old_target = Path(tempfile.mkdtemp(prefix=f".{target.name}.old.", dir=target.parent))
+    os.replace(target, old_target / target.name)
+    os.replace(source, target)
+    shutil.rmtree(old_target, ignore_errors=True)
+
+
+def load_columnar_cache(container_class: type[G], cache_path: Path, memory_map: bool = True) -> G:
+    """Load a container from a columnar cache directory. Non-array attributes that are not in the cache (e.g. graphs)
+    are left empty.
+
+    Args:
+        container_class: the class of the container (e.g. Grid) to load
+        cache_path: the cache directory
+        memory_map: whether to memory map the (uncompressed) arrays instead of reading them into memory
+
+    Raises:
+        TypeError: if the cache was made for another container class or if the classes or dtypes of its arrays do
+            not match those of the container class
+    """
+    manifest = _read_manifest(cache_path)
+    if manifest["container_class"] != _get_class_path(container_class):
+        raise TypeError(
+            f"{cache_path.name} is not a valid {container_class.__name__} cache: "
+            f"it contains a {manifest['container_class']}"
+        )
+    container = container_class.empty()
+    for field in dataclasses.fields(container):
+        if (array_info := manifest["arrays"].get(field.name)) is None:
+            continue
+        array_class = type(getattr(container, field.name))
+        if array_info["class"] != _get_class_path(array_class):
+            raise TypeError(
+                f"{cache_path.name} is not a valid {container_class.__name__} cache: "
+                f"'{field.name}' is a {array_info['class']} instead of a {array_class.__name__}"
+            )
+        data = _load_array(cache_path / array_info["file"], memory_map=memory_map and array_info["size"] > 0)
+        if data.dtype != array_class.get_dtype():
+            raise TypeError(
+                f"{cache_path.name} is not a valid {container_class.__name__} cache: "
+                f"the dtype of '{field.name}' does not match {array_class.__name__}"
+            )
+        setattr(container, field.name, array_class(data=data))
+
+    for name, value in manifest["attributes"].items():
+        setattr(container, name, value)
+    container._id_counter = manifest["id_counter"]
+    return container
+
+
+def load_columnar_graphs(container: FancyArrayContainer, cache_path: Path) -> GraphContainer | None:
+    """Load the graphs of a container from a columnar cache directory.
+
+    Returns None if the cache does not contain graphs, or if the graphs do not match the topology of the container.
+    """
+    manifest = _read_manifest(cache_path)
+    if (graphs_info := manifest.get("graphs")) is None:
+        return None
+    if graphs_info["fingerprint"] != get_topology_fingerprint(container):
+        _logger.warning(f"The graphs in {cache_path.name} do not match the arrays and are not loaded.")
+        return None
+
+    # the graphs are loaded in the graph container class and graph model of the container (if it has graphs)
+    container_graphs = getattr(container, "graphs", None)
+    if isinstance(container_graphs, GraphContainer):
+        graphs = container_graphs.__class__.empty(graph_model=type(container_graphs.complete_graph))
+    else:
+        graphs = GraphContainer.empty()
+    for field in graphs.graph_attributes:
+        graph_info = graphs_info[field.name]
+        node_ids = _load_array(cache_path / graph_info["nodes"], memory_map=False)
+        edges = _load_array(cache_path / graph_info["edges"], memory_map=False)
+        graph_class = type(getattr(graphs, field.name))
+        setattr(graphs, field.name, graph_class.from_edges(node_ids, edges, active_only=graph_info["active_only"]))
+    return graphs
+
+
+def get_topology_fingerprint(container: FancyArrayContainer) -> str:
+    """Return a hash of the columns of the node and branch arrays that determine the topology of the graphs"""
+    hasher = hashlib.blake2b(digest_size=16)
+    for field in dataclasses.fields(container):
+        array = getattr(container, field.name)
+        if not isinstance(array, (NodeArray, BranchArray, Branch3Array)):
+            continue
+        hasher.update(field.name.encode())
+        for column in _TOPOLOGY_COLUMNS:
+            if column in array.columns:
+                hasher.update(np.ascontiguousarray(array.data[column]).tobytes())
+    return hasher.hexdigest()
+
+
+def _read_manifest(cache_path: Path) -> dict[str, Any]:
+    with open(cache_path / MANIFEST_NAME, "r", encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get("format_version") != FORMAT_VERSION:
+        raise TypeError(f"{cache_path.name} has an unsupported format version: {manifest.get('format_version')}")
+    return manifest
+
+
+def _save_array(data: np.ndarray, path: Path, compress: bool) -> None:
+    if compress:
+        with gzip.open(path, "wb") as file:
+            np.save(file, data, allow_pickle=False)
+    else:
+        np.save(path, data, allow_pickle=False)
+
+
+def _load_array(path: Path, memory_map: bool) -> np.ndarray:
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as file:
+            return np.load(file, allow_pickle=False)
+    # copy-on-write: the array can be modified without modifying the cache
+    return np.load(path, mmap_mode="c" if memory_map else None, allow_pickle=False)
+
+
+def _get_class_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Contains the FeederTree class"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from power_grid_model_ds._core.model.arrays import NodeArray
+from power_grid_model_ds._core.model.constants import EMPTY_ID
+from power_grid_model_ds._core.model.enums.nodes import NodeType
+from power_grid_model_ds._core.model.graphs.errors import MissingNodeError
+from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
+
+# pylint: disable=protected-access, too-many-instance-attributes
+
+
+class FeederTree:
+    """Rooted tree index of a (radial) graph, with the substation nodes as roots.
+
+    Every node that is connected to a substation node is assigned to its nearest substation node. The index stores
+    for each node its parent (upstream node), its depth (distance to the substation node in number of edges) and its
+    entry/exit position in a depth-first ordering of the nodes (Euler tour).
+    All nodes downstream of a node are then a contiguous slice of that ordering, so that downstream queries do not
+    require a graph search.
+
+    The index is built from the graph (and node array) it was created from. It is outdated as soon as one of them
+    is replaced or modified.
+
+    Note: the index assumes the graph is radial. For a meshed graph, each node is assigned to one of its shortest
+    paths to a substation node, so that downstream queries do not match the graph. Use is_radial() to check this.
+    """
+
+    def __init__(self, graph: BaseGraphModel, node: NodeArray):
+        self._key = (graph, graph._version, node, node._version)
+
+        substation_node_ids = node.filter(node_type=NodeType.SUBSTATION_NODE.value).id
+        node_ids, parents, depths = graph.get_bfs_tree(substation_node_ids)
+        self.node_ids: NDArray[np.int64] = node_ids
+        self.parents: NDArray[np.int64] = parents
+        self.depths: NDArray[np.int64] = depths
+
+        sizes = _get_subtree_sizes(parents, depths)
+        self.entry: NDArray[np.int64] = _get_entry_positions(parents, depths, sizes)
+        self.exit: NDArray[np.int64] = self.entry + sizes
+        self.order: NDArray[np.int64] = np.empty_like(self.entry)
+        self.order[self.entry] = np.arange(self.entry.size)
+        self._root_entries = np.sort(self.entry[parents < 0])
+
+        self._sorter = np.argsort(node_ids, kind="stable")
+        self._sorted_node_ids = node_ids[self._sorter]
+        self._is_radial_tree = self._get_is_radial_tree(graph.get_edges())
+
+    def is_valid_for(self, graph: BaseGraphModel, node: NodeArray) -> bool:
+        """Whether the index was built from (the current state of) the graph and node array."""
+        graph_, graph_version, node_, node_version = self._key
+        return graph is graph_ and graph._version == graph_version and node is node_ and node._version == node_version
+
+    def get_downstream_nodes(self, node_id: int, inclusive: bool = False) -> NDArray[np.int64]:
+        """Return the nodes downstream of the node, sorted by distance.
+
+        Raises:
+            MissingNodeError: if the node is not connected to a substation node
+        """
+        position = self._get_positions(np.array([node_id]), raise_on_missing=True).item()
+        start = self.entry[position] if inclusive else self.entry[position] + 1
+        downstream = self.order[start : self.exit[position]]
+        downstream = downstream[np.argsort(self.depths[downstream], kind="stable")]
+        return self.node_ids[downstream]
+
+    def get_upstream_path(self, node_id: int) -> NDArray[np.int64]:
+        """Return the path from the node up to its substation node (both inclusive).
+
+        Raises:
+            MissingNodeError: if the node is not connected to a substation node
+        """
+        position = self._get_positions(np.array([node_id]), raise_on_missing=True).item()
+        path = np.empty(self.depths[position] + 1, dtype=np.int64)
+        for index in range(path.size):
+            path[index] = position
+            position = self.parents[position]
+        return self.node_ids[path]
+
+    def is_downstream(self, node_ids: ArrayLike, upstream_node_ids: ArrayLike) -> NDArray[np.bool_]:
+        """Return for each pair of nodes whether node_id is downstream of upstream_node_id.
+        A node is not downstream of itself. Nodes that are not connected to a substation node are never downstream.
+        """
+        node_ids, upstream_node_ids = np.broadcast_arrays(np.asarray(node_ids), np.asarray(upstream_node_ids))
+        entry = _take(self.entry, self._get_positions(node_ids), default=-1)
+        upstream_positions = self._get_positions(upstream_node_ids)
+        upstream_entry = _take(self.entry, upstream_positions, default=-1)
+        upstream_exit = _take(self.exit, upstream_positions, default=-1)
+        return (upstream_entry < entry) & (entry < upstream_exit)
+
+    def get_substation_nodes(self, node_ids: ArrayLike) -> NDArray[np.int64]:
+        """Return the substation node of each node, or EMPTY_ID if the node is not connected to a substation node."""
+        positions = self._get_positions(np.asarray(node_ids))
+        entry = _take(self.entry, positions, default=-1)
+        # the substation node of a node is the last substation node that enters the ordering before the node
+        root_entries = self._root_entries[np.searchsorted(self._root_entries, entry[positions >= 0], side="right") - 1]
+        substation_nodes = np.full(positions.shape, EMPTY_ID, dtype=np.int64)
+        substation_nodes[positions >= 0] = self.node_ids[self.order[root_entries]]
+        return substation_nodes
+
+    def get_upstream_nodes(self, node_ids: ArrayLike) -> NDArray[np.int64]:
+        """Return the upstream (parent) node of each node.
+        EMPTY_ID is returned for substation nodes and nodes that are not connected to a substation node."""
+        parents = _take(self.parents, self._get_positions(np.asarray(node_ids)), default=-1)
+        return _take(self.node_ids, parents, default=EMPTY_ID)
+
+    def get_distances(self, node_ids: ArrayLike) -> NDArray[np.int64]:
+        """Return the distance (in number of edges) of each node to its substation node.
+        -1 is returned for nodes that are not connected to a substation node."""
+        return _take(self.depths, self._get_positions(np.asarray(node_ids)), default=-1)
+
+    def is_radial(self, node_ids: ArrayLike) -> NDArray[np.bool_]:
+        """Return for each node whether its tree is radial: the graph has no other branches between the nodes of the
+        tree than the branches of the tree (i.e. no cycles and no connection to another substation node).
+        False is returned for nodes that are not connected to a substation node."""
+        positions = self._get_positions(np.asarray(node_ids))
+        is_radial = np.zeros(positions.shape, dtype=np.bool_)
+        is_radial[positions >= 0] = self._is_radial_tree[self._get_trees(positions[positions >= 0])]
+        return is_radial
+
+    def count_downstream_nodes(self, node_ids: ArrayLike) -> NDArray[np.int64]:
+        """Return the number of nodes downstream of each node (0 for nodes not connected to a substation node)."""
+        positions = self._get_positions(np.asarray(node_ids))
+        return _take(self.exit - self.entry - 1, positions, default=0)
+
+    def _get_trees(self, positions: NDArray[np.int64]) -> NDArray[np.int64]:
+        # returns the index of the tree (in order of self._root_entries) of each position
+        return np.searchsorted(self._root_entries, self.entry[positions], side="right") - 1
+
+    def _get_is_radial_tree(self, edges: NDArray[np.int64]) -> NDArray[np.bool_]:
+        # a tree is radial if the number of branches connected to its nodes equals the number of tree branches.
+        # A branch between two trees is counted for both trees.
+        edge_positions = self._get_positions(edges)
+        edge_positions = edge_positions[(edge_positions >= 0).all(axis=1)]
+        from_trees, to_trees = self._get_trees(edge_positions[:, 0]), self._get_trees(edge_positions[:, 1])
+        edge_trees = np.concatenate([from_trees, to_trees[to_trees != from_trees]])
+        nr_edges = np.bincount(edge_trees, minlength=self._root_entries.size)
+        root_positions = self.order[self._root_entries]
+        return nr_edges == self.exit[root_positions] - self.entry[root_positions] - 1
+
+    def _get_positions(self, node_ids: NDArray, raise_on_missing: bool = False) -> NDArray[np.int64]:
+        # returns the position of each node id in self.node_ids, or -1 if the node is not in the tree
+        if not self._sorted_node_ids.size:
+            positions = np.full(node_ids.shape, -1, dtype=np.int64)
+        else:
+            sorted_positions = np.searchsorted(self._sorted_node_ids, node_ids)
+            sorted_positions = np.minimum(sorted_positions, self._sorted_node_ids.size - 1)
+            found = self._sorted_node_ids[sorted_positions] == node_ids
+            positions = np.where(found, self._sorter[sorted_positions], -1)
+        if raise_on_missing and positions.size and positions.min() < 0:
+            missing_id = node_ids[positions < 0].flat[0]
+            raise MissingNodeError(f"Node {missing_id} is not connected to a {NodeType.SUBSTATION_NODE.name}")
+        return positions
+
+
+def _take(array: NDArray, positions: NDArray[np.int64], default: int) -> NDArray:
+    # returns array[positions], with the default value where the position is -1
+    result = np.full(positions.shape, default, dtype=array.dtype)
+    is_valid = positions >= 0
+    result[is_valid] = array[positions[is_valid]]
+    return result
+
+
+def _get_subtree_sizes(parents: NDArray[np.int64], depths: NDArray[np.int64]) -> NDArray[np.int64]:
+    # the nodes are in breadth-first order, so each depth is a contiguous range of positions.
+    # The subtree sizes are accumulated from the deepest level up to the roots.
+    sizes = np.ones(parents.size, dtype=np.int64)
+    level_starts = np.searchsorted(depths, np.arange(depths.max(initial=0) + 1))
+    for level_start in level_starts[:0:-1]:
+        level_end = np.searchsorted(depths, depths[level_start], side="right")
+        np.add.at(sizes, parents[level_start:level_end], sizes[level_start:level_end])
+    return sizes
+
+
+def _get_entry_positions(
+    parents: NDArray[np.int64], depths: NDArray[np.int64], sizes: NDArray[np.int64]
+) -> NDArray[np.int64]:
+    # a node enters the depth-first ordering right after its parent and the subtrees of its preceding siblings
+    entry = np.zeros(parents.size, dtype=np.int64)
+    level_starts = np.searchsorted(depths, np.arange(depths.max(initial=0) + 2))
+    for level_start, level_end in zip(level_starts[:-1], level_starts[1:]):
+        level = np.arange(level_start, level_end)
+        level_parents = parents[level]
+        sorter = np.argsort(level_parents, kind="stable")
+        level, level_parents = level[sorter], level_parents[sorter]
+
+        preceding_sizes = np.cumsum(sizes[level]) - sizes[level]
+        is_first_child = np.ones(level.size, dtype=np.bool_)
+        is_first_child[1:] = level_parents[1:] != level_parents[:-1]
+        group_starts = np.maximum.accumulate(np.where(is_first_child, np.arange(level.size), 0))
+        sibling_offsets = preceding_sizes - preceding_sizes[group_starts]
+
+        parent_entry = np.where(level_parents >= 0, entry[level_parents] + 1, 0)
+        entry[level] = parent_entry + sibling_offsets
+    return entry
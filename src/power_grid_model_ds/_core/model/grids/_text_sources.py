@@ -5,8 +5,14 @@
 """Create a grid from text a text file"""
 
 import logging
-from typing import TYPE_CHECKING
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.enums.nodes import NodeType
 
 if TYPE_CHECKING:
@@ -14,6 +20,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+_CHUNK_SIZE = 100_000  # number of text lines that are tokenized at once
+
 
 class TextSource:
     """Class for handling text sources.
@@ -29,6 +37,9 @@ class TextSource:
         S1 7
 
     See docs/examples/3_drawing_a_grid.md for more information.
+
+    The text is tokenized into columns (from node, to node and comment), from which each array of the grid is built
+    and appended at once. The graphs are built once, at the end.
     """
 
     def __init__(self, grid_class: type["Grid"]):
@@ -36,82 +47,124 @@ class TextSource:
 
     def load_from_txt(self, *args: str) -> "Grid":
         """Load a grid from text"""
-
         text_lines = [line for arg in args for line in arg.strip().split("\n")]
-
-        txt_nodes, txt_branches = self.read_txt(text_lines)
-        self.add_nodes(txt_nodes)
-        self.add_branches(txt_branches)
-        self.grid.set_feeder_ids()
-        return self.grid
+        return self._load(*self.read_txt(text_lines))
+
+    def load_from_txt_file(self, txt_file_path: Path, chunk_size: int = _CHUNK_SIZE) -> "Grid":
+        """Load a grid from a text file, which is read and tokenized in chunks of lines"""
+        from_nodes: list[str] = []
+        to_nodes: list[str] = []
+        comments: list[str] = []
+        with open(txt_file_path, "r", encoding="utf-8") as file:
+            while chunk := list(islice(file, chunk_size)):
+                chunk_from_nodes, chunk_to_nodes, chunk_comments = self.read_txt(chunk)
+                from_nodes += chunk_from_nodes.tolist()
+                to_nodes += chunk_to_nodes.tolist()
+                comments += chunk_comments.tolist()
+        return self._load(np.array(from_nodes, dtype=np.str_), np.array(to_nodes, dtype=np.str_), np.array(comments))
 
     @staticmethod
-    def read_txt(txt_lines: list[str]) -> tuple[set, dict]:
-        """Extract assets from text"""
-
-        txt_nodes = set()
-        txt_branches = {}
+    def read_txt(txt_lines: Iterable[str]) -> tuple[NDArray[np.str_], NDArray[np.str_], NDArray[np.str_]]:
+        """Extract the from nodes, to nodes and comments of the branches from text"""
+        rows = []
         for text_line in txt_lines:
-            if not text_line.strip() or text_line.startswith("#"):
+            tokens = text_line.split()
+            if not tokens or tokens[0].startswith("#"):
                 continue  # skip empty lines and comments
-            try:
-                from_node_str, to_node_str, *comments = text_line.strip().split()
-            except ValueError as err:
-                raise ValueError(f"Text line '{text_line}' is invalid. Skipping...") from err
-            comments = comments[0].split(",") if comments else []
-
-            txt_nodes |= {from_node_str, to_node_str}
-            txt_branches[(from_node_str, to_node_str)] = comments
-        return txt_nodes, txt_branches
-
-    def add_nodes(self, nodes: set[str]):
+            if len(tokens) < 2:
+                raise ValueError(f"Text line '{text_line}' is invalid. Skipping...")
+            rows.append((tokens[0], tokens[1], tokens[2] if len(tokens) > 2 else ""))
+        if not rows:
+            return np.array([], dtype=np.str_), np.array([], dtype=np.str_), np.array([], dtype=np.str_)
+        from_nodes, to_nodes, comments = zip(*rows)
+        return np.array(from_nodes), np.array(to_nodes), np.array(comments)
+
+    def add_nodes(self, nodes: NDArray[np.str_]):
         """Add nodes to the grid"""
-        source_nodes = {int(node[1:]) for node in nodes if node.startswith("S")}
-        regular_nodes = {int(node) for node in nodes if not node.startswith("S")}
+        is_source = np.char.startswith(nodes, "S")
+        node_ids = _to_ids(nodes)
+        source_nodes = np.unique(node_ids[is_source])
+        regular_nodes = np.unique(node_ids[~is_source])
 
-        if source_nodes.intersection(regular_nodes):
+        if np.intersect1d(source_nodes, regular_nodes).size:
             raise ValueError("Source nodes and regular nodes have overlapping ids")
 
-        for node_id in source_nodes:
-            new_node = self.grid.node.empty(1)
-            new_node.id = node_id
-            new_node.node_type = NodeType.SUBSTATION_NODE
-            self.grid.append(new_node, check_max_id=False)
-
-        for node_id in regular_nodes:
-            new_node = self.grid.node.empty(1)
-            new_node.id = node_id
-            self.grid.append(new_node, check_max_id=False)
-
-    def add_branches(self, branches: dict[tuple[str, str], list[str]]):
-        """Add branches to the grid"""
-        for branch, comments in branches.items():
-            self.add_branch(branch, comments)
-
-    def add_branch(self, branch: tuple[str, str], comments: list[str]):
-        """Add a branch to the grid"""
-        from_node_str, to_node_str = branch
-        from_node = int(from_node_str.replace("S", ""))
-        to_node = int(to_node_str.replace("S", ""))
-
-        if "transformer" in comments:
-            new_branch = self.grid.transformer.empty(1)
-        elif "link" in comments:
-            new_branch = self.grid.link.empty(1)
-        else:  # assume it is a line
-            new_branch = self.grid.line.empty(1)
-
-        branch_ids = [branch_id for branch_id in comments if branch_id.isdigit()]
-        if branch_ids:
-            if len(branch_ids) > 1:
-                raise ValueError(f"Multiple branch ids found in row {branch} {','.join(comments)}")
-            new_branch.id = int(branch_ids[0])
-
-        new_branch.from_node = from_node
-        new_branch.to_node = to_node
-        new_branch.from_status = 1
-        if "open" in comments:
-            new_branch.to_status = 0
-        else:
-            new_branch.to_status = 1
-        self.grid.append(new_branch, check_max_id=False)
+        new_nodes = self.grid.node.empty(source_nodes.size + regular_nodes.size)
+        new_nodes.id = np.concatenate([source_nodes, regular_nodes])
+        new_nodes.node_type = np.where(
+            np.arange(new_nodes.size) < source_nodes.size, NodeType.SUBSTATION_NODE.value, new_nodes.node_type
+        )
+        self.grid.append(new_nodes, check_max_id=False)
+
+    def add_branches(self, from_nodes: NDArray[np.str_], to_nodes: NDArray[np.str_], comments: NDArray[np.str_]):
+        """Add branches to the grid.
+
+        The comment of a branch is a comma separated list of: 'transformer' or 'link' (default: line), 'open' and
+        the id of the branch (default: the next id of the grid).
+        """
+        # ",transformer,open" -> ",transformer,open," so that each option can be found as ",option,"
+        padded_comments = np.char.add(np.char.add(",", comments), ",")
+        is_transformer = np.char.find(padded_comments, ",transformer,") >= 0
+        is_link = ~is_transformer & (np.char.find(padded_comments, ",link,") >= 0)
+        is_open = np.char.find(padded_comments, ",open,") >= 0
+        branch_ids = self._get_branch_ids(from_nodes, to_nodes, comments)
+
+        for array, mask in (
+            (self.grid.line, ~is_transformer & ~is_link),
+            (self.grid.link, is_link),
+            (self.grid.transformer, is_transformer),
+        ):
+            if not np.any(mask):
+                continue
+            new_branches = array.empty(int(np.count_nonzero(mask)))
+            new_branches.id = branch_ids[mask]
+            new_branches.from_node = _to_ids(from_nodes[mask])
+            new_branches.to_node = _to_ids(to_nodes[mask])
+            new_branches.from_status = 1
+            new_branches.to_status = np.where(is_open[mask], 0, 1)
+            self.grid.append(new_branches, check_max_id=False)
+
+    def _load(self, from_nodes: NDArray[np.str_], to_nodes: NDArray[np.str_], comments: NDArray[np.str_]) -> "Grid":
+        from_nodes, to_nodes, comments = _deduplicate(from_nodes, to_nodes, comments)
+        with self.grid.batch():
+            self.add_nodes(np.concatenate([from_nodes, to_nodes]))
+            self.add_branches(from_nodes, to_nodes, comments)
+        self.grid.set_feeder_ids()
+        return self.grid
+
+    def _get_branch_ids(
+        self, from_nodes: NDArray[np.str_], to_nodes: NDArray[np.str_], comments: NDArray[np.str_]
+    ) -> NDArray[np.int64]:
+        """Return the ids of the branches: the id in the comment, or the next id of the grid (in order of the rows)"""
+        branch_ids = np.full(comments.size, EMPTY_ID, dtype=np.int64)
+        for index in np.flatnonzero(np.char.str_len(comments) > 0):
+            ids = [option for option in comments[index].split(",") if option.isdigit()]
+            if len(ids) > 1:
+                branch = (str(from_nodes[index]), str(to_nodes[index]))
+                raise ValueError(f"Multiple branch ids found in row {branch} {comments[index]}")
+            if ids:
+                branch_ids[index] = int(ids[0])
+
+        # the id counter is increased by each branch without id, and set to the id of each branch with an id if higher
+        is_new_id = branch_ids == EMPTY_ID
+        nr_new_ids = np.cumsum(is_new_id)
+        counter_offsets = np.where(is_new_id, self.grid.max_id, branch_ids - nr_new_ids)
+        id_counter = np.maximum.accumulate(np.maximum(counter_offsets, self.grid.max_id)) + nr_new_ids
+        return np.where(is_new_id, id_counter, branch_ids)
+
+
+def _deduplicate(
+    from_nodes: NDArray[np.str_], to_nodes: NDArray[np.str_], comments: NDArray[np.str_]
+) -> tuple[NDArray[np.str_], NDArray[np.str_], NDArray[np.str_]]:
+    """Keep the first row of each (from node, to node) pair, with the comment of the last row of the pair"""
+    pairs = np.char.add(np.char.add(from_nodes, " "), to_nodes)
+    _, first_rows = np.unique(pairs, return_index=True)
+    _, last_rows_reversed = np.unique(pairs[::-1], return_index=True)
+    last_rows = pairs.size - 1 - last_rows_reversed
+    order = np.argsort(first_rows)
+    first_rows, last_rows = first_rows[order], last_rows[order]
+    return from_nodes[first_rows], to_nodes[first_rows], comments[last_rows]
+
+
+def _to_ids(nodes: NDArray[np.str_]) -> NDArray[np.int64]:
+    return np.char.replace(nodes, "S", "").astype(np.int64)
@@ -7,15 +7,15 @@
 import dataclasses
 import itertools
 import logging
+from contextlib import contextmanager
 from copy import copy
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Type, TypeVar
+from typing import Generator, Type, TypeVar
 
 import numpy as np
 import numpy.typing as npt
 
-from power_grid_model_ds._core import fancypy as fp
 from power_grid_model_ds._core.model.arrays import (
     AsymVoltageSensorArray,
     Branch3Array,
@@ -34,11 +34,21 @@ from power_grid_model_ds._core.model.arrays import (
 )
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.containers.base import FancyArrayContainer
 from power_grid_model_ds._core.model.enums.nodes import NodeType
 from power_grid_model_ds._core.model.graphs.container import GraphContainer
 from power_grid_model_ds._core.model.graphs.models import RustworkxGraphModel
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
+from power_grid_model_ds._core.model.grids._batch import GridBatch
+from power_grid_model_ds._core.model.grids._branch_cache import BranchCache
+from power_grid_model_ds._core.model.grids._columnar_cache import (
+    is_columnar_cache,
+    load_columnar_cache,
+    load_columnar_graphs,
+    save_columnar_cache,
+)
+from power_grid_model_ds._core.model.grids._feeder_tree import FeederTree
 from power_grid_model_ds._core.model.grids._text_sources import TextSource
 from power_grid_model_ds._core.model.grids.helpers import set_feeder_ids, set_is_feeder
 from power_grid_model_ds._core.utils.pickle import get_pickle_path, load_from_pickle, save_to_pickle
@@ -46,6 +56,9 @@ from power_grid_model_ds._core.utils.zip import file2gzip
 
 Self = TypeVar("Self", bound="Grid")
 
+# columns that refer to the id of another record (e.g. sensors and regulators), these records are deleted with it
+_REFERENCE_COLUMNS = ("measured_object", "regulated_object")
+
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-many-public-methods
 
@@ -85,6 +98,14 @@ class Grid(FancyArrayContainer):
     sym_voltage_sensor: SymVoltageSensorArray
     asym_voltage_sensor: AsymVoltageSensorArray
 
+    def __getstate__(self) -> dict:
+        # the branch cache and feeder tree can be rebuilt and are not stored, neither is a running batch session
+        state = self.__dict__.copy()
+        state.pop("_branch_cache", None)
+        state.pop("_feeder_tree", None)
+        state.pop("_batch", None)
+        return state
+
     def __str__(self) -> str:
         """String representation of the grid.
 
@@ -97,7 +118,7 @@ class Grid(FancyArrayContainer):
             for combo in itertools.combinations(nodes, 2):
                 grid_str += f"S{combo[0]} S{combo[1]} {transformer3.id.item()},3-transformer\n"
 
-        for branch in self.branches:
+        for branch in self._get_branch_cache().branches:
             from_node = self.node.get(id=branch.from_node).record
             to_node = self.node.get(id=branch.to_node).record
 
@@ -122,13 +143,57 @@ class Grid(FancyArrayContainer):
 
     @property
     def branches(self) -> BranchArray:
-        """Converts all branch arrays into a single BranchArray."""
-        branch_dtype = BranchArray.get_dtype()
-        branches = BranchArray()
-        for array in self.branch_arrays:
-            new_branch = BranchArray(data=array.data[list(branch_dtype.names)])
-            branches = fp.concatenate(branches, new_branch)
-        return branches
+        """Converts all branch arrays into a single BranchArray.
+
+        The result is a (writable) copy of a combined array that is cached until one of the branch arrays is replaced
+        or modified. Replacements and changes through the FancyArray API (e.g. grid.line = ... or grid.append(...))
+        are detected by version, in-place changes (e.g. grid.line.from_status[0] = 0) by comparing the branch columns.
+        """
+        return self._get_branch_cache().branches.copy()
+
+    @property
+    def branch_source_map(self) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """For each row in grid.branches, the position of its array in grid.branch_arrays and its row in that array.
+
+        Example:
+            >>> array_index, row_index = grid.branch_source_map
+            >>> grid.branch_arrays[array_index[0]][row_index[0]]  # the record of grid.branches[0]
+        """
+        branch_cache = self._get_branch_cache()
+        return branch_cache.array_index, branch_cache.row_index
+
+    def invalidate_branches(self) -> None:
+        """Invalidate the cached grid.branches, so that it will be rebuilt on the next access."""
+        self.__dict__.pop("_branch_cache", None)
+
+    def _get_branch_cache(self) -> BranchCache:
+        # the cache is stored as a plain instance attribute, so that it is not a dataclass field
+        branch_arrays = self.branch_arrays
+        branch_cache: BranchCache | None = self.__dict__.get("_branch_cache")
+        if branch_cache is None or not branch_cache.is_valid_for(branch_arrays):
+            branch_cache = BranchCache(branch_arrays)
+            self.__dict__["_branch_cache"] = branch_cache
+        return branch_cache
+
+    @property
+    def feeder_tree(self) -> FeederTree:
+        """Tree index of the active graph, with the substation nodes as roots.
+
+        The index is built on first access and rebuilt when the active graph or the node array has changed
+        (e.g. after make_active/make_inactive). It assumes the grid is radial.
+
+        Examples:
+            >>> grid.feeder_tree.get_downstream_nodes(node_id)
+            >>> grid.feeder_tree.get_upstream_path(node_id)  # from node_id up to its substation node
+            >>> grid.feeder_tree.is_downstream(node_ids, upstream_node_ids)  # batched
+            >>> grid.feeder_tree.get_substation_nodes(grid.node.id)  # batched
+        """
+        active_graph = self.graphs.active_graph
+        feeder_tree: FeederTree | None = self.__dict__.get("_feeder_tree")
+        if feeder_tree is None or not feeder_tree.is_valid_for(active_graph, self.node):
+            feeder_tree = FeederTree(active_graph, self.node)
+            self.__dict__["_feeder_tree"] = feeder_tree
+        return feeder_tree
 
     @property
     def branch_arrays(self) -> list[BranchArray]:
@@ -201,8 +266,9 @@ class Grid(FancyArrayContainer):
         """
         self._append(array, check_max_id=check_max_id)  # noqa
 
-        # pylint: disable=protected-access
-        self.graphs._append(array)
+        if self._batch is None:
+            # pylint: disable=protected-access
+            self.graphs._append(array)
 
     def add_branch(self, branch: BranchArray) -> None:
         """Add a branch to the grid
@@ -211,7 +277,8 @@ class Grid(FancyArrayContainer):
             branch (BranchArray): The branch to add
         """
         self._append(array=branch)
-        self.graphs.add_branch_array(branch_array=branch)
+        if self._batch is None:
+            self.graphs.add_branch_array(branch_array=branch)
 
         logging.debug(f"added branch {branch.id} from {branch.from_node} to {branch.to_node}")
 
@@ -221,6 +288,9 @@ class Grid(FancyArrayContainer):
         Args:
             branch (BranchArray): The branch to remove
         """
+        if self._batch is not None:
+            self.delete_branches(branch.id)
+            return
         _add_branch_array(branch=branch, grid=self)
         self.graphs.delete_branch(branch=branch)
         logging.debug(
@@ -233,6 +303,9 @@ class Grid(FancyArrayContainer):
         Args:
             branch (Branch3Array): The branch3 to remove
         """
+        if self._batch is not None:
+            self.delete_branches(branch.id)
+            return
         _add_branch_array(branch=branch, grid=self)
         self.graphs.delete_branch3(branch=branch)
 
@@ -243,7 +316,8 @@ class Grid(FancyArrayContainer):
             node (NodeArray): The node to add
         """
         self._append(array=node)
-        self.graphs.add_node_array(node_array=node)
+        if self._batch is None:
+            self.graphs.add_node_array(node_array=node)
         logging.debug(f"added rail {node.id}")
 
     def delete_node(self, node: NodeArray) -> None:
@@ -252,17 +326,126 @@ class Grid(FancyArrayContainer):
         Args:
             node (NodeArray): The node to remove
         """
-        self.node = self.node.exclude(id=node.id)
-        self.sym_load = self.sym_load.exclude(node=node.id)
-        self.source = self.source.exclude(node=node.id)
+        self.delete_nodes(node.id)
+        logging.debug(f"deleted rail {node.id}")
 
-        for branch_array in self.branch_arrays:
-            matching_branches = branch_array.filter(from_node=node.id, to_node=node.id, mode_="OR")
-            for branch in matching_branches:
-                self.delete_branch(branch)
+    def delete_nodes(self, node_ids: npt.ArrayLike) -> None:
+        """Remove nodes from the grid, together with all records that depend on them.
 
-        self.graphs.delete_node(node=node)
-        logging.debug(f"deleted rail {node.id}")
+        This removes the branches (and three-winding transformers) connected to the nodes, the appliances
+        (loads, sources, generators) at the nodes and the sensors and regulators of everything that is removed.
+        Each array is filtered only once and the graphs are updated in bulk, so use this method instead of calling
+        delete_node for each node.
+
+        Args:
+            node_ids (ArrayLike): The ids of the nodes to remove
+
+        Raises:
+            RecordDoesNotExist: if one of the nodes does not exist. No records are removed in that case.
+        """
+        node_ids = np.unique(node_ids)
+        _check_ids_exist(node_ids, self.node.id, name="Nodes")
+        if self._batch is not None:
+            self._batch.delete_nodes(node_ids)
+            return
+
+        nodes, branch3_arrays = _delete_node_records(self, node_ids)
+
+        # deleting the nodes from the graphs also deletes their branches,
+        # only the branches between the remaining nodes of a branch3 have to be deleted separately
+        self.graphs.delete_node(node=nodes)
+        for branch3_array in branch3_arrays:
+            if branch3_array.size:
+                branches = branch3_array.as_branches()
+                self.graphs.delete_branch(branches.exclude(from_node=node_ids, to_node=node_ids, mode_="OR"))
+
+    def delete_branches(self, branch_ids: npt.ArrayLike) -> None:
+        """Remove branches (and/or three-winding transformers) from the grid, together with their sensors and
+        regulators.
+
+        Each array is filtered only once and the graphs are updated in bulk, so use this method instead of calling
+        delete_branch for each branch.
+
+        Args:
+            branch_ids (ArrayLike): The ids of the branches to remove
+
+        Raises:
+            RecordDoesNotExist: if one of the branches does not exist. No records are removed in that case.
+        """
+        branch_ids = np.unique(branch_ids)
+        existing_ids = np.concatenate([array.id for array in self.all_arrays() if _is_branch_array(array)])
+        _check_ids_exist(branch_ids, existing_ids, name="Branches")
+        if self._batch is not None:
+            self._batch.delete_branches(branch_ids)
+            return
+
+        for branches in _delete_branch_records(self, branch_ids):
+            if isinstance(branches, BranchArray):
+                self.graphs.delete_branch(branch=branches)
+            else:
+                self.graphs.delete_branch3(branch=branches)
+
+    @contextmanager
+    def batch(self: Self) -> Generator[Self, None, None]:
+        """Context manager to edit the grid in a batch session.
+
+        Within a batch session:
+            - appended records are added in-place to capacity-backed copies of the arrays (see FancyArray.reserve).
+              The arrays are copied once, on the first change, and are regular arrays again after the session.
+            - deletions (delete_node(s), delete_branch(es) and delete_branch3) are collected and applied in bulk at
+              the end of the session. Until then, the records remain in the arrays.
+            - the graphs are not updated. At the end of the session, the added, removed and changed nodes and
+              branches are applied to the graphs in bulk, or the graphs are rebuilt if most of the grid has changed.
+
+        If an exception is raised within the session, the changes made through the grid (e.g. append, add_branch,
+        make_inactive or delete_node) are rolled back. Changes made directly to the arrays within the session
+        (e.g. grid.line.r1 = ...) are not.
+        A batch session that is started within a batch session is part of the outer session.
+
+        Example:
+            >>> with grid.batch():
+            >>>     for line in lines_to_replace:
+            >>>         grid.delete_branch(line)
+            >>>         grid.add_branch(new_line)
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        batch = GridBatch(self)
+        self.__dict__["_batch"] = batch
+        try:
+            yield self
+            del self.__dict__["_batch"]
+            self._commit_batch(batch)
+        except BaseException:
+            self.__dict__.pop("_batch", None)
+            batch.rollback(self)
+            raise
+
+    @property
+    def _batch(self) -> GridBatch | None:
+        return self.__dict__.get("_batch")
+
+    def _append(self, array: FancyArray, check_max_id: bool = True) -> None:
+        if self._batch is not None and array.size:
+            # append in-place, so that many appends within a batch session do not each copy the array
+            self._get_array_to_modify(self.find_array_field(array.__class__).name)
+        super()._append(array, check_max_id=check_max_id)
+
+    def _get_array_to_modify(self, field_name: str) -> FancyArray:
+        # within a batch session, the arrays are modified in a copy, so that the session can be rolled back
+        if self._batch is not None:
+            return self._batch.get_array(self, field_name)
+        return getattr(self, field_name)
+
+    def _commit_batch(self, batch: GridBatch) -> None:
+        batch.commit(self)
+        if (branch_ids := batch.branch_ids).size:
+            _delete_branch_records(self, branch_ids)
+        if (node_ids := batch.node_ids).size:
+            _delete_node_records(self, node_ids)
+        self.graphs = batch.update_graphs(self, self.graphs)
 
     def make_active(self, branch: BranchArray) -> None:
         """Make a branch active
@@ -271,13 +454,12 @@ class Grid(FancyArrayContainer):
             branch (BranchArray): The branch to make active
         """
         array_field = self.find_array_field(branch.__class__)
-        array_attr = getattr(self, array_field.name)
-        branch_mask = array_attr.id == branch.id
-        array_attr.from_status[branch_mask] = 1
-        array_attr.to_status[branch_mask] = 1
+        array_attr = self._get_array_to_modify(array_field.name)
+        array_attr.update_by_id(branch.id, from_status=1, to_status=1, allow_missing=True)
         setattr(self, array_field.name, array_attr)
 
-        self.graphs.make_active(branch=branch)
+        if self._batch is None:
+            self.graphs.make_active(branch=branch)
         logging.debug(f"activated branch {branch.id}")
 
     def make_inactive(self, branch: BranchArray, at_to_side: bool = True) -> None:
@@ -289,13 +471,13 @@ class Grid(FancyArrayContainer):
             Defaults to True.
         """
         array_field = self.find_array_field(branch.__class__)
-        array_attr = getattr(self, array_field.name)
-        branch_mask = array_attr.id == branch.id
+        array_attr = self._get_array_to_modify(array_field.name)
         status_side = "to_status" if at_to_side else "from_status"
-        array_attr[status_side][branch_mask] = 0
+        array_attr.update_by_id(branch.id, allow_missing=True, **{status_side: 0})
         setattr(self, array_field.name, array_attr)
 
-        self.graphs.make_inactive(branch=branch)
+        if self._batch is None:
+            self.graphs.make_inactive(branch=branch)
         logging.debug(f"deactivated branch {branch.id}")
 
     def get_branches_in_path(self, nodes_in_path: list[int]) -> BranchArray:
@@ -307,7 +489,8 @@ class Grid(FancyArrayContainer):
         Returns:
             BranchArray: The branches in the path
         """
-        return self.branches.filter(from_node=nodes_in_path, to_node=nodes_in_path, from_status=1, to_status=1)
+        branches = self._get_branch_cache().branches
+        return branches.filter(from_node=nodes_in_path, to_node=nodes_in_path, from_status=1, to_status=1)
 
     def get_nearest_substation_node(self, node_id: int):
         """Find the nearest substation node.
@@ -321,17 +504,36 @@ class Grid(FancyArrayContainer):
         Raises:
             RecordDoesNotExist: If no substation node is connected to the input node.
         """
-        connected_nodes = self.graphs.active_graph.get_connected(node_id=node_id, inclusive=True)
-        substation_nodes = self.node.filter(node_type=NodeType.SUBSTATION_NODE.value)
+        substation_node_id = self.feeder_tree.get_substation_nodes([node_id]).item()
+        if substation_node_id == EMPTY_ID:
+            raise RecordDoesNotExist(f"No {NodeType.SUBSTATION_NODE.name} connected to node {node_id}")
+        return self.node.get(substation_node_id)
 
-        for node in connected_nodes:
-            if node in substation_nodes.id:
-                return substation_nodes.get(node)
-        raise RecordDoesNotExist(f"No {NodeType.SUBSTATION_NODE.name} connected to node {node_id}")
+    def get_nearest_substation_nodes(
+        self, node_ids: npt.ArrayLike | None = None
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Find the nearest substation node and its distance for many nodes at once.
+
+        All nodes are assigned with a single breadth-first search from all substation nodes on the active graph
+        (see feeder_tree), so this is much faster than calling get_nearest_substation_node for each node.
+
+        Args:
+            node_ids(ArrayLike, optional): The ids of the nodes. Defaults to all nodes in the grid.
+
+        Returns:
+            tuple of two arrays, aligned with node_ids:
+                the id of the nearest substation node (EMPTY_ID if no substation node is connected)
+                the distance to that substation node in number of branches (-1 if no substation node is connected)
+        """
+        if node_ids is None:
+            node_ids = self.node.id
+        feeder_tree = self.feeder_tree
+        return feeder_tree.get_substation_nodes(node_ids), feeder_tree.get_distances(node_ids)
 
     def get_downstream_nodes(self, node_id: int, inclusive: bool = False):
         """Get the downstream nodes from a node.
-        Assuming each node has a single feeding substation and the grid is radial
+        Assuming each node has a single feeding substation. For radial feeders, the nodes are looked up in the
+        feeder_tree. Otherwise, they are found by a search of the graph.
 
         Example:
             given this graph: [1] - [2] - [3] - [4], with 1 being a substation node
@@ -346,59 +548,86 @@ class Grid(FancyArrayContainer):
 
         Raises:
             NotImplementedError: If the input node is a substation node.
+            MissingNodeError: If the input node is not connected to a substation node.
 
         Returns:
             list[int]: The downstream nodes.
         """
-        substation_nodes = self.node.filter(node_type=NodeType.SUBSTATION_NODE.value)
-
-        if node_id in substation_nodes.id:
+        feeder_tree = self.feeder_tree
+        if feeder_tree.get_distances([node_id]).item() == 0:
             raise NotImplementedError("get_downstream_nodes is not implemented for substation nodes!")
 
+        if feeder_tree.is_radial([node_id]).item():
+            return feeder_tree.get_downstream_nodes(node_id=node_id, inclusive=inclusive).tolist()
+
+        substation_nodes = self.node.filter(node_type=NodeType.SUBSTATION_NODE.value)
         return self.graphs.active_graph.get_downstream_nodes(
             node_id=node_id, start_node_ids=list(substation_nodes.id), inclusive=inclusive
         )
 
-    def cache(self, cache_dir: Path, cache_name: str, compress: bool = True):
+    def cache(
+        self, cache_dir: Path, cache_name: str, compress: bool = True, columnar: bool = False, cache_graphs: bool = True
+    ):
         """Cache Grid to a folder
 
         Args:
             cache_dir (Path): The directory to save the cache to.
             cache_name (str): The name of the cache.
             compress (bool, optional): Whether to compress the cache. Defaults to True.
+            columnar (bool, optional): Whether to use the columnar cache format instead of a pickle.
+                In this format, each array is stored as a separate .npy file in the directory cache_dir / cache_name.
+                Uncompressed, the arrays are memory mapped when the grid is loaded, which makes loading large grids
+                nearly instant. Defaults to False.
+            cache_graphs (bool, optional): Whether to store the graphs in a columnar cache, so that they do not have to
+                be rebuilt from the arrays when the grid is loaded. Defaults to True.
+
+        Returns:
+            Path: The path to the cache (a file, or a directory for the columnar format)
         """
+        if columnar:
+            # the graphs are outdated within a batch session
+            graphs = self.graphs if cache_graphs and self._batch is None else None
+            return save_columnar_cache(self, cache_dir / cache_name, compress=compress, graphs=graphs)
+
         tmp_graphs = copy(self.graphs)
         self.graphs = None  # noqa
         cache_dir.mkdir(parents=True, exist_ok=True)
 
         pickle_path = cache_dir / f"{cache_name}.pickle"
-        save_to_pickle(path=pickle_path, python_object=self)
+        try:
+            save_to_pickle(path=pickle_path, python_object=self)
+        finally:
+            self.graphs = tmp_graphs
 
         if compress:
             gzip_path = file2gzip(pickle_path)
             pickle_path.unlink()
             return gzip_path
-
-        self.graphs = tmp_graphs
         return pickle_path
 
     @classmethod
     # pylint: disable=arguments-differ
-    def from_cache(cls: Type[Self], cache_path: Path, load_graphs: bool = True) -> Self:
+    def from_cache(cls: Type[Self], cache_path: Path, load_graphs: bool = True, memory_map: bool = True) -> Self:
         """Read from cache and build .graphs from arrays
 
         Args:
             cache_path (Path): The path to the cache
             load_graphs (bool, optional): Whether to load the graphs. Defaults to True.
+            memory_map (bool, optional): Whether to memory map the arrays of an uncompressed columnar cache.
+                The arrays are copy-on-write: changes to the grid are not written to the cache. Defaults to True.
 
         Returns:
             Self: The grid loaded from cache
         """
-        pickle_path = get_pickle_path(cache_path)
+        if not is_columnar_cache(cache_path):
+            grid = cls._from_pickle(pickle_path=get_pickle_path(cache_path))
+            if load_graphs:
+                grid.graphs = GraphContainer.from_arrays(grid)
+            return grid
 
-        grid = cls._from_pickle(pickle_path=pickle_path)
+        grid = load_columnar_cache(cls, cache_path, memory_map=memory_map)
         if load_graphs:
-            grid.graphs = GraphContainer.from_arrays(grid)
+            grid.graphs = load_columnar_graphs(grid, cache_path) or GraphContainer.from_arrays(grid)
         return grid
 
     @classmethod
@@ -431,9 +660,7 @@ class Grid(FancyArrayContainer):
         Args:
             txt_file_path (Path): The path to the txt file
         """
-        with open(txt_file_path, "r", encoding="utf-8") as f:
-            txt_lines = f.readlines()
-        return TextSource(grid_class=cls).load_from_txt(*txt_lines)
+        return TextSource(grid_class=cls).load_from_txt_file(txt_file_path)
 
     def set_feeder_ids(self):
         """Sets feeder and substation id properties in the grids arrays"""
@@ -459,6 +686,79 @@ class Grid(FancyArrayContainer):
         return new_grid
 
 
+def _is_branch_array(array: FancyArray) -> bool:
+    return isinstance(array, (BranchArray, Branch3Array))
+
+
+def _check_ids_exist(ids: npt.NDArray, existing_ids: npt.NDArray, name: str) -> None:
+    """Raise RecordDoesNotExist if one of the (unique) ids does not exist"""
+    if (missing_ids := np.setdiff1d(ids, existing_ids, assume_unique=True)).size:
+        raise RecordDoesNotExist(f"{name} {missing_ids.tolist()} do not exist in the grid")
+
+
+def _delete_node_records(grid: Grid, node_ids: npt.NDArray) -> tuple[NodeArray, list[Branch3Array]]:
+    """Delete the nodes and all records that depend on them from the arrays of the grid (not from the graphs).
+    Returns the deleted nodes and the deleted branch3s."""
+    node_mask = grid.node.filter_mask(id=node_ids)
+    nodes = grid.node[node_mask]
+
+    deleted_ids = [_delete_records(grid, "node", node_mask)]
+    branch3_arrays = []
+    for field in dataclasses.fields(grid):
+        array = getattr(grid, field.name)
+        if isinstance(array, BranchArray):
+            mask = array.filter_mask(from_node=node_ids, to_node=node_ids, mode_="OR")
+        elif isinstance(array, Branch3Array):
+            mask = array.filter_mask(node_1=node_ids, node_2=node_ids, node_3=node_ids, mode_="OR")
+            branch3_arrays.append(array[mask])
+        elif isinstance(array, FancyArray) and "node" in array.columns:
+            mask = array.filter_mask(node=node_ids)
+        else:
+            continue
+        deleted_ids.append(_delete_records(grid, field.name, mask))
+    _delete_dependent_records(grid, np.concatenate(deleted_ids))
+    return nodes, branch3_arrays
+
+
+def _delete_branch_records(grid: Grid, branch_ids: npt.NDArray) -> list[BranchArray | Branch3Array]:
+    """Delete the branches (and branch3s) and their sensors and regulators from the arrays of the grid
+    (not from the graphs). Returns the deleted branches per array."""
+    deleted_arrays = []
+    for field in dataclasses.fields(grid):
+        array = getattr(grid, field.name)
+        if not _is_branch_array(array):
+            continue
+        mask = array.filter_mask(id=branch_ids)
+        if mask.any():
+            deleted_arrays.append(array[mask])
+            _delete_records(grid, field.name, mask)
+    _delete_dependent_records(grid, branch_ids)
+    return deleted_arrays
+
+
+def _delete_records(grid: Grid, field_name: str, mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.int64]:
+    """Delete the records that match the mask from an array of the grid. Returns the ids of the deleted records."""
+    array = getattr(grid, field_name)
+    deleted_ids = array.id[mask]
+    if deleted_ids.size:
+        remaining = array[~mask]
+        if array.id_index is not None:
+            remaining.enable_id_index()
+        setattr(grid, field_name, remaining)
+    return deleted_ids
+
+
+def _delete_dependent_records(grid: Grid, deleted_ids: npt.NDArray[np.int64]) -> None:
+    """Delete the sensors and regulators of deleted records"""
+    for field in dataclasses.fields(grid):
+        array = getattr(grid, field.name)
+        if not isinstance(array, FancyArray):
+            continue
+        for column in _REFERENCE_COLUMNS:
+            if column in array.columns:
+                _delete_records(grid, field.name, np.isin(array[column], deleted_ids))
+
+
 def _add_branch_array(branch: BranchArray | Branch3Array, grid: Grid):
     """Add a branch array to the grid"""
     array_field = grid.find_array_field(branch.__class__)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from power_grid_model_ds._core.model.arrays.pgm_arrays import BranchArray
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.enums.nodes import NodeType
 
 if TYPE_CHECKING:
@@ -44,34 +45,24 @@ def set_feeder_ids(grid: "Grid"):
     301 | 101          | 201
     601 | 101          | 204
     """
-    _reset_feeder_ids(grid)
     feeder_node_ids = grid.node.filter(node_type=NodeType.SUBSTATION_NODE)["id"]
-    with grid.graphs.active_graph.tmp_remove_nodes(feeder_node_ids.tolist()):
-        components = grid.graphs.active_graph.get_components()
-    for component_node_ids in components:
-        component_branches = _get_active_component_branches(grid, component_node_ids)
-
-        feeder_branch = _get_feeder_branch(component_branches)
-
-        if feeder_branch.size == 0:
-            continue  # early exit
-
-        feeder_node_id = _get_feeder_node_id(feeder_branch, feeder_node_ids)
-
-        for array in grid.branch_arrays:
-            array.update_by_id(
-                component_branches.id,
-                feeder_branch_id=feeder_branch.id.item(),
-                feeder_node_id=feeder_node_id,
-                allow_missing=True,
-            )
-
-        grid.node.update_by_id(
-            component_node_ids,
-            feeder_branch_id=feeder_branch.id.item(),
-            feeder_node_id=feeder_node_id,
-            allow_missing=True,
-        )
+    components = grid.graphs.active_graph.get_components(as_array=True, nodes_to_ignore=feeder_node_ids.tolist())
+    component_lookup = _get_component_lookup(components)
+
+    # retrieve the branches before the branch arrays are modified
+    branches = grid._get_branch_cache().branches  # pylint: disable=protected-access
+    branch_labels = _get_branch_labels(component_lookup, branches)
+
+    # label -1 (no component or no feeder branch) maps to the empty value in the last position
+    component_feeder_ids = _get_component_feeder_ids(
+        branches, branch_labels, feeder_node_ids, nr_components=len(components)
+    )
+
+    _set_branch_feeder_ids(grid, branch_labels, component_feeder_ids)
+
+    node_labels = _get_component_labels(component_lookup, grid.node.id)
+    grid.node.feeder_branch_id = component_feeder_ids[0][node_labels]
+    grid.node.feeder_node_id = component_feeder_ids[1][node_labels]
 
 
 def set_is_feeder(grid: "Grid") -> None:
@@ -84,40 +75,62 @@ def set_is_feeder(grid: "Grid") -> None:
         )
 
 
-def _reset_feeder_ids(grid: "Grid"):
-    # Resets all feeder ids to EMPTY_ID
-    for array in grid.branch_arrays:
-        array.set_empty("feeder_branch_id")
-        array.set_empty("feeder_node_id")
-
-    grid.node.set_empty("feeder_branch_id")
-    grid.node.set_empty("feeder_node_id")
-
-
-def _get_active_component_branches(grid: "Grid", component_node_ids: list[int]) -> BranchArray:
-    # a component is a set of actively connected nodes (ids)
-    # returns all active branches in the component
-
-    branches = grid.branches
-    branches_in_component = branches.filter(from_node=component_node_ids, to_node=component_node_ids, mode_="OR")
-    active_branches = branches_in_component.filter(from_status=1, to_status=1)
-    return active_branches
-
-
-def _get_feeder_branch(component_branches: BranchArray) -> BranchArray:
-    feeder_branches = component_branches.filter(is_feeder=True)
-
-    if feeder_branches.size == 1:
-        return feeder_branches
-
-    if feeder_branches.size > 1:
-        # Cannot point to multiple branches, so just pick the first one
-        return feeder_branches[0]
-
-    return BranchArray()
-
-
-def _get_feeder_node_id(feeder_branch: BranchArray, feeder_node_ids: np.ndarray) -> int:
-    # intersect to retrieve the feeder node id
-    feeder_node_id = np.intersect1d(feeder_branch.node_ids, feeder_node_ids)
-    return feeder_node_id.item()
+def _set_branch_feeder_ids(
+    grid: "Grid", branch_labels: np.ndarray, component_feeder_ids: tuple[np.ndarray, np.ndarray]
+) -> None:
+    # writes the feeder ids of the component of each branch with a single assignment per column per branch array
+    array_index, row_index = grid.branch_source_map
+    for position, array in enumerate(grid.branch_arrays):
+        in_array = array_index == position
+        for column, component_values in zip(["feeder_branch_id", "feeder_node_id"], component_feeder_ids):
+            values = np.full(len(array), EMPTY_ID, dtype=array.dtype[column])
+            values[row_index[in_array]] = component_values[branch_labels[in_array]]
+            setattr(array, column, values)
+
+
+def _get_component_lookup(components: list[np.ndarray] | list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    # returns the sorted node ids of all components and the component label of each of these node ids
+    if not components:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    sizes = np.array([len(component) for component in components], dtype=np.int64)
+    node_ids = np.concatenate(components)
+    labels = np.repeat(np.arange(len(components), dtype=np.int64), sizes)
+    sorter = np.argsort(node_ids, kind="stable")
+    return node_ids[sorter], labels[sorter]
+
+
+def _get_component_labels(component_lookup: tuple[np.ndarray, np.ndarray], node_ids: np.ndarray) -> np.ndarray:
+    # returns the component label of each node id, or -1 if the node is not part of a component
+    sorted_node_ids, sorted_labels = component_lookup
+    if not sorted_node_ids.size:
+        return np.full(len(node_ids), -1, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(sorted_node_ids, node_ids), sorted_node_ids.size - 1)
+    return np.where(sorted_node_ids[positions] == node_ids, sorted_labels[positions], -1)
+
+
+def _get_branch_labels(component_lookup: tuple[np.ndarray, np.ndarray], branches: BranchArray) -> np.ndarray:
+    # an active branch belongs to the component of its non-substation node(s), inactive branches get label -1
+    from_labels = _get_component_labels(component_lookup, branches.from_node)
+    to_labels = _get_component_labels(component_lookup, branches.to_node)
+    is_active = (branches.from_status == 1) & (branches.to_status == 1)
+    return np.where(is_active, np.maximum(from_labels, to_labels), -1)
+
+
+def _get_component_feeder_ids(
+    branches: BranchArray, branch_labels: np.ndarray, feeder_node_ids: np.ndarray, nr_components: int
+) -> tuple[np.ndarray, np.ndarray]:
+    # returns the feeder branch id and feeder node id per component label.
+    # An extra (empty) value is added at the end, so that label -1 maps to the empty value.
+    feeder_branch_ids = np.full(nr_components + 1, EMPTY_ID, dtype=branches.dtype["feeder_branch_id"])
+    feeder_node_ids_per_component = np.full(nr_components + 1, EMPTY_ID, dtype=branches.dtype["feeder_node_id"])
+
+    candidate_rows = np.flatnonzero((branch_labels >= 0) & branches.is_feeder)
+    # a component cannot point to multiple feeder branches, so just pick the first one
+    feeder_labels, first_positions = np.unique(branch_labels[candidate_rows], return_index=True)
+    feeder_rows = candidate_rows[first_positions]
+
+    from_nodes = branches.from_node[feeder_rows]
+    to_nodes = branches.to_node[feeder_rows]
+    feeder_branch_ids[feeder_labels] = branches.id[feeder_rows]
+    feeder_node_ids_per_component[feeder_labels] = np.where(np.isin(from_nodes, feeder_node_ids), from_nodes, to_nodes)
+    return feeder_branch_ids, feeder_node_ids_per_component
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Storage of batch calculation results"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from power_grid_model import ComponentType
+
+
+class Reducer(ABC):
+    """Reduces the values of an output field over all scenarios to one value per id.
+
+    The values are reduced chunk by chunk, so that the results of all scenarios never have to be in memory at once.
+    """
+
+    dtype: type = np.float64
+
+    def __init__(self, component: str, field: str):
+        self.component = component
+        self.field = field
+
+    @property
+    def statistic_field(self) -> str:
+        """The default name of the statistic field (see ResultStore.get_statistic)"""
+        return self.field
+
+    @abstractmethod
+    def initial(self, shape: tuple[int, ...]) -> NDArray:
+        """Return the reduced value before any scenario is added"""
+
+    @abstractmethod
+    def reduce(self, reduced: NDArray, values: NDArray) -> NDArray:
+        """Add the values of a chunk of scenarios (shape: (nr_scenarios, nr_ids, ...)) to the reduced value"""
+
+
+class MaxReducer(Reducer):
+    """Maximum per id (nan values are ignored)"""
+
+    def initial(self, shape: tuple[int, ...]) -> NDArray:
+        return np.full(shape, np.nan, dtype=self.dtype)
+
+    def reduce(self, reduced: NDArray, values: NDArray) -> NDArray:
+        return np.fmax(reduced, np.fmax.reduce(values, axis=0))
+
+
+class MinReducer(Reducer):
+    """Minimum per id (nan values are ignored)"""
+
+    def initial(self, shape: tuple[int, ...]) -> NDArray:
+        return np.full(shape, np.nan, dtype=self.dtype)
+
+    def reduce(self, reduced: NDArray, values: NDArray) -> NDArray:
+        return np.fmin(reduced, np.fmin.reduce(values, axis=0))
+
+
+class CountAboveReducer(Reducer):
+    """Number of scenarios in which the value is above the threshold per id (e.g. overloaded lines)"""
+
+    dtype = np.int64
+
+    def __init__(self, component: str, field: str, threshold: float):
+        super().__init__(component, field)
+        self.threshold = threshold
+
+    @property
+    def statistic_field(self) -> str:
+        # a count is not a value of the field, so it should not end up in that field (e.g. by update_grid)
+        return f"{self.field}_count_above"
+
+    def initial(self, shape: tuple[int, ...]) -> NDArray:
+        return np.zeros(shape, dtype=self.dtype)
+
+    def reduce(self, reduced: NDArray, values: NDArray) -> NDArray:
+        return reduced + np.count_nonzero(values > self.threshold, axis=0)
+
+
+class CountBelowReducer(CountAboveReducer):
+    """Number of scenarios in which the value is below the threshold per id (e.g. undervoltage at nodes)"""
+
+    @property
+    def statistic_field(self) -> str:
+        return f"{self.field}_count_below"
+
+    def reduce(self, reduced: NDArray, values: NDArray) -> NDArray:
+        return reduced + np.count_nonzero(values < self.threshold, axis=0)
+
+
+class ResultStore:  # pylint: disable=too-many-instance-attributes
+    """Stores the output of batch calculations, chunk by chunk.
+
+    Each output field is written to a preallocated memory mapped .npy file (<component>.<field>.npy in the directory)
+    of shape (nr_scenarios, nr_ids, ...). The ids are stored in <component>.id.npy.
+    The reducers are updated with each chunk, so that statistics over all scenarios are available without reading
+    the stored fields.
+
+    Example:
+        >>> store = ResultStore(
+        >>>     directory=Path("results"),
+        >>>     nr_scenarios=35_040,
+        >>>     fields={"line": ["loading"], "node": ["u_pu"]},
+        >>>     reducers={"max_loading": MaxReducer("line", "loading"), "min_u": MinReducer("node", "u_pu")},
+        >>> )
+        >>> for scenarios, output in core_interface.calculate_power_flow_profiles(profiles):
+        >>>     store.write(scenarios, output)
+        >>> core_interface.update_grid(store.get_statistic("max_loading"))
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        nr_scenarios: int,
+        fields: Optional[Dict[str, list[str]]] = None,
+        reducers: Optional[Dict[str, Reducer]] = None,
+    ):
+        """
+        Args:
+            directory: the directory to store the fields in
+            nr_scenarios: the total number of scenarios
+            fields: the fields to store per component. Defaults to all fields of all components in the output.
+            reducers: the reducers to update with each chunk, by name
+        """
+        self.directory = directory
+        self.nr_scenarios = nr_scenarios
+        self.fields = fields
+        self.reducers = reducers or {}
+
+        self.ids: Dict[str, NDArray[np.int64]] = {}
+        self.data: Dict[str, Dict[str, np.memmap]] = {}
+        self.statistics: Dict[str, NDArray] = {}
+        self._is_written = np.zeros(nr_scenarios, dtype=np.bool_)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all scenarios have been written"""
+        return bool(self._is_written.all())
+
+    def write(self, scenarios: slice, output: Dict[str, NDArray]) -> None:
+        """Write the (batch) output of the scenarios to the store and update the reducers.
+
+        Raises:
+            ValueError: if (some of) the scenarios have already been written, as the reducers would count them twice,
+                or if the output does not match the scenarios or earlier output
+        """
+        if self._is_written[scenarios].any():
+            raise ValueError(f"Scenarios {scenarios.start}-{scenarios.stop} have (partly) been written already")
+        nr_scenarios = scenarios.stop - scenarios.start
+        for component, component_output in output.items():
+            if component_output.ndim != 2 or len(component_output) != nr_scenarios:
+                raise ValueError(f"Expected batch output of {nr_scenarios} scenarios for {component}")
+            self._write_component(ComponentType(component).value, scenarios, component_output)
+
+        for name, reducer in self.reducers.items():
+            if reducer.component not in output:
+                raise ValueError(f"Reducer {name} requires output of {reducer.component}")
+            values = output[reducer.component][reducer.field]
+            if name not in self.statistics:
+                self.statistics[name] = reducer.initial(values.shape[1:])
+            self.statistics[name] = reducer.reduce(self.statistics[name], values)
+        self._is_written[scenarios] = True
+
+    def flush(self) -> None:
+        """Write the stored fields to disk"""
+        for component_data in self.data.values():
+            for values in component_data.values():
+                values.flush()
+
+    def get_scenario(self, scenario: int) -> Dict[str, NDArray]:
+        """Return the stored output of a single scenario (as structured arrays with the id and the stored fields)"""
+        return {
+            component: self._to_structured_array(
+                component, {field: values[scenario] for field, values in component_data.items()}
+            )
+            for component, component_data in self.data.items()
+            if component_data
+        }
+
+    def get_statistic(self, name: str, field: Optional[str] = None) -> Dict[str, NDArray]:
+        """Return a statistic as a structured array with the id and the statistic.
+
+        Args:
+            name: the name of the reducer
+            field: the name of the statistic field. Defaults to the field the reducer was applied to, or
+                '<field>_count_above' / '<field>_count_below' for the count reducers.
+        """
+        reducer = self.reducers[name]
+        statistic = {field or reducer.statistic_field: self.statistics[name]}
+        return {reducer.component: self._to_structured_array(reducer.component, statistic)}
+
+    def _write_component(self, component: str, scenarios: slice, component_output: NDArray) -> None:
+        fields = self._get_fields(component, component_output)
+        if component not in self.ids:
+            self.ids[component] = component_output["id"][0].copy()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            np.save(self.directory / f"{component}.id.npy", self.ids[component])
+            self.data[component] = {
+                field: np.lib.format.open_memmap(
+                    self.directory / f"{component}.{field}.npy",
+                    mode="w+",
+                    dtype=component_output.dtype[field].base,
+                    shape=(self.nr_scenarios, *component_output.shape[1:], *component_output.dtype[field].shape),
+                )
+                for field in fields
+            }
+        elif component_output.shape[1] != self.ids[component].size:
+            raise ValueError(f"Expected output of {self.ids[component].size} records for {component}")
+
+        for field in fields:
+            self.data[component][field][scenarios] = component_output[field]
+
+    def _get_fields(self, component: str, component_output: NDArray) -> list[str]:
+        if self.fields is None:
+            return [field for field in component_output.dtype.names or () if field != "id"]
+        return self.fields.get(component, [])
+
+    def _to_structured_array(self, component: str, columns: Dict[str, NDArray]) -> NDArray:
+        ids = self.ids[component]
+        dtype = [("id", ids.dtype)] + [(name, values.dtype, values.shape[1:]) for name, values in columns.items()]
+        array = np.empty(ids.size, dtype=dtype)
+        array["id"] = ids
+        for name, values in columns.items():
+            array[name] = values
+        return array
@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from typing import Literal
+
 import dash_bootstrap_components as dbc
 from dash import Dash, dcc, html
 from dash_bootstrap_components.icons import FONT_AWESOME
@@ -10,21 +12,35 @@ from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.visualizer.callbacks import (  # noqa: F401  # pylint: disable=unused-import
     config,
     element_selection,
+    grid_changes,
     header,
+    level_of_detail,
     search_form,
 )
+from power_grid_model_ds._core.visualizer.graph_layout import SERVER_SIDE_LAYOUTS, get_node_positions
 from power_grid_model_ds._core.visualizer.layout.cytoscape_html import get_cytoscape_html
 from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import DEFAULT_STYLESHEET
 from power_grid_model_ds._core.visualizer.layout.header import HEADER_HTML
 from power_grid_model_ds._core.visualizer.layout.selection_output import SELECTION_OUTPUT_HTML
+from power_grid_model_ds._core.visualizer.level_of_detail import LevelOfDetail
+from power_grid_model_ds._core.visualizer.live_update import ElementTracker, register_tracker
 from power_grid_model_ds._core.visualizer.parsers import parse_branches, parse_node_array
+from power_grid_model_ds._core.visualizer.server_state import register_state
 from power_grid_model_ds.arrays import NodeArray
 
 GOOGLE_FONTS = "https://fonts.googleapis.com/css?family=Roboto:300,400,500,700&display=swap"
 MDBOOTSTRAP = "https://cdnjs.cloudflare.com/ajax/libs/mdb-ui-kit/8.2.0/mdb.min.css"
+LIVE_UPDATE_INTERVAL = 1000  # milliseconds
 
 
-def visualize(grid: Grid, debug: bool = False, port: int = 8050) -> None:
+def visualize(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    grid: Grid,
+    debug: bool = False,
+    port: int = 8050,
+    layout: str = "",
+    aggregate_by: Literal["feeder", "substation"] | None = None,
+    live_update: bool = False,
+) -> None:
     """Visualize the Grid.
 
     grid: Grid
@@ -37,19 +53,37 @@ def visualize(grid: Grid, debug: bool = False, port: int = 8050) -> None:
             And grid.node contains "x" and "y" columns:
                 The layout will be set to "preset" which uses the x and y coordinates to place the nodes.
             Otherwise:
-                The layout will be set to "breadthfirst", which is a hierarchical breadth-first-search (BFS) layout.
-        Other options:
+                The layout will be set to "tree".
+        Layouts that are calculated once in Python (and cached per grid topology):
+            - "tree": A tree per substation, based on the active graph.
+            - "force": The tree layout, in which the meshed parts of the grid are placed with a force-directed layout.
+        Layouts that are calculated by Cytoscape in the browser (slow for large grids):
+            - "breadthfirst": A hierarchical breadth-first-search (BFS) layout.
             - "random": A layout that places the nodes randomly.
             - "circle": A layout that places the nodes in a circle.
             - "concentric": A layout that places the nodes in concentric circles.
             - "grid": A layout that places the nodes in a grid matrix.
             - "cose": A layout that uses the CompoundSpring Embedder algorithm (force-directed layout)
+
+    aggregate_by: str | None
+        Level of detail for large grids.
+
+        If 'aggregate_by' is not provided (None):
+            All nodes and branches are shown.
+        Otherwise:
+            - "feeder": The nodes of each feeder are shown as one element.
+            - "substation": The nodes of each substation area are shown as one element.
+            Click an aggregated element to expand it. The feeder ids of the grid are (re)calculated.
+
+    live_update: bool
+        Whether changes of the grid can be sent to the running app with push_changes(grid).
+        Only the changed elements are sent to the browser. Cannot be combined with aggregate_by.
     """
 
     app = Dash(
         external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.BOOTSTRAP, MDBOOTSTRAP, FONT_AWESOME, GOOGLE_FONTS]
     )
-    app.layout = get_app_layout(grid)
+    app.layout = get_app_layout(grid, layout=layout, aggregate_by=aggregate_by, live_update=live_update)
     app.run(debug=debug, port=port)
 
 
@@ -67,17 +101,47 @@ def _get_columns_store(grid: Grid) -> dcc.Store:
     )
 
 
-def get_app_layout(grid: Grid) -> html.Div:
+def get_app_layout(
+    grid: Grid,
+    layout: str = "",
+    aggregate_by: Literal["feeder", "substation"] | None = None,
+    live_update: bool = False,
+) -> html.Div:
     """Get the app layout."""
+    if live_update and aggregate_by is not None:
+        raise ValueError("Live updates are not supported in combination with aggregate_by")
     columns_store = _get_columns_store(grid)
-    graph_layout = _get_graph_layout(grid.node)
-    elements = parse_node_array(grid.node) + parse_branches(grid)
+    graph_layout = _get_graph_layout(grid.node, layout)
+    positions = None
+    if graph_layout in SERVER_SIDE_LAYOUTS:
+        positions = get_node_positions(grid, layout=graph_layout)  # type: ignore[arg-type]
+        graph_layout = "preset"
+    level_of_detail_key = None
+    element_tracker_key = None
+    if live_update:
+        tracker = ElementTracker(grid, positions=positions)
+        register_tracker(tracker)
+        element_tracker_key = register_state(tracker)
+        elements = list(tracker.elements)
+    elif aggregate_by is None:
+        elements = parse_node_array(grid.node, positions=positions) + parse_branches(grid)
+    else:
+        aggregation = LevelOfDetail(grid, aggregate_by=aggregate_by, positions=positions)
+        level_of_detail_key = register_state(aggregation)
+        elements = aggregation.get_elements()
     cytoscape_html = get_cytoscape_html(graph_layout, elements)
 
     return html.Div(
         [
             columns_store,
+            dcc.Store(id="grid-store", data=register_state(grid)),
+            dcc.Store(id="level-of-detail-store", data=level_of_detail_key),
+            dcc.Store(id="expanded-groups-store", data=[]),
             dcc.Store(id="stylesheet-store", data=DEFAULT_STYLESHEET),
+            dcc.Store(id="search-match-store", data=[]),
+            dcc.Store(id="element-tracker-store", data=element_tracker_key),
+            dcc.Store(id="element-version-store", data=0),
+            dcc.Interval(id="live-update-interval", interval=LIVE_UPDATE_INTERVAL, disabled=not live_update),
             HEADER_HTML,
             html.Hr(style={"border-color": "white", "margin": "0"}),
             cytoscape_html,
@@ -86,8 +150,10 @@ def get_app_layout(grid: Grid) -> html.Div:
     )
 
 
-def _get_graph_layout(nodes: NodeArray) -> str:
+def _get_graph_layout(nodes: NodeArray, layout: str = "") -> str:
     """Determine the graph layout"""
+    if layout:
+        return layout
     if "x" in nodes.columns and "y" in nodes.columns:
         return "preset"
-    return "breadthfirst"
+    return "tree"
@@ -4,25 +4,36 @@
 
 from typing import Any
 
-from dash import Input, Output, callback, dash_table
+from dash import Input, Output, State, callback, dash_table
 
+from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.visualizer.layout.selection_output import (
     SELECTION_OUTPUT_HTML,
 )
+from power_grid_model_ds._core.visualizer.parsers import get_element_record
+from power_grid_model_ds._core.visualizer.server_state import get_state
 
 
 @callback(
     Output("selection-output", "children"),
     Input("cytoscape-graph", "selectedNodeData"),
     Input("cytoscape-graph", "selectedEdgeData"),
+    State("grid-store", "data"),
 )
-def display_selected_element(node_data, edge_data):
-    """Display the tapped edge data."""
+def display_selected_element(node_data, edge_data, grid_key: str | None):
+    """Display the tapped element.
+
+    The elements only contain the data that is needed to draw them, so the record is looked up in the grid on the
+    server. The element data is shown if it is not a record of the grid (e.g. an aggregated element).
+    """
     if node_data:
-        return _to_data_table(node_data.pop())
-    if edge_data:
-        return _to_data_table(edge_data.pop())
-    return SELECTION_OUTPUT_HTML
+        data = node_data.pop()
+    elif edge_data:
+        data = edge_data.pop()
+    else:
+        return SELECTION_OUTPUT_HTML
+    grid: Grid = get_state(grid_key)
+    return _to_data_table(get_element_record(grid, data) or data)
 
 
 def _to_data_table(data: dict[str, Any]):
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from dash import Input, Output, State, callback
+from dash.exceptions import PreventUpdate
+
+from power_grid_model_ds._core.visualizer.live_update import ElementTracker
+from power_grid_model_ds._core.visualizer.server_state import get_state
+
+
+@callback(
+    Output("cytoscape-graph", "elements", allow_duplicate=True),
+    Output("element-version-store", "data"),
+    Input("live-update-interval", "n_intervals"),
+    State("element-version-store", "data"),
+    State("element-tracker-store", "data"),
+    prevent_initial_call=True,
+)
+def apply_grid_changes(_, version: int, element_tracker_key: str | None):
+    """Send the changes of the elements since the version that was last sent to the browser."""
+    tracker: ElementTracker = get_state(element_tracker_key)
+    if tracker.version == version:
+        raise PreventUpdate
+    return tracker.get_changes(version)
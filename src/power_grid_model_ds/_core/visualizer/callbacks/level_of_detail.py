@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from dash import Input, Output, Patch, State, callback
+from dash.exceptions import PreventUpdate
+
+from power_grid_model_ds._core.visualizer.level_of_detail import AGGREGATE_GROUP, LevelOfDetail
+from power_grid_model_ds._core.visualizer.search import set_search_match_class
+from power_grid_model_ds._core.visualizer.server_state import get_state
+
+
+@callback(
+    Output("cytoscape-graph", "elements"),
+    Output("expanded-groups-store", "data"),
+    Input("cytoscape-graph", "tapNodeData"),
+    State("expanded-groups-store", "data"),
+    State("level-of-detail-store", "data"),
+    State("search-match-store", "data"),
+    prevent_initial_call=True,
+)
+def expand_group(node_data, expanded_groups: list[int], level_of_detail_key: str | None, search_matches: list[str]):
+    """Expand the tapped aggregated element: only the elements of its group are sent to the browser.
+
+    The elements are removed by value, so the elements that match the search have the search match class (like in
+    the browser).
+    """
+    if not node_data or node_data.get("group") != AGGREGATE_GROUP:
+        raise PreventUpdate
+    level_of_detail: LevelOfDetail = get_state(level_of_detail_key)
+    group = node_data[level_of_detail.column]
+    if group in expanded_groups:
+        raise PreventUpdate
+
+    removed, added = level_of_detail.expand(group, set(expanded_groups))
+    elements = Patch()
+    for element in set_search_match_class(removed, set(search_matches)):
+        elements.remove(element)
+    elements.extend(set_search_match_class(added, set(search_matches)))
+    return elements, expanded_groups + [group]
@@ -2,46 +2,67 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
-from dash import Input, Output, State, callback
+from dash import Input, Output, State, callback, clientside_callback
 from dash.exceptions import PreventUpdate
 
-from power_grid_model_ds._core.visualizer.layout.colors import CYTO_COLORS
-from power_grid_model_ds._core.visualizer.typing import STYLESHEET
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import SEARCH_MATCH_CLASS
+from power_grid_model_ds._core.visualizer.search import search_element_ids
+from power_grid_model_ds._core.visualizer.server_state import get_state
 
 
 @callback(
-    Output("cytoscape-graph", "stylesheet"),
+    Output("search-match-store", "data"),
     Input("search-form-group-input", "value"),
     Input("search-form-column-input", "value"),
     Input("search-form-operator-input", "value"),
     Input("search-form-value-input", "value"),
-    State("stylesheet-store", "data"),
+    State("grid-store", "data"),
 )
-def search_element(group: str, column: str, operator: str, value: str, stylesheet: STYLESHEET) -> STYLESHEET:
-    """Color the specified element red based on the input values."""
+def search_element(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    group: str, column: str, operator: str, value: str, grid_key: str | None
+) -> list[str]:
+    """Return the ids of the elements that match the input values, which are highlighted in the browser.
+
+    The search is evaluated on the grid on the server, only the ids of the matching elements are sent to the browser.
+    """
     if not group or not column or not value:
         raise PreventUpdate
 
-    # Determine if we're working with a node or an edge type
-    if group == "node":
-        style = {
-            "background-color": CYTO_COLORS["highlighted"],
-            "text-background-color": CYTO_COLORS["highlighted"],
-        }
-    else:
-        style = {"line-color": CYTO_COLORS["highlighted"], "target-arrow-color": CYTO_COLORS["highlighted"]}
-
-    if column == "id":
-        selector = f'[{column} {operator} "{value}"]'
-    else:
-        selector = f"[{column} {operator} {value}]"
-
-    new_style = {
-        "selector": selector,
-        "style": style,
-    }
-    updated_stylesheet = stylesheet + [new_style]
-    return updated_stylesheet
+    grid: Grid = get_state(grid_key)
+    return search_element_ids(grid, group, column, operator, value)
+
+
+# Sets the search match class on the matching elements (and removes it from the others) in the browser, so that the
+# elements do not have to be sent back and forth. Runs again after live updates, as these replace elements.
+clientside_callback(
+    f"""
+    function(elementIds, version, elements) {{
+        const matches = new Set(elementIds || []);
+        let isChanged = false;
+        const newElements = elements.map(function(element) {{
+            const isMatch = matches.has(element.data.id);
+            if (isMatch === (element.classes === "{SEARCH_MATCH_CLASS}")) {{
+                return element;
+            }}
+            isChanged = true;
+            const newElement = Object.assign({{}}, element);
+            if (isMatch) {{
+                newElement.classes = "{SEARCH_MATCH_CLASS}";
+            }} else {{
+                delete newElement.classes;
+            }}
+            return newElement;
+        }});
+        return isChanged ? newElements : window.dash_clientside.no_update;
+    }}
+    """,
+    Output("cytoscape-graph", "elements", allow_duplicate=True),
+    Input("search-match-store", "data"),
+    Input("element-version-store", "data"),
+    State("cytoscape-graph", "elements"),
+    prevent_initial_call=True,
+)
 
 
 @callback(
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Server-side graph layouts of the visualizer.
+
+The positions of the nodes are calculated once in Python (instead of by Cytoscape in the browser on every page load)
+and are cached by the topology of the grid and the node types (which determine the substation nodes).
+"""
+
+from collections import OrderedDict
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.arrays.base._fingerprint import get_fingerprint
+from power_grid_model_ds._core.model.enums.nodes import NodeType
+from power_grid_model_ds._core.model.grids._columnar_cache import get_topology_fingerprint
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import NODE_SIZE
+
+SERVER_SIDE_LAYOUTS = ("tree", "force")
+
+X_SPACING = 1.5 * NODE_SIZE
+Y_SPACING = 3 * NODE_SIZE
+_MAX_CACHE_SIZE = 8
+_CACHE: OrderedDict[tuple[str, str, str], NDArray[np.float64]] = OrderedDict()
+
+
+def get_node_positions(grid: Grid, layout: Literal["tree", "force"] = "tree") -> NDArray[np.float64]:
+    """Return the positions (x, y) of the nodes in grid.node, with y pointing up (like the x and y columns of nodes).
+
+    Args:
+        grid: the grid
+        layout: the layout
+            - "tree": a tree per substation (from the active graph), with the substation node on top.
+                Nodes that are not connected to a substation node are placed in a row below the trees.
+            - "force": the tree layout, in which the nodes on cycles (meshed parts) of the active graph are placed with
+                a force-directed layout. Substation nodes stay in place.
+    """
+    if layout not in SERVER_SIDE_LAYOUTS:
+        raise ValueError(f"Unknown layout {layout}, choose from {SERVER_SIDE_LAYOUTS}")
+    key = (get_topology_fingerprint(grid), get_fingerprint(grid.node.node_type), layout)
+    if key not in _CACHE:
+        positions = get_tree_layout(grid)
+        if layout == "force":
+            edges, on_cycle = _get_meshed_edges(grid)
+            is_substation = grid.node.node_type == NodeType.SUBSTATION_NODE.value
+            positions = get_force_directed_layout(positions, edges, movable=on_cycle & ~is_substation)
+        _CACHE[key] = positions
+        if len(_CACHE) > _MAX_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    _CACHE.move_to_end(key)
+    return _CACHE[key].copy()
+
+
+def get_tree_layout(grid: Grid) -> NDArray[np.float64]:
+    """Return the positions of the nodes in a tree layout of the feeder tree.
+
+    The leaves of each tree get consecutive x positions in depth-first order, a node is centered above the leaves
+    of its subtree and the y position is given by its depth.
+    """
+    feeder_tree = grid.feeder_tree
+    is_leaf = (feeder_tree.exit - feeder_tree.entry) == 1
+    # number of leaves before each position of the depth-first ordering
+    leaves_before = np.concatenate([[0], np.cumsum(is_leaf[feeder_tree.order])])
+    x_tree = (leaves_before[feeder_tree.entry] + leaves_before[feeder_tree.exit] - 1) / 2
+
+    positions = np.zeros((grid.node.size, 2), dtype=np.float64)
+    tree_positions = feeder_tree._get_positions(grid.node.id)  # pylint: disable=protected-access
+    in_tree = tree_positions >= 0
+    positions[in_tree, 0] = x_tree[tree_positions[in_tree]]
+    positions[in_tree, 1] = -feeder_tree.depths[tree_positions[in_tree]]
+    positions[~in_tree, 0] = np.arange(np.count_nonzero(~in_tree))
+    positions[~in_tree, 1] = -feeder_tree.depths.max(initial=0) - 2
+    return positions * [X_SPACING, Y_SPACING]
+
+
+def get_force_directed_layout(  # pylint: disable=too-many-arguments,too-many-locals
+    positions: NDArray[np.float64],
+    edges: NDArray[np.int64],
+    movable: NDArray[np.bool_],
+    *,
+    iterations: int = 50,
+    max_pivots: int = 500,
+    seed: int = 0,
+) -> NDArray[np.float64]:
+    """Move the movable nodes with a (Fruchterman-Reingold) force-directed layout, the other nodes are fixed.
+
+    Edges attract the nodes they connect, the movable nodes repel each other. For many movable nodes, the repulsion
+    is estimated from a random sample of max_pivots nodes per iteration.
+
+    Args:
+        positions: the initial positions (shape: (nr_nodes, 2))
+        edges: the edges as pairs of indices of the positions (shape: (nr_edges, 2))
+        movable: whether each node can be moved
+        iterations: the number of iterations
+        max_pivots: the maximum number of nodes to calculate the repulsion from per iteration
+        seed: the seed of the pivot sampling
+    """
+    positions = positions.copy()
+    movable_indices = np.flatnonzero(movable)
+    if not movable_indices.size:
+        return positions
+    edges = edges[np.any(movable[edges], axis=1)]
+    rng = np.random.default_rng(seed)
+    ideal_length = X_SPACING
+    initial_temperature = ideal_length * np.sqrt(movable_indices.size)
+    chunks = np.array_split(movable_indices, int(np.ceil(movable_indices.size / 1000)))
+
+    for iteration in range(iterations):
+        displacement = np.zeros_like(positions)
+        pivots = movable_indices
+        if pivots.size > max_pivots:
+            pivots = rng.choice(movable_indices, max_pivots, replace=False)
+        repulsion_scale = ideal_length**2 * movable_indices.size / pivots.size
+        for chunk in chunks:
+            displacement[chunk] += _get_repulsion(positions, chunk, pivots) * repulsion_scale
+
+        delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+        attraction = delta * np.linalg.norm(delta, axis=1, keepdims=True) / ideal_length
+        np.subtract.at(displacement, edges[:, 0], attraction)
+        np.add.at(displacement, edges[:, 1], attraction)
+
+        # the displacement is limited by a temperature that decreases linearly
+        temperature = initial_temperature * (1 - iteration / iterations)
+        length = np.maximum(np.linalg.norm(displacement[movable_indices], axis=1, keepdims=True), 1e-9)
+        positions[movable_indices] += displacement[movable_indices] / length * np.minimum(length, temperature)
+    return positions
+
+
+def _get_repulsion(positions: NDArray[np.float64], indices: NDArray[np.int64], pivots: NDArray[np.int64]) -> NDArray:
+    """Return the sum of the repulsion (delta / distance**2) of the pivots on the nodes at the indices"""
+    x, y = positions[:, 0], positions[:, 1]
+    delta_x = x[indices, np.newaxis] - x[pivots]
+    delta_y = y[indices, np.newaxis] - y[pivots]
+    inverse_squared_distance = 1 / np.maximum(delta_x**2 + delta_y**2, 1e-2)
+    return np.column_stack(
+        [
+            np.einsum("ij,ij->i", delta_x, inverse_squared_distance),
+            np.einsum("ij,ij->i", delta_y, inverse_squared_distance),
+        ]
+    )
+
+
+def _get_meshed_edges(grid: Grid) -> tuple[NDArray[np.int64], NDArray[np.bool_]]:
+    """Return the edges of the active graph (as indices of grid.node) and whether each node is on a cycle"""
+    graph = grid.graphs.active_graph
+    sorter = np.argsort(grid.node.id)
+    edges = graph.get_edges()
+    edges = sorter[np.searchsorted(grid.node.id, edges, sorter=sorter)].reshape(-1, 2)
+    bridges = graph.get_bridges()
+    bridges = sorter[np.searchsorted(grid.node.id, bridges, sorter=sorter)].reshape(-1, 2)
+
+    # an edge is on a cycle if it is not a bridge
+    nr_nodes = grid.node.size
+    edge_keys = np.min(edges, axis=1) * nr_nodes + np.max(edges, axis=1)
+    bridge_keys = np.min(bridges, axis=1) * nr_nodes + np.max(bridges, axis=1)
+    on_cycle = np.zeros(nr_nodes, dtype=np.bool_)
+    on_cycle[edges[~np.isin(edge_keys, bridge_keys)].ravel()] = True
+    return edges, on_cycle
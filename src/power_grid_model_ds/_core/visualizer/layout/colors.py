@@ -13,5 +13,6 @@ CYTO_COLORS = {
     "substation_node": "purple",
     "open_branch": "#c9c9c9",
     "highlighted": "#a10000",
+    "aggregate": "#7fb3d5",
 }
 BACKGROUND_COLOR = "#555555"
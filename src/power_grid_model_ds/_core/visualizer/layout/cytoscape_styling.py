@@ -8,6 +8,7 @@ from power_grid_model_ds._core.visualizer.layout.colors import CYTO_COLORS
 
 NODE_SIZE = 100
 BRANCH_WIDTH = 10
+SEARCH_MATCH_CLASS = "search-match"
 
 _BRANCH_STYLE = {
     "selector": "edge",
@@ -98,6 +99,25 @@ _OPEN_TO_SIDE_BRANCH_STYLE = {
         "target-arrow-fill": "hollow",
     },
 }
+_AGGREGATE_STYLE = {
+    "selector": "node[group = 'aggregate']",
+    "style": {
+        "shape": "round-rectangle",
+        "background-color": CYTO_COLORS["aggregate"],
+        "text-background-color": CYTO_COLORS["aggregate"],
+        "width": NODE_SIZE * 1.5,
+        "height": NODE_SIZE * 1.5,
+    },
+}
+_SEARCH_MATCH_STYLE = {
+    "selector": f".{SEARCH_MATCH_CLASS}",
+    "style": {
+        "background-color": CYTO_COLORS["highlighted"],
+        "text-background-color": CYTO_COLORS["highlighted"],
+        "line-color": CYTO_COLORS["highlighted"],
+        "target-arrow-color": CYTO_COLORS["highlighted"],
+    },
+}
 
 
 DEFAULT_STYLESHEET = [
@@ -112,4 +132,6 @@ DEFAULT_STYLESHEET = [
     _OPEN_BRANCH_STYLE,
     _OPEN_FROM_SIDE_BRANCH_STYLE,
     _OPEN_TO_SIDE_BRANCH_STYLE,
+    _AGGREGATE_STYLE,
+    _SEARCH_MATCH_STYLE,
 ]
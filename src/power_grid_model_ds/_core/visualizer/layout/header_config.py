@@ -39,6 +39,7 @@ _SCALING_DIV = html.Div(NODE_SCALE_HTML + EDGE_SCALE_HTML, style={"margin": "0 2
 class LayoutOptions(Enum):
     """Cytoscape layout options."""
 
+    PRESET = "preset"  # the positions of the elements (coordinates or the server-side layout)
     RANDOM = "random"
     CIRCLE = "circle"
     CONCENTRIC = "concentric"
@@ -51,7 +52,7 @@ _LAYOUT_DROPDOWN = html.Div(
     dcc.Dropdown(
         id="dropdown-update-layout",
         placeholder="Select layout",
-        value=LayoutOptions.BREADTHFIRST.value,
+        value=LayoutOptions.PRESET.value,
         clearable=False,
         options=[{"label": option.value, "value": option.value} for option in LayoutOptions],
         style={"width": "200px"},
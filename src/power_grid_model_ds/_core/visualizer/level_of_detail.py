@@ -0,0 +1,201 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Level of detail of the visualizer: aggregation of feeders or substation areas into single elements."""
+
+from typing import Any, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.parsers import parse_branch3_array, parse_branch_array, parse_node_array
+from power_grid_model_ds.arrays import Branch3Array, BranchArray
+
+AGGREGATE_GROUP = "aggregate"
+
+_NO_GROUP = np.iinfo(np.int64).min
+_GROUP_COLUMNS = {"feeder": "feeder_branch_id", "substation": "feeder_node_id"}
+# the data of an edge to an aggregated element, the other columns of the branch are left out
+_AGGREGATED_EDGE_KEYS = ("id", "source", "target", "group", "from_status", "to_status")
+
+
+class LevelOfDetail:  # pylint: disable=too-many-instance-attributes
+    """Aggregates the nodes of each feeder (or substation area) into a single element.
+
+    The grid is shown with one aggregated element per group, with summary data (number of nodes and branches and the
+    total specified load). Branches within a group are hidden, branches between groups are connected to the aggregated
+    elements. Groups can be expanded one by one, for which only the elements of the group are parsed.
+
+    Nodes without a feeder (e.g. substation nodes) are never aggregated.
+    """
+
+    def __init__(
+        self,
+        grid: Grid,
+        aggregate_by: Literal["feeder", "substation"] = "feeder",
+        positions: NDArray[np.float64] | None = None,
+    ):
+        """
+        Args:
+            grid: the grid. Its feeder ids are (re)calculated with grid.set_feeder_ids().
+            aggregate_by: whether to aggregate per feeder (feeder_branch_id) or per substation area (feeder_node_id)
+            positions: the positions of the nodes (shape: (nr_nodes, 2)). Defaults to the x and y columns (if any).
+        """
+        if aggregate_by not in _GROUP_COLUMNS:
+            raise ValueError(f"Cannot aggregate by {aggregate_by}, choose from {list(_GROUP_COLUMNS)}")
+        self.grid = grid
+        self.aggregate_by = aggregate_by
+        self.column = _GROUP_COLUMNS[aggregate_by]
+        if positions is None and "x" in grid.node.columns and "y" in grid.node.columns:
+            positions = np.column_stack([grid.node.x, grid.node.y])
+        self.positions = positions
+        grid.set_feeder_ids()
+
+        is_grouped = ~grid.node.is_empty(self.column)
+        self._node_sorter = np.argsort(grid.node.id)
+        self._node_groups = np.where(is_grouped, grid.node[self.column].astype(np.int64), _NO_GROUP)
+        self._groups_by_node = dict(
+            zip(grid.node.id[is_grouped].astype(str).tolist(), grid.node[self.column][is_grouped].tolist())
+        )
+        self._branch_arrays: list[tuple[BranchArray | Branch3Array, str, NDArray[np.int64]]] = [
+            (array, group, self._get_branch_groups(array))
+            for array, group in (
+                (grid.line, "line"),
+                (grid.link, "link"),
+                (grid.transformer, "transformer"),
+                (grid.three_winding_transformer, "transformer"),
+            )
+        ]
+        self._aggregated_elements = {
+            element["data"][self.column]: element for element in self._get_aggregated_elements()
+        }
+
+    @property
+    def groups(self) -> list[int]:
+        """The ids of the groups (the feeder branch ids or the substation node ids)"""
+        return list(self._aggregated_elements)
+
+    def get_aggregate_id(self, group: int) -> str:
+        """Return the element id of the aggregated element of a group"""
+        return f"{self.aggregate_by}_{group}"
+
+    def get_elements(self) -> list[dict[str, Any]]:
+        """Return the elements with all groups aggregated"""
+        elements = self._parse_nodes(self._node_groups == _NO_GROUP) + list(self._aggregated_elements.values())
+        for array, group, branch_groups in self._branch_arrays:
+            is_visible = ~_is_internal(branch_groups)
+            elements += self._to_visible_edges(self._parse_branches(array[is_visible], group), expanded_groups=set())
+        return elements
+
+    def expand(self, group: int, expanded_groups: set[int]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Expand a group: return the elements to remove and the elements to add.
+
+        Args:
+            group: the group to expand
+            expanded_groups: the groups that have been expanded already
+        """
+        removed = [self._aggregated_elements[group]]
+        added = self._parse_nodes(self._node_groups == group)
+        for array, branch_group, branch_groups in self._branch_arrays:
+            touches_group = np.any(branch_groups == group, axis=1)
+            is_visible = touches_group & ~_is_internal(branch_groups)
+            removed += self._to_visible_edges(self._parse_branches(array[is_visible], branch_group), expanded_groups)
+            edges = self._parse_branches(array[touches_group], branch_group)
+            added += self._to_visible_edges(edges, expanded_groups | {group})
+        return removed, added
+
+    def _get_aggregated_elements(self) -> list[dict[str, Any]]:
+        is_grouped = self._node_groups != _NO_GROUP
+        groups, node_indices, nr_nodes = np.unique(
+            self._node_groups[is_grouped], return_inverse=True, return_counts=True
+        )
+
+        nr_branches = np.zeros(groups.size, dtype=np.int64)
+        for _, _, branch_groups in self._branch_arrays:
+            internal_groups = branch_groups[_is_internal(branch_groups), 0]
+            nr_branches += np.bincount(np.searchsorted(groups, internal_groups), minlength=groups.size)
+
+        p_specified = self._get_total_load(groups)
+        elements = [
+            {
+                "data": {
+                    "id": self.get_aggregate_id(group),
+                    "group": AGGREGATE_GROUP,
+                    self.column: group,
+                    "nr_nodes": nodes,
+                    "nr_branches": branches,
+                    "p_specified": p,
+                }
+            }
+            for group, nodes, branches, p in zip(
+                groups.tolist(), nr_nodes.tolist(), nr_branches.tolist(), p_specified.tolist()
+            )
+        ]
+        if self.positions is not None:
+            # the aggregated element is positioned at the center of its nodes
+            x = np.bincount(node_indices, weights=self.positions[is_grouped, 0]) / nr_nodes
+            y = np.bincount(node_indices, weights=self.positions[is_grouped, 1]) / nr_nodes
+            for element, element_x, element_y in zip(elements, x.tolist(), (-y).tolist()):
+                element["position"] = {"x": element_x, "y": element_y}
+        return elements
+
+    def _parse_nodes(self, mask: NDArray[np.bool_]) -> list[dict[str, Any]]:
+        positions = None if self.positions is None else self.positions[mask]
+        return parse_node_array(self.grid.node[mask], positions=positions)
+
+    def _get_total_load(self, groups: NDArray[np.int64]) -> NDArray:
+        """Return the total specified active power of the loads per group"""
+        load_groups = self._get_node_groups(self.grid.sym_load.node)
+        has_group = np.isin(load_groups, groups)
+        return np.bincount(
+            np.searchsorted(groups, load_groups[has_group]),
+            weights=np.nan_to_num(self.grid.sym_load.p_specified[has_group]),
+            minlength=groups.size,
+        )
+
+    def _to_visible_edges(self, edges: list[dict[str, Any]], expanded_groups: set[int]) -> list[dict[str, Any]]:
+        """Connect the edges to the aggregated elements of the groups that are not expanded"""
+        visible_edges = []
+        for edge in edges:
+            data = edge["data"]
+            source, target = (
+                self._get_visible_id(data["source"], expanded_groups),
+                self._get_visible_id(data["target"], expanded_groups),
+            )
+            if source == data["source"] and target == data["target"]:
+                visible_edges.append(edge)
+                continue
+            data = {key: data[key] for key in _AGGREGATED_EDGE_KEYS if key in data}
+            visible_edges.append({"data": {**data, "source": source, "target": target}})
+        return visible_edges
+
+    def _get_visible_id(self, node_id: str, expanded_groups: set[int]) -> str:
+        group = self._groups_by_node.get(node_id)
+        if group is None or group in expanded_groups:
+            return node_id
+        return self.get_aggregate_id(group)
+
+    def _get_branch_groups(self, array: BranchArray | Branch3Array) -> NDArray[np.int64]:
+        """Return the groups of the nodes of each branch (shape: (nr_branches, nr_nodes_per_branch))"""
+        node_columns = ("node_1", "node_2", "node_3") if isinstance(array, Branch3Array) else ("from_node", "to_node")
+        return np.column_stack([self._get_node_groups(array[column]) for column in node_columns]).reshape(
+            array.size, len(node_columns)
+        )
+
+    def _get_node_groups(self, node_ids: NDArray) -> NDArray[np.int64]:
+        indices = self._node_sorter[np.searchsorted(self.grid.node.id, node_ids, sorter=self._node_sorter)]
+        return self._node_groups[indices]
+
+    @staticmethod
+    def _parse_branches(array: BranchArray | Branch3Array, group: Any) -> list[dict[str, Any]]:
+        if isinstance(array, Branch3Array):
+            return parse_branch3_array(array, group)
+        return parse_branch_array(array, group)
+
+
+def _is_internal(branch_groups: NDArray[np.int64]) -> NDArray[np.bool_]:
+    """Whether all nodes of each branch are in the same group"""
+    is_grouped = branch_groups[:, 0] != _NO_GROUP
+    return is_grouped & np.all(branch_groups == branch_groups[:, :1], axis=1)
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Live updates of the visualizer: changes of the grid are sent to a running app as element diffs.
+
+The elements are compared with a snapshot of the arrays of the grid (column by column), only the elements of the
+changed records are parsed and sent to the browser. Only the columns that the elements are parsed from are compared
+(e.g. the statuses of the branches), as the other columns are looked up in the grid when an element is selected.
+"""
+
+from threading import Lock
+from typing import Any
+from weakref import WeakSet
+
+import numpy as np
+from dash import Patch
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.parsers import (
+    get_element_columns,
+    get_element_ids,
+    parse_branch3_array,
+    parse_branch_array,
+    parse_node_array,
+)
+from power_grid_model_ds.arrays import Branch3Array, NodeArray
+
+# the arrays that are visualized, with the group of their elements
+_GROUPS = {
+    "node": "node",
+    "line": "line",
+    "link": "link",
+    "transformer": "transformer",
+    "three_winding_transformer": "transformer",
+}
+# records of which these columns change are replaced (removed and added) instead of updated
+_REPLACED_COLUMNS = ("from_node", "to_node", "node_1", "node_2", "node_3")
+_MAX_CHANGES = 100
+
+# the trackers are referenced weakly: a tracker (and its snapshots) is released together with the state of its app
+_TRACKERS: WeakSet["ElementTracker"] = WeakSet()
+
+
+class ElementTracker:
+    """Keeps track of the elements of a grid that are shown in the browser.
+
+    Each update of the tracker compares the grid with a snapshot of its arrays and records the changes as operations
+    on the elements (by index): remove, replace and append. A browser that has seen version v of the elements only
+    needs the operations after v.
+    """
+
+    def __init__(self, grid: Grid, positions: NDArray[np.float64] | None = None):
+        """
+        Args:
+            grid: the grid. Changes are detected by comparing it with a snapshot of the arrays at the last update.
+            positions: the positions of the nodes (shape: (nr_nodes, 2)). Defaults to the x and y columns (if any).
+                Nodes that are added later are positioned by their x and y columns (if any).
+        """
+        self.grid = grid
+        self.version = 0
+        self._lock = Lock()
+        self._snapshots = {name: getattr(grid, name).data.copy() for name in _GROUPS}
+        self._elements = parse_node_array(grid.node, positions=positions)
+        for name, group in _GROUPS.items():
+            if name != "node":
+                self._elements += _parse(getattr(grid, name), group)
+        self._indices = {element["data"]["id"]: index for index, element in enumerate(self._elements)}
+        # the operations per version, see get_changes()
+        self._changes: list[tuple[int, list[tuple[Any, ...]]]] = []
+
+    @property
+    def elements(self) -> list[dict[str, Any]]:
+        """The current elements"""
+        return self._elements
+
+    def update(self) -> int:
+        """Detect the changes of the grid since the last update.
+
+        Returns:
+            the number of changed elements
+        """
+        with self._lock:
+            removed_ids: list[str] = []
+            added: list[dict[str, Any]] = []
+            operations: list[tuple[Any, ...]] = []
+            for name, group in _GROUPS.items():
+                array = getattr(self.grid, name)
+                removed, is_added, is_changed = _compare(self._snapshots[name], array.data, get_element_columns(array))
+                self._snapshots[name] = array.data.copy()
+                removed_ids += get_element_ids(array.__class__(data=removed))
+                added += _parse(array[is_added], group)
+                operations += self._replace_elements(_parse(array[is_changed], group))
+            operations += self._remove_elements(removed_ids)
+            nr_changed = len(operations) + len(added)
+            if added:
+                operations.append(("extend", added))
+                self._indices.update(
+                    {element["data"]["id"]: len(self._elements) + i for i, element in enumerate(added)}
+                )
+                self._elements += added
+
+            if operations:
+                self.version += 1
+                self._changes.append((self.version, operations))
+                del self._changes[:-_MAX_CHANGES]
+            return nr_changed
+
+    def get_changes(self, version: int) -> tuple[Patch | list[dict[str, Any]], int]:
+        """Return the changes of the elements since a version, and the current version.
+
+        The changes are a Patch of the elements, or all elements if the changes since the version are no longer
+        available.
+        """
+        with self._lock:
+            if self._changes and version < self._changes[0][0] - 1:
+                return list(self._elements), self.version
+            patch = Patch()
+            for change_version, operations in self._changes:
+                if change_version <= version:
+                    continue
+                for operation in operations:
+                    if operation[0] == "set":
+                        patch[operation[1]] = operation[2]
+                    elif operation[0] == "delete":
+                        del patch[operation[1]]
+                    else:
+                        patch.extend(operation[1])
+            return patch, self.version
+
+    def _replace_elements(self, elements: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+        """Replace elements by id, nodes keep their position"""
+        operations = []
+        for element in elements:
+            index = self._indices[element["data"]["id"]]
+            if "position" in self._elements[index]:
+                element["position"] = self._elements[index]["position"]
+            self._elements[index] = element
+            operations.append(("set", index, element))
+        return operations
+
+    def _remove_elements(self, element_ids: list[str]) -> list[tuple[Any, ...]]:
+        """Remove elements by id, from the last to the first so that the indices of the others stay valid"""
+        if not element_ids:
+            return []
+        indices = sorted((self._indices[element_id] for element_id in element_ids), reverse=True)
+        for index in indices:
+            del self._elements[index]
+        self._indices = {element["data"]["id"]: index for index, element in enumerate(self._elements)}
+        return [("delete", index) for index in indices]
+
+
+def register_tracker(tracker: ElementTracker) -> None:
+    """Register a tracker, so that it is updated by push_changes(tracker.grid) for as long as it is in use
+    (e.g. by a running app)."""
+    _TRACKERS.add(tracker)
+
+
+def unregister_tracker(tracker: ElementTracker) -> None:
+    """Stop updating the tracker with push_changes(tracker.grid)"""
+    _TRACKERS.discard(tracker)
+
+
+def push_changes(grid: Grid) -> int:
+    """Send the changes of a grid to the running visualizer apps of the grid (started with live_update=True).
+
+    The changes (e.g. switched branches and added or removed assets) are detected by comparing the grid with the grid
+    at the previous push. The browser receives the changed elements within a second. Other values (e.g. load flow
+    results) are not sent, they are read from the grid when an element is selected.
+
+    Returns:
+        the number of changed elements
+    """
+    return sum(tracker.update() for tracker in list(_TRACKERS) if tracker.grid is grid)
+
+
+def _compare(
+    old: np.ndarray, new: np.ndarray, columns: list[str]
+) -> tuple[np.ndarray, NDArray[np.bool_], NDArray[np.bool_]]:
+    """Compare the columns of two versions of an array by id.
+
+    Returns:
+        the removed records (of old), whether each record of new is added and whether each record of new is changed
+    """
+    if old.dtype == new.dtype and old.tobytes() == new.tobytes():
+        return old[:0], np.zeros(new.size, dtype=np.bool_), np.zeros(new.size, dtype=np.bool_)
+
+    if np.array_equal(old["id"], new["id"]):
+        # the records are in the same order (e.g. only columns are updated)
+        is_kept = np.ones(new.size, dtype=np.bool_)
+        old_kept, new_kept = old, new
+    else:
+        is_kept = np.isin(new["id"], old["id"])
+        sorter = np.argsort(old["id"])
+        old_kept = old[sorter[np.searchsorted(old["id"], new["id"][is_kept], sorter=sorter)]]
+        new_kept = new[is_kept]
+
+    is_replaced = np.zeros(new_kept.size, dtype=np.bool_)
+    is_changed = np.zeros(new_kept.size, dtype=np.bool_)
+    if old.dtype != new.dtype:
+        is_changed[:] = True
+    else:
+        for column in columns:
+            column_changed = _not_equal(old_kept[column], new_kept[column])
+            if column in _REPLACED_COLUMNS:
+                is_replaced |= column_changed
+            is_changed |= column_changed
+
+    removed = np.concatenate([old[~np.isin(old["id"], new["id"])], old_kept[is_replaced]])
+    is_added = ~is_kept
+    is_added[is_kept] = is_replaced
+    changed = np.zeros(new.size, dtype=np.bool_)
+    changed[is_kept] = is_changed & ~is_replaced
+    return removed, is_added, changed
+
+
+def _not_equal(old: np.ndarray, new: np.ndarray) -> NDArray[np.bool_]:
+    """Element-wise inequality, in which nan equals nan"""
+    if np.issubdtype(new.dtype, np.floating):
+        return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+    return old != new
+
+
+def _parse(array: Any, group: str) -> list[dict[str, Any]]:
+    if isinstance(array, NodeArray):
+        return parse_node_array(array)
+    if isinstance(array, Branch3Array):
+        return parse_branch3_array(array, group)  # type: ignore[arg-type]
+    return parse_branch_array(array, group)  # type: ignore[arg-type]
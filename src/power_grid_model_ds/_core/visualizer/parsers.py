@@ -4,25 +4,43 @@
 
 from typing import Any, Literal
 
+import numpy as np
+from numpy.typing import NDArray
+
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds.arrays import Branch3Array, BranchArray, NodeArray
 
+# the columns that are sent to the browser in the data of the elements, as they are used by the stylesheet.
+# The other columns are looked up in the grid when an element is selected (see get_element_record).
+_NODE_DATA_COLUMNS = ("node_type",)
+_BRANCH_DATA_COLUMNS = ("from_status", "to_status")
+# the arrays of the records of the elements per group
+_GROUP_ARRAYS = {
+    "node": ("node",),
+    "line": ("line",),
+    "link": ("link",),
+    "transformer": ("transformer", "three_winding_transformer"),
+}
+
 
-def parse_node_array(nodes: NodeArray) -> list[dict[str, Any]]:
-    """Parse the nodes."""
-    parsed_nodes = []
+def parse_node_array(nodes: NodeArray, positions: NDArray | None = None) -> list[dict[str, Any]]:
+    """Parse the nodes.
 
-    with_coords = "x" in nodes.columns and "y" in nodes.columns
+    The nodes are positioned by the positions (shape: (nr_nodes, 2)) if given, otherwise by their x and y columns
+    (if any).
+    """
+    parsed_nodes = [
+        {"data": {**record, "id": node_id, "group": "node"}}
+        for record, node_id in zip(_array_to_dicts(nodes, _get_data_columns(nodes)), _to_strings(nodes.id))
+    ]
 
-    columns = nodes.columns
-    for node in nodes:
-        cyto_elements = {"data": _array_to_dict(node, columns)}
-        cyto_elements["data"]["id"] = str(node.id.item())
-        cyto_elements["data"]["group"] = "node"
-        if with_coords:
-            cyto_elements["position"] = {"x": node.x.item(), "y": -node.y.item()}  # invert y-axis for visualization
-        parsed_nodes.append(cyto_elements)
+    if positions is None and "x" in nodes.columns and "y" in nodes.columns:
+        positions = np.column_stack([nodes.x, nodes.y])
+    if positions is not None:
+        # invert y-axis for visualization
+        for cyto_elements, x, y in zip(parsed_nodes, positions[:, 0].tolist(), (-positions[:, 1]).tolist()):
+            cyto_elements["position"] = {"x": x, "y": y}
     return parsed_nodes
 
 
@@ -37,43 +55,86 @@ def parse_branches(grid: Grid) -> list[dict[str, Any]]:
 
 
 def parse_branch3_array(branches: Branch3Array, group: Literal["transformer"]) -> list[dict[str, Any]]:
-    """Parse the three-winding transformer array."""
-    parsed_branches = []
-    columns = branches.columns
-    for branch3 in branches:
-        for branch1 in branch3.as_branches():
-            cyto_elements = {"data": _array_to_dict(branch1, columns)}
-            cyto_elements["data"].update(
-                {
-                    # IDs need to be unique, so we combine the branch ID with the from and to nodes
-                    "id": str(branch3.id.item()) + f"_{branch1.from_node.item()}_{branch1.to_node.item()}",
-                    "source": str(branch1.from_node.item()),
-                    "target": str(branch1.to_node.item()),
-                    "group": group,
-                }
-            )
-            parsed_branches.append(cyto_elements)
-    return parsed_branches
+    """Parse the three-winding transformer array.
+
+    Each three-winding transformer is parsed into three edges (node_1-node_2, node_1-node_3 and node_2-node_3).
+    """
+    node_1, node_2, node_3 = _to_strings(branches.node_1), _to_strings(branches.node_2), _to_strings(branches.node_3)
+    return [
+        {
+            "data": {
+                # IDs need to be unique, so we combine the branch ID with the from and to nodes
+                "id": f"{branch_id}_{from_node}_{to_node}",
+                "source": from_node,
+                "target": to_node,
+                "group": group,
+            }
+        }
+        for branch_id, nodes in zip(_to_strings(branches.id), zip(node_1, node_2, node_3))
+        for from_node, to_node in ((nodes[0], nodes[1]), (nodes[0], nodes[2]), (nodes[1], nodes[2]))
+    ]
 
 
 def parse_branch_array(branches: BranchArray, group: Literal["line", "link", "transformer"]) -> list[dict[str, Any]]:
     """Parse the branch array."""
-    parsed_branches = []
-    columns = branches.columns
-    for branch in branches:
-        cyto_elements = {"data": _array_to_dict(branch, columns)}
-        cyto_elements["data"].update(
-            {
-                "id": str(branch.id.item()),
-                "source": str(branch.from_node.item()),
-                "target": str(branch.to_node.item()),
-                "group": group,
-            }
+    return [
+        {"data": {**record, "id": branch_id, "source": from_node, "target": to_node, "group": group}}
+        for record, branch_id, from_node, to_node in zip(
+            _array_to_dicts(branches, _get_data_columns(branches)),
+            _to_strings(branches.id),
+            _to_strings(branches.from_node),
+            _to_strings(branches.to_node),
         )
-        parsed_branches.append(cyto_elements)
-    return parsed_branches
+    ]
+
+
+def get_element_ids(array: NodeArray | BranchArray | Branch3Array) -> list[str]:
+    """Return the ids of the elements that the records are parsed into, in the order of the parsers."""
+    if not isinstance(array, Branch3Array):
+        return _to_strings(array.id)
+    return [
+        f"{branch_id}_{from_node}_{to_node}"
+        for branch_id, nodes in zip(
+            _to_strings(array.id), zip(_to_strings(array.node_1), _to_strings(array.node_2), _to_strings(array.node_3))
+        )
+        for from_node, to_node in ((nodes[0], nodes[1]), (nodes[0], nodes[2]), (nodes[1], nodes[2]))
+    ]
+
+
+def get_element_columns(array: NodeArray | BranchArray | Branch3Array) -> list[str]:
+    """Return the columns (besides the id) that the elements of the records are parsed from."""
+    if isinstance(array, Branch3Array):
+        return ["node_1", "node_2", "node_3"]
+    if isinstance(array, BranchArray):
+        return ["from_node", "to_node", *_get_data_columns(array)]
+    return _get_data_columns(array)
+
+
+def get_element_record(grid: Grid, data: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the record (with all columns) of an element by its data, or None if the element is not a record of the
+    grid (e.g. an aggregated element or a record that has been removed since)."""
+    if data.get("group") not in _GROUP_ARRAYS:
+        return None
+    # the elements of a three-winding transformer have the id <branch3 id>_<from node>_<to node>
+    record_id = int(str(data["id"]).split("_", maxsplit=1)[0])
+    for array_name in _GROUP_ARRAYS[data["group"]]:
+        records = getattr(grid, array_name).filter(id=record_id)
+        if records.size:
+            return _array_to_dicts(records, records.columns)[0]
+    return None
+
+
+def _get_data_columns(array: FancyArray) -> list[str]:
+    data_columns = _BRANCH_DATA_COLUMNS if isinstance(array, BranchArray) else _NODE_DATA_COLUMNS
+    return [column for column in data_columns if column in array.columns]
+
+
+def _array_to_dicts(array: FancyArray, columns: list[str]) -> list[dict[str, Any]]:
+    """Convert the records to dicts of python values (required by Dash), column by column."""
+    if not columns:
+        return [{} for _ in range(array.size)]
+    return [dict(zip(columns, row)) for row in zip(*(array.data[column].tolist() for column in columns))]
 
 
-def _array_to_dict(array_record: FancyArray, columns: list[str]) -> dict[str, Any]:
-    """Stringify the record (required by Dash)."""
-    return dict(zip(columns, array_record.tolist().pop()))
+def _to_strings(values: NDArray) -> list[str]:
+    return values.astype(str).tolist()
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Server-side search of the visualizer.
+
+The search form is evaluated on the arrays of the grid (instead of by Cytoscape in the browser on every element),
+so only the ids of the matching elements are sent to the browser. There, the matching elements get the search match
+class, which is highlighted by the stylesheet.
+"""
+
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from power_grid_model_ds._core.model.arrays.base.array import FancyArray
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import SEARCH_MATCH_CLASS
+from power_grid_model_ds._core.visualizer.parsers import get_element_ids
+
+_COMPARISONS = {"<": np.less, ">": np.greater}
+
+
+def search_element_ids(
+    grid: Grid,
+    group: str,
+    column: str,
+    operator: str,
+    value: str,
+) -> list[str]:
+    """Return the ids of the elements (as parsed by the visualizer) for which 'column operator value' holds.
+
+    Args:
+        grid: the grid
+        group: the group of the elements ("node", "line", "link", "transformer" or "branch")
+        column: the column to search on
+        operator: the comparison ("=", "!=", "<" or ">")
+        value: the value to compare with, as entered in the search form
+
+    Returns an empty list if the group has no such column or the value cannot be converted to the type of the column.
+    """
+    element_ids: list[str] = []
+    for array in _get_search_arrays(grid, group):
+        if column not in array.columns:
+            continue
+        mask = _get_search_mask(array, column, operator, value)
+        if mask is None:
+            return []
+        element_ids += get_element_ids(array[mask])
+    return element_ids
+
+
+def set_search_match_class(elements: list[dict[str, Any]], element_ids: set[str]) -> list[dict[str, Any]]:
+    """Return (copies of) the elements, in which the elements with the ids have the search match class, like the
+    elements in the browser."""
+    return [
+        {**element, "classes": SEARCH_MATCH_CLASS} if element["data"]["id"] in element_ids else element
+        for element in elements
+    ]
+
+
+def _get_search_arrays(grid: Grid, group: str) -> list[FancyArray]:
+    if group == "node":
+        return [grid.node]
+    if group == "transformer":
+        return [grid.transformer, grid.three_winding_transformer]
+    if group == "branch":
+        return [grid.branches]
+    if group in ("line", "link"):
+        return [getattr(grid, group)]
+    raise ValueError(f"Cannot search {group}")
+
+
+def _get_search_mask(array: FancyArray, column: str, operator: str, value: str) -> NDArray[np.bool_] | None:
+    """Return the mask of the records that match, or None if the value does not fit the column"""
+    try:
+        typed_value = np.array([value]).astype(array.dtype[column])
+    except (ValueError, OverflowError):
+        return None
+    filters: dict[str, Any] = {column: typed_value}
+    if operator == "=":
+        return array.filter_mask(**filters)
+    if operator == "!=":
+        return array.exclude_mask(**filters)
+    if operator in _COMPARISONS:
+        return _COMPARISONS[operator](array[column], typed_value[0])
+    raise ValueError(f"Unknown operator {operator}")
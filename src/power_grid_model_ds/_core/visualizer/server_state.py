@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Server-side state of the visualizer.
+
+Callbacks only receive the data that is sent by the browser. Objects that are too large to send to the browser
+(e.g. the grid) are registered on the server under a key, and only the key is stored in the app layout.
+
+The registry is bounded: when more than MAX_STATES objects are registered, the least recently used objects are
+released, so that the grids of apps that are no longer used (e.g. earlier visualize calls in a notebook) can be
+garbage collected.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any
+from uuid import uuid4
+
+from dash.exceptions import PreventUpdate
+
+MAX_STATES = 16
+
+_STATES: OrderedDict[str, Any] = OrderedDict()
+_LOCK = Lock()
+
+
+def register_state(state: Any) -> str:
+    """Register an object on the server and return the key to retrieve it with."""
+    key = uuid4().hex
+    with _LOCK:
+        _STATES[key] = state
+        while len(_STATES) > MAX_STATES:
+            _STATES.popitem(last=False)
+    return key
+
+
+def get_state(key: str | None) -> Any:
+    """Return the object registered under the key.
+
+    Raises:
+        PreventUpdate: if there is no object registered under the key (e.g. the app was started without it, or the
+            object was released because many other objects were registered since it was last used)
+    """
+    with _LOCK:
+        if key is None or key not in _STATES:
+            raise PreventUpdate
+        _STATES.move_to_end(key)
+        return _STATES[key]
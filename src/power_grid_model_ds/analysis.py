@@ -0,0 +1,7 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from power_grid_model_ds._core.contingency_analysis import ContingencyAnalysis, ContingencyArray
+
+__all__ = ["ContingencyAnalysis", "ContingencyArray"]
@@ -6,6 +6,13 @@ from power_grid_model_ds._core.data_source.generator.arrays.line import LineGene
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.transformer import TransformerGenerator
-from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.data_source.generator.grid_generators import GridCorpusGenerator, RadialGridGenerator
 
-__all__ = ["RadialGridGenerator", "NodeGenerator", "LineGenerator", "TransformerGenerator", "SourceGenerator"]
+__all__ = [
+    "RadialGridGenerator",
+    "GridCorpusGenerator",
+    "NodeGenerator",
+    "LineGenerator",
+    "TransformerGenerator",
+    "SourceGenerator",
+]
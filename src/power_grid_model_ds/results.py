@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from power_grid_model_ds._core.result_store import (
+    CountAboveReducer,
+    CountBelowReducer,
+    MaxReducer,
+    MinReducer,
+    Reducer,
+    ResultStore,
+)
+
+__all__ = ["ResultStore", "Reducer", "MaxReducer", "MinReducer", "CountAboveReducer", "CountBelowReducer"]
@@ -4,9 +4,10 @@
 
 try:
     from power_grid_model_ds._core.visualizer.app import visualize
+    from power_grid_model_ds._core.visualizer.live_update import push_changes
 except ImportError as error:
     raise ImportError(
         "Missing dependencies for visualizer: install with 'pip install power-grid-model-ds[visualizer]'"
     ) from error
 
-__all__ = ["visualize"]
+__all__ = ["visualize", "push_changes"]
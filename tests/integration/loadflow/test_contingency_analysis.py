@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds import Grid, PowerGridModelInterface
+from power_grid_model_ds._core.contingency_analysis import _rows_in
+from power_grid_model_ds.analysis import ContingencyAnalysis
+from power_grid_model_ds.generators import RadialGridGenerator
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture(name="meshed_grid")
+def fixture_meshed_grid():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=50, nr_sources=2, nr_nops=10).run(seed=1)
+    for line_id in grid.line.id[~grid.line.is_active][:4]:
+        grid.make_active(grid.line.get(line_id))
+    return grid
+
+
+def test_contingency_analysis(meshed_grid: Grid):
+    results = ContingencyAnalysis(PowerGridModelInterface(grid=meshed_grid)).run()
+
+    assert_array_equal(np.sort(results.id), np.sort(meshed_grid.branches.id[meshed_grid.branches.is_active]))
+    calculated = results[~results.is_islanding]
+    assert calculated.size > 0
+    assert np.all(calculated.is_converged)
+
+    for contingency in calculated[:3]:
+        grid = deepcopy(meshed_grid)
+        grid.make_inactive(grid.line.get(contingency.id.item()))
+        output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+        assert contingency.max_loading.item() == pytest.approx(np.nanmax(output["line"]["loading"]))
+        assert contingency.min_u_pu.item() == pytest.approx(output["node"]["u_pu"].min())
+
+
+def test_islanding_contingencies_are_skipped(meshed_grid: Grid):
+    analysis = ContingencyAnalysis(PowerGridModelInterface(grid=meshed_grid))
+    contingencies = analysis.get_contingencies()
+
+    bridges = {frozenset(bridge) for bridge in meshed_grid.graphs.active_graph.get_bridges().tolist()}
+    for contingency in contingencies:
+        line = meshed_grid.line.get(contingency.id.item())
+        is_bridge = frozenset([line.from_node.item(), line.to_node.item()]) in bridges
+        assert contingency.is_islanding.item() == is_bridge
+
+    results = analysis.run(branch_ids=contingencies.id[contingencies.is_islanding][:2])
+    assert 2 == results.size
+    assert np.all(np.isnan(results.max_loading))
+
+
+def test_contingency_analysis_of_radial_grid():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=20, nr_sources=1, nr_nops=2).run(seed=0)
+    results = ContingencyAnalysis(PowerGridModelInterface(grid=grid)).run()
+
+    assert np.all(results.is_islanding)
+
+
+def test_rows_in_with_large_ids():
+    # combining the ids of a row as first * (max_id + 1) + second would overflow (2**31 * 2**33 == 2**64)
+    rows = np.array([[2**31, 5], [0, 5], [2**33 - 1, 2**33 - 1]])
+    other_rows = np.array([[0, 5], [2**33 - 1, 0]])
+
+    assert_array_equal(_rows_in(rows, other_rows), [False, True, False])
@@ -3,12 +3,14 @@
 # SPDX-License-Identifier: MPL-2.0
 
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 from power_grid_model import TapChangingStrategy, initialize_array
 
 from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
-from power_grid_model_ds._core.load_flow import PowerGridModelInterface
+from power_grid_model_ds._core.load_flow import PowerGridModelInterface, Profile
 from power_grid_model_ds._core.model.arrays import (
     LineArray,
     NodeArray,
@@ -189,6 +191,148 @@ class PowerGridModelInterfaceMethods:
         assert core_interface._input_data
 
 
+class TestSyncModel:
+    def test_value_changes_update_model(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        core_interface.calculate_power_flow()
+        model = core_interface.model
+
+        grid.sym_load.p_specified = grid.sym_load.p_specified * 2
+        grid.make_inactive(grid.line.get(18))
+        output = core_interface.calculate_power_flow()
+
+        assert core_interface.model is model
+        expected_output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+        assert np.allclose(output["node"]["u"], expected_output["node"]["u"])
+        assert np.allclose(output["line"]["i_from"], expected_output["line"]["i_from"])
+
+    def test_changes_through_views_update_model(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        core_interface.calculate_power_flow()
+
+        grid.sym_load.p_specified[:] = grid.sym_load.p_specified * 2
+        core_interface.sync_model(check_content=True)
+        output = core_interface.calculate_power_flow()
+
+        expected_output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+        assert np.allclose(output["node"]["u"], expected_output["node"]["u"])
+
+    def test_get_synced_model(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        model = core_interface.get_synced_model()
+        assert core_interface.model is model
+
+        grid.sym_load.p_specified = grid.sym_load.p_specified * 2
+        output = core_interface.get_synced_model().calculate_power_flow()
+
+        expected_output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+        assert np.allclose(output["node"]["u"], expected_output["node"]["u"])
+
+    def test_unchanged_arrays_are_not_compared(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        core_interface.calculate_power_flow()
+
+        grid.sym_load.update_by_id(grid.sym_load.id[:1], p_specified=0)
+        create_power_grid_array = core_interface._create_power_grid_array  # pylint: disable=protected-access
+        with patch.object(core_interface, "_create_power_grid_array", wraps=create_power_grid_array) as create_array:
+            core_interface.calculate_power_flow()
+        create_array.assert_called_once_with(array_name="sym_load")
+
+    def test_structural_changes_rebuild_model(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        core_interface.calculate_power_flow()
+        model = core_interface.model
+
+        grid.line.r1 = grid.line.r1 * 2
+        output = core_interface.calculate_power_flow()
+
+        assert core_interface.model is not model
+        expected_output = PowerGridModelInterface(grid=grid).calculate_power_flow()
+        assert np.allclose(output["node"]["u"], expected_output["node"]["u"])
+
+    def test_added_records_rebuild_model(self, simple_loadflow_grid: Grid):
+        core_interface = PowerGridModelInterface(grid=simple_loadflow_grid)
+        core_interface.calculate_power_flow()
+
+        load = simple_loadflow_grid.sym_load.copy()
+        load.id = [5]
+        simple_loadflow_grid.append(load)
+        output = core_interface.calculate_power_flow()
+
+        assert 2 == output["sym_load"].size
+
+    def test_unchanged_grid_keeps_model_updates(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        output_1 = core_interface.calculate_power_flow()
+        core_interface.update_grid()  # only changes output values of the grid
+
+        update_sym_load = initialize_array("update", "sym_load", 1)
+        update_sym_load["id"] = [12]
+        update_sym_load["p_specified"] = [30e6]
+        core_interface.update_model({"sym_load": update_sym_load})
+        output_2 = core_interface.calculate_power_flow()
+
+        assert not np.allclose(output_1["node"]["u"], output_2["node"]["u"])
+
+
+class TestCalculatePowerFlowProfiles:
+    def test_profiles_in_chunks(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        scaling = np.linspace(0, 1, 10).reshape(-1, 1)
+        profiles = [
+            Profile("sym_load", "p_specified", scaling * grid.sym_load.p_specified),
+            Profile("sym_load", "q_specified", scaling * grid.sym_load.q_specified),
+        ]
+
+        chunks = list(core_interface.calculate_power_flow_profiles(profiles, chunk_size=4, threading=2))
+
+        assert [slice(0, 4), slice(4, 8), slice(8, 10)] == [scenarios for scenarios, _ in chunks]
+        assert [4, 4, 2] == [len(output["line"]) for _, output in chunks]
+        update_sym_load = initialize_array("update", "sym_load", (10, grid.sym_load.size))
+        update_sym_load["id"] = grid.sym_load.id
+        update_sym_load["p_specified"] = profiles[0].values
+        update_sym_load["q_specified"] = profiles[1].values
+        expected_output = core_interface.calculate_power_flow(update_data={"sym_load": update_sym_load})
+        output_u = np.concatenate([output["node"]["u"] for _, output in chunks])
+        assert np.allclose(expected_output["node"]["u"], output_u)
+
+    def test_profile_with_ids(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        profile = Profile("sym_load", "p_specified", np.zeros((3, 1)), ids=grid.sym_load.id[:1])
+
+        scenarios, output = next(core_interface.calculate_power_flow_profiles([profile]))
+
+        assert slice(0, 3) == scenarios
+        assert np.all(output["sym_load"]["p"][:, 0] == 0)
+        assert np.all(output["sym_load"]["p"][:, 1:] != 0)
+
+    def test_invalid_profiles(self):
+        grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+        core_interface = PowerGridModelInterface(grid=grid)
+        nr_loads = grid.sym_load.size
+
+        # the profiles are validated when the method is called, not when the first chunk is calculated
+        with pytest.raises(ValueError):
+            core_interface.calculate_power_flow_profiles([Profile("sym_load", "p_specified", np.zeros((3, 1)))])
+        with pytest.raises(ValueError):
+            profiles = [
+                Profile("sym_load", "p_specified", np.zeros((3, nr_loads))),
+                Profile("sym_load", "q_specified", np.zeros((4, nr_loads))),
+            ]
+            core_interface.calculate_power_flow_profiles(profiles)
+        with pytest.raises(ValueError):
+            profile = Profile("sym_load", "p_specified", np.zeros((3, nr_loads)))
+            core_interface.calculate_power_flow_profiles([profile], chunk_size=0)
+
+
 class TestCreateGridFromInputData:
     def test_create_grid_from_input_data(self, input_data_pgm):
         core_interface = PowerGridModelInterface(input_data=input_data_pgm)
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds import Grid, PowerGridModelInterface, Profile
+from power_grid_model_ds.generators import RadialGridGenerator
+from power_grid_model_ds.results import CountAboveReducer, MaxReducer, MinReducer, ResultStore
+from tests.fixtures.arrays import ExtendedLineArray, ExtendedNodeArray
+
+# pylint: disable=missing-function-docstring
+
+NR_SCENARIOS = 10
+
+
+@pytest.fixture(name="core_interface")
+def fixture_core_interface():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=5, nr_sources=1, nr_nops=0).run(seed=0)
+    grid.node = ExtendedNodeArray(grid.node.data)
+    grid.line = ExtendedLineArray(grid.line.data)
+    return PowerGridModelInterface(grid=grid)
+
+
+@pytest.fixture(name="profiles")
+def fixture_profiles(core_interface: PowerGridModelInterface):
+    scaling = np.linspace(0, 2, NR_SCENARIOS).reshape(-1, 1)
+    return [Profile("sym_load", "p_specified", scaling * core_interface.grid.sym_load.p_specified)]
+
+
+def test_result_store(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path: Path):
+    store = ResultStore(
+        tmp_path,
+        NR_SCENARIOS,
+        fields={"line": ["i_from", "loading"], "node": ["u"]},
+        reducers={
+            "max_loading": MaxReducer("line", "loading"),
+            "min_u": MinReducer("node", "u"),
+            "nr_low_u": CountAboveReducer("node", "u", threshold=10_000),
+        },
+    )
+    for scenarios, output in core_interface.calculate_power_flow_profiles(profiles, chunk_size=3):
+        store.write(scenarios, output)
+    store.flush()
+    assert store.is_complete
+
+    _, expected = next(core_interface.calculate_power_flow_profiles(profiles, chunk_size=NR_SCENARIOS))
+    assert_array_equal(np.load(tmp_path / "line.loading.npy"), expected["line"]["loading"])
+    assert_array_equal(np.load(tmp_path / "line.id.npy"), core_interface.grid.line.id)
+    assert not (tmp_path / "sym_load.p.npy").exists()
+    assert_array_equal(store.statistics["max_loading"], expected["line"]["loading"].max(axis=0))
+    assert_array_equal(store.statistics["min_u"], expected["node"]["u"].min(axis=0))
+    assert_array_equal(store.statistics["nr_low_u"], np.count_nonzero(expected["node"]["u"] > 10_000, axis=0))
+
+
+def test_update_grid_from_result_store(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path):
+    store = ResultStore(tmp_path, NR_SCENARIOS, reducers={"max_i_from": MaxReducer("line", "i_from")})
+    for scenarios, output in core_interface.calculate_power_flow_profiles(profiles, chunk_size=4):
+        store.write(scenarios, output)
+
+    core_interface.update_grid(store.get_scenario(5))
+    assert_array_equal(core_interface.grid.node.u, store.data["node"]["u"][5])
+
+    core_interface.update_grid(store.get_statistic("max_i_from"))
+    assert_array_equal(core_interface.grid.line.i_from, store.statistics["max_i_from"])
+
+
+def test_count_statistic_field(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path: Path):
+    store = ResultStore(tmp_path, NR_SCENARIOS, reducers={"nr_high_u": CountAboveReducer("node", "u", threshold=0)})
+    for scenarios, output in core_interface.calculate_power_flow_profiles(profiles):
+        store.write(scenarios, output)
+    u = core_interface.grid.node.u.copy()
+
+    statistic = store.get_statistic("nr_high_u")
+    assert statistic["node"].dtype.names == ("id", "u_count_above")
+    core_interface.update_grid(statistic)
+    assert_array_equal(core_interface.grid.node.u, u)
+
+
+def test_is_complete(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path: Path):
+    store = ResultStore(tmp_path, NR_SCENARIOS)
+    _, output = next(core_interface.calculate_power_flow_profiles(profiles, chunk_size=5))
+
+    store.write(slice(0, 5), output)
+    assert not store.is_complete
+    store.write(slice(5, 10), output)
+    assert store.is_complete
+
+
+def test_update_grid_from_batch_output(core_interface: PowerGridModelInterface, profiles: list[Profile]):
+    _, output = next(core_interface.calculate_power_flow_profiles(profiles))
+
+    core_interface.update_grid(output, scenario=2)
+    assert_array_equal(core_interface.grid.node.u, output["node"]["u"][2])
+
+
+def test_write_invalid_output(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path: Path):
+    store = ResultStore(tmp_path, NR_SCENARIOS)
+    _, output = next(core_interface.calculate_power_flow_profiles(profiles))
+
+    with pytest.raises(ValueError):
+        store.write(slice(0, 5), output)
+
+
+def test_write_scenarios_twice(core_interface: PowerGridModelInterface, profiles: list[Profile], tmp_path: Path):
+    store = ResultStore(tmp_path, NR_SCENARIOS, reducers={"nr_loaded": CountAboveReducer("line", "loading", 0)})
+    _, output = next(core_interface.calculate_power_flow_profiles(profiles, chunk_size=5))
+    store.write(slice(0, 5), output)
+    nr_loaded = store.statistics["nr_loaded"].copy()
+
+    with pytest.raises(ValueError):
+        store.write(slice(3, 8), output)
+    assert_array_equal(store.statistics["nr_loaded"], nr_loaded)
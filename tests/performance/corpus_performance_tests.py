@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+"""Benchmarks on a corpus of generated grids of 10 to 1000 substation areas of 1000 nodes each.
+
+The corpus is generated once and cached in the temporary directory, so that it is not regenerated per benchmark.
+"""
+
+import tempfile
+from pathlib import Path
+
+from power_grid_model_ds import Grid
+from power_grid_model_ds._core.model.grids._columnar_cache import is_columnar_cache
+from power_grid_model_ds.generators import GridCorpusGenerator
+from tests.performance._helpers import do_performance_test
+
+# pylint: disable=missing-function-docstring
+
+CORPUS_DIR = Path(tempfile.gettempdir()) / "power_grid_model_ds_corpus"
+CORPUS_SIZES = [10, 100, 1000]  # number of areas
+NR_NODES_PER_AREA = 1000
+
+CORPUS_SETUP_CODES = {
+    "corpus": "from tests.performance.corpus_performance_tests import load_corpus;grid = load_corpus({size})",
+}
+
+
+def load_corpus(nr_areas: int) -> Grid:
+    cache_path = CORPUS_DIR / f"{nr_areas}_areas"
+    if not is_columnar_cache(cache_path):
+        generator = GridCorpusGenerator(grid_class=Grid, nr_areas=nr_areas, nr_nodes_per_area=NR_NODES_PER_AREA)
+        generator.cache(CORPUS_DIR, cache_path.name, seed=0)
+    return Grid.from_cache(cache_path)
+
+
+def perf_test_generate_corpus():
+    setup_code = {
+        "corpus": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import GridCorpusGenerator;"
+        + f"generator = GridCorpusGenerator(grid_class=Grid, nr_areas={{size}}, nr_nodes_per_area={NR_NODES_PER_AREA})"
+    }
+
+    code_to_test = ["generator.run(seed=0, build_graphs=False)"]
+
+    do_performance_test(code_to_test, CORPUS_SIZES, 1, setup_code)
+
+
+def perf_test_corpus_arrays():
+    code_to_test = [
+        "grid.node.filter(u_rated=10_500)",
+        "grid.line.get(grid.line.id[-1])",
+        "grid.sym_load[grid.sym_load.p_specified > 0]",
+        "grid.branches",
+    ]
+
+    do_performance_test(code_to_test, CORPUS_SIZES, 1, CORPUS_SETUP_CODES)
+
+
+def perf_test_corpus_graphs():
+    code_to_test = [
+        "GraphContainer.from_arrays(grid)",
+        "grid.graphs.active_graph.get_components()",
+    ]
+    setup_codes = {
+        key: code + ";from power_grid_model_ds._core.model.graphs.container import GraphContainer"
+        for key, code in CORPUS_SETUP_CODES.items()
+    }
+
+    do_performance_test(code_to_test, CORPUS_SIZES, 1, setup_codes)
+
+
+def perf_test_corpus_feeder_ids():
+    code_to_test = ["grid.set_feeder_ids()"]
+
+    do_performance_test(code_to_test, CORPUS_SIZES, 1, CORPUS_SETUP_CODES)
+
+
+def perf_test_corpus_load_flow():
+    code_to_test = ["PowerGridModelInterface(grid=grid).calculate_power_flow()"]
+    setup_codes = {
+        key: code + ";from power_grid_model_ds import PowerGridModelInterface"
+        for key, code in CORPUS_SETUP_CODES.items()
+    }
+
+    do_performance_test(code_to_test, CORPUS_SIZES, 1, setup_codes)
+
+
+if __name__ == "__main__":
+    perf_test_generate_corpus()
+    perf_test_corpus_arrays()
+    perf_test_corpus_graphs()
+    perf_test_corpus_feeder_ids()
+    perf_test_corpus_load_flow()
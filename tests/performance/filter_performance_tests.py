@@ -7,6 +7,14 @@ from tests.performance._helpers import do_performance_test
 
 # pylint: disable=missing-function-docstring
 
+ID_INDEX_SETUP_CODES = {
+    "scan": "import numpy as np;from power_grid_model_ds.arrays import NodeArray;"
+    + "input_array = NodeArray.zeros({size});input_array.id = np.arange({size})",
+    "index": "import numpy as np;from power_grid_model_ds.arrays import NodeArray;"
+    + "input_array = NodeArray.zeros({size});input_array.id = np.arange({size});input_array.enable_id_index()",
+}
+ID_INDEX_SIZES = [1_000, 100_000, 2_000_000]
+
 
 def perftest_get():
     code_to_test = {
@@ -35,7 +43,23 @@ def perftest_update_by_id():
     do_performance_test(code_to_test, ARRAY_SIZES_LARGE, SINGLE_REPEATS, ARRAY_SETUP_CODES)
 
 
+def perftest_get_id_index():
+    do_performance_test("input_array.get(id=99)", ID_INDEX_SIZES, SINGLE_REPEATS, ID_INDEX_SETUP_CODES)
+
+
+def perftest_filter_id_index():
+    do_performance_test("input_array.filter(id=[1, 99, 999])", ID_INDEX_SIZES, SINGLE_REPEATS, ID_INDEX_SETUP_CODES)
+
+
+def perftest_update_by_id_id_index():
+    code_to_test = "input_array.update_by_id(ids=[1, 99, 999], u_rated=42.0)"
+    do_performance_test(code_to_test, ID_INDEX_SIZES, SINGLE_REPEATS, ID_INDEX_SETUP_CODES)
+
+
 if __name__ == "__main__":
     perftest_get()
     perftest_filter()
     perftest_update_by_id()
+    perftest_get_id_index()
+    perftest_filter_id_index()
+    perftest_update_by_id_id_index()
@@ -33,6 +33,11 @@ def perftest_delete_node():
     do_performance_test(code_to_test, GRAPH_SIZES, 100, setup_codes=GRAPH_SETUP_CODES)
 
 
+def perftest_delete_nodes():
+    code_to_test = "grid.delete_nodes(grid.node.id[: grid.node.size // 10]);"
+    do_performance_test(code_to_test, GRAPH_SIZES, 100, setup_codes=GRAPH_SETUP_CODES)
+
+
 def perftest_from_arrays():
     code_to_test = "grid.graphs.complete_graph.__class__.from_arrays(grid);"
     do_performance_test(code_to_test, GRAPH_SIZES, 100, setup_codes=GRAPH_SETUP_CODES)
@@ -52,5 +57,6 @@ if __name__ == "__main__":
     perftest_set_feeder_ids()
     perftest_get_components()
     perftest_delete_node()
+    perftest_delete_nodes()
     perftest_add_node()
     perftest_from_arrays()
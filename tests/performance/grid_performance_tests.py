@@ -37,6 +37,42 @@ def perf_test_add_lines():
     do_performance_test(code_to_test, [10, 200, 1000], 100, setup_code)
 
 
+def perf_test_append_nodes_one_by_one():
+    setup_code = {
+        "concatenate": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds._core.model.arrays import NodeArray;"
+        + "grid = Grid.empty();"
+        + "nodes = [NodeArray.empty(1) for _ in range({size})]",
+        "capacity": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds._core.model.arrays import NodeArray;"
+        + "grid = Grid.empty();"
+        + "grid.node.reserve();"
+        + "nodes = [NodeArray.empty(1) for _ in range({size})]",
+    }
+
+    code_to_test = ["for node in nodes: grid.append(node)"]
+
+    do_performance_test(code_to_test, [1000, 10_000, 20_000], 1, setup_code)
+
+
+def perf_test_edit_session():
+    grid_setup_code = (
+        "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "grid = RadialGridGenerator(nr_nodes=1000, grid_class=Grid).run(seed=0);"
+        + "lines = [grid.line[index] for index in range({size})]"
+    )
+    setup_code = {"no session": grid_setup_code, "batch session": grid_setup_code}
+
+    edit_code = "for line in lines: grid.make_inactive(line); grid.make_active(line)"
+    code_to_test = {
+        "no session": edit_code,
+        "batch session": f"with grid.batch():\n    {edit_code}",
+    }
+
+    do_performance_test(code_to_test, [10, 100, 500], 1, setup_code)
+
+
 def perf_test_get_downstream_nodes_performance():
     setup_code = {
         "grid": "import numpy as np;"
@@ -56,7 +92,104 @@ def perf_test_get_downstream_nodes_performance():
     do_performance_test(code_to_test, [10, 1000, 5000], 100, setup_code)
 
 
+def perf_test_feeder_tree_batched_queries():
+    setup_code = {
+        "grid": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "from power_grid_model_ds.graph_models import RustworkxGraphModel;"
+        + "grid=RadialGridGenerator(nr_nodes={size}, grid_class=Grid, graph_model=RustworkxGraphModel).run();"
+        + "feeder_tree = grid.feeder_tree"
+    }
+
+    code_to_test = [
+        "feeder_tree.get_substation_nodes(grid.node.id)",
+        "feeder_tree.count_downstream_nodes(grid.node.id)",
+        "grid.graphs.active_graph._version += 1; grid.feeder_tree",  # rebuild
+    ]
+
+    do_performance_test(code_to_test, [10, 1000, 5000], 100, setup_code)
+
+
+def perf_test_get_nearest_substation_nodes():
+    setup_code = {
+        "grid": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "from power_grid_model_ds.graph_models import RustworkxGraphModel;"
+        + "grid=RadialGridGenerator(nr_nodes={size}, grid_class=Grid, graph_model=RustworkxGraphModel).run()"
+    }
+
+    code_to_test = [
+        "grid.graphs.active_graph._version += 1; grid.get_nearest_substation_nodes()",
+        "grid.graphs.active_graph._version += 1; [grid.get_nearest_substation_node(id_) for id_ in grid.node.id]",
+    ]
+
+    do_performance_test(code_to_test, [10, 200, 1000], 10, setup_code)
+
+
+def perf_test_set_feeder_ids():
+    # radial grid with a single substation node and a feeder for every 50 nodes
+    setup_code = {
+        "grid": "import numpy as np;"
+        + "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds._core.model.arrays import NodeArray, LineArray;"
+        + "from power_grid_model_ds.enums import NodeType;"
+        + "grid = Grid.empty();"
+        + "nodes = NodeArray.zeros({size});"
+        + "nodes.id = np.arange(1, {size} + 1);"
+        + "nodes.node_type[:1] = NodeType.SUBSTATION_NODE.value;"
+        + "grid.append(nodes, check_max_id=False);"
+        + "lines = LineArray.zeros({size} - 1);"
+        + "lines.id = np.arange({size} + 1, 2 * {size});"
+        + "lines.from_status = 1;"
+        + "lines.to_status = 1;"
+        + "lines.to_node = np.arange(2, {size} + 1);"
+        + "lines.from_node = np.where((lines.to_node - 2) % 50 == 0, 1, lines.to_node - 1);"
+        + "grid.append(lines, check_max_id=False)"
+    }
+
+    code_to_test = ["grid.set_feeder_ids()"]
+
+    do_performance_test(code_to_test, [10_000, 100_000, 1_000_000], 1, setup_code)
+
+
+def perf_test_generate_radial_grid():
+    setup_code = {
+        "generator": "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "generator = RadialGridGenerator(grid_class=Grid, nr_nodes={size}, nr_sources=10, nr_nops={size} // 100)"
+    }
+
+    code_to_test = ["generator.run(seed=0)"]
+
+    do_performance_test(code_to_test, [10_000, 100_000, 1_000_000], 1, setup_code)
+
+
+def perf_test_from_txt():
+    # a radial grid: every node is connected to a random earlier node, with some links, transformers and open lines
+    setup_code = {
+        "txt": "import numpy as np;"
+        + "from power_grid_model_ds import Grid;"
+        + "rng = np.random.default_rng(0);"
+        + "parents = (rng.random({size}) * np.arange(1, {size} + 1)).astype(int) + 1;"
+        + "parents = np.where(parents == 1, 'S1', parents.astype(str));"
+        + "options = rng.choice(['', 'link', 'transformer', 'open'], {size}, p=[0.85, 0.05, 0.05, 0.05]);"
+        + "txt_lines = [f'{{parent}} {{node}} {{option}}' for parent, node, option in "
+        + "zip(parents, range(2, {size} + 2), options)]"
+    }
+
+    code_to_test = ["Grid.from_txt(*txt_lines)"]
+
+    do_performance_test(code_to_test, [1_000, 10_000, 50_000], 1, setup_code)
+
+
 if __name__ == "__main__":
     perf_test_get_downstream_nodes_performance()
+    perf_test_feeder_tree_batched_queries()
+    perf_test_get_nearest_substation_nodes()
     perf_test_add_nodes()
     perf_test_add_lines()
+    perf_test_append_nodes_one_by_one()
+    perf_test_edit_session()
+    perf_test_set_feeder_ids()
+    perf_test_generate_radial_grid()
+    perf_test_from_txt()
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import tracemalloc
+
+import numpy as np
+
+from power_grid_model_ds import Grid, PowerGridModelInterface, Profile
+from power_grid_model_ds.generators import RadialGridGenerator
+from tests.performance._helpers import do_performance_test
+
+# pylint: disable=missing-function-docstring
+
+
+def perf_test_what_if_edits():
+    grid_setup_code = (
+        "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds._core.load_flow import PowerGridModelInterface;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "grid = RadialGridGenerator(nr_nodes={size}, grid_class=Grid).run(seed=0);"
+        + "core_interface = PowerGridModelInterface(grid=grid);"
+        + "core_interface.calculate_power_flow()"
+    )
+    setup_code = {"new interface": grid_setup_code, "synced model": grid_setup_code}
+
+    edit_code = "grid.sym_load.p_specified = grid.sym_load.p_specified * 1.01;"
+    code_to_test = {
+        "new interface": edit_code + "PowerGridModelInterface(grid=grid).calculate_power_flow()",
+        "synced model": edit_code + "core_interface.calculate_power_flow()",
+    }
+
+    do_performance_test(code_to_test, [100, 1000, 5000], 10, setup_code)
+
+
+def perf_test_time_series_throughput():
+    setup_code = {
+        "profiles": "import numpy as np;"
+        + "from power_grid_model_ds import Grid, PowerGridModelInterface, Profile;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "grid = RadialGridGenerator(nr_nodes=200, grid_class=Grid).run(seed=0);"
+        + "core_interface = PowerGridModelInterface(grid=grid);"
+        + "scaling = np.random.default_rng(0).uniform(0, 1, ({size}, 1));"
+        + "profiles = [Profile('sym_load', 'p_specified', scaling * grid.sym_load.p_specified)]"
+    }
+
+    code_to_test = [
+        "for _ in core_interface.calculate_power_flow_profiles(profiles, chunk_size={size}): pass",
+        "for _ in core_interface.calculate_power_flow_profiles(profiles, chunk_size=100): pass",
+        "for _ in core_interface.calculate_power_flow_profiles(profiles, chunk_size=100, threading=0): pass",
+    ]
+
+    do_performance_test(code_to_test, [100, 1000, 5000], 1, setup_code)
+
+
+def perf_test_time_series_peak_memory():
+    print(f"{'-' * 20} perf_test_time_series_peak_memory {'-' * 20}")
+    nr_scenarios = 5000
+    grid = RadialGridGenerator(nr_nodes=200, grid_class=Grid).run(seed=0)
+    core_interface = PowerGridModelInterface(grid=grid)
+    scaling = np.random.default_rng(0).uniform(0, 1, (nr_scenarios, 1))
+    profiles = [Profile("sym_load", "p_specified", scaling * grid.sym_load.p_specified)]
+    core_interface.setup_model()
+
+    print(f"\n\tscenarios: {nr_scenarios}\n")
+    for chunk_size in [nr_scenarios, 1000, 100]:
+        tracemalloc.start()
+        for _ in core_interface.calculate_power_flow_profiles(profiles, chunk_size=chunk_size):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"\t\tchunk_size={chunk_size}".ljust(40) + f" | peak: {peak / 2**20:.1f} MiB")
+    print()
+
+
+def perf_test_contingency_analysis():
+    grid_setup_code = (
+        "from copy import deepcopy;"
+        + "from power_grid_model_ds import Grid, PowerGridModelInterface;"
+        + "from power_grid_model_ds.analysis import ContingencyAnalysis;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "grid = RadialGridGenerator(nr_nodes={size}, grid_class=Grid, nr_nops={size} // 10).run(seed=0);"
+        + "[grid.make_active(grid.line.get(id_)) for id_ in grid.line.id[~grid.line.is_active][: {size} // 20]];"
+        + "analysis = ContingencyAnalysis(PowerGridModelInterface(grid=grid));"
+        + "contingencies = analysis.get_contingencies();"
+        + "branch_ids = contingencies.id[~contingencies.is_islanding]"
+    )
+    setup_code = {"batch": grid_setup_code, "loop": grid_setup_code}
+
+    loop_code = (
+        "for branch_id in branch_ids:\n"
+        + "    contingency_grid = deepcopy(grid)\n"
+        + "    contingency_grid.make_inactive(contingency_grid.line.get(branch_id))\n"
+        + "    PowerGridModelInterface(grid=contingency_grid).calculate_power_flow()"
+    )
+    code_to_test = {"batch": "analysis.run(branch_ids)", "loop": loop_code}
+
+    do_performance_test(code_to_test, [100, 200, 500], 1, setup_code)
+
+
+if __name__ == "__main__":
+    perf_test_what_if_edits()
+    perf_test_time_series_throughput()
+    perf_test_time_series_peak_memory()
+    perf_test_contingency_analysis()
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from tests.performance._constants import GRAPH_SETUP_CODES
+from tests.performance._helpers import do_performance_test
+
+# pylint: disable=missing-function-docstring
+
+
+def perf_test_parse_elements():
+    setup_codes = {
+        key: code + ";from power_grid_model_ds._core.visualizer.parsers import parse_branches, parse_node_array"
+        for key, code in GRAPH_SETUP_CODES.items()
+    }
+
+    code_to_test = ["parse_node_array(grid.node) + parse_branches(grid)"]
+
+    do_performance_test(code_to_test, [10_000, 100_000], 1, setup_codes)
+
+
+def perf_test_aggregated_elements():
+    setup_codes = {
+        key: code + ";from power_grid_model_ds._core.visualizer.level_of_detail import LevelOfDetail"
+        for key, code in GRAPH_SETUP_CODES.items()
+    }
+
+    code_to_test = ["LevelOfDetail(grid).get_elements()"]
+
+    do_performance_test(code_to_test, [10_000, 100_000], 1, setup_codes)
+
+
+def perf_test_graph_layout():
+    grid_setup_code = (
+        "from power_grid_model_ds import Grid;"
+        + "from power_grid_model_ds.generators import RadialGridGenerator;"
+        + "from power_grid_model_ds._core.visualizer.graph_layout import get_node_positions;"
+        + "grid = RadialGridGenerator(Grid, nr_nodes={size}, nr_nops={size} // 100).run()\n"
+        # close some normally open points to create meshed parts
+        + "for nop in grid.line[grid.line.to_status == 0][: {size} // 200]: grid.make_active(nop)\n"
+    )
+    setup_codes = {
+        "tree": grid_setup_code,
+        "force": grid_setup_code,
+        "cached": grid_setup_code + "get_node_positions(grid, 'force')",
+    }
+    code_to_test = {
+        "tree": "get_node_positions(grid, 'tree')",
+        "force": "get_node_positions(grid, 'force')",
+        "cached": "get_node_positions(grid, 'force')",
+    }
+
+    do_performance_test(code_to_test, [10_000, 100_000], 1, setup_codes)
+
+
+def perf_test_search():
+    setup_codes = {
+        key: code + ";from power_grid_model_ds._core.visualizer.search import search_element_ids"
+        for key, code in GRAPH_SETUP_CODES.items()
+    }
+
+    code_to_test = [
+        "search_element_ids(grid, 'node', 'id', '=', '1')",
+        "search_element_ids(grid, 'line', 'to_status', '=', '0')",
+        "search_element_ids(grid, 'branch', 'from_node', '>', '100')",
+    ]
+
+    do_performance_test(code_to_test, [10_000, 100_000], 1, setup_codes)
+
+
+def perf_test_live_update():
+    setup_codes = {
+        key: code
+        + ";from power_grid_model_ds._core.visualizer.live_update import ElementTracker"
+        + ";tracker = ElementTracker(grid)"
+        for key, code in GRAPH_SETUP_CODES.items()
+    }
+
+    code_to_test = [
+        "tracker.update()",
+        "grid.line.to_status[:10] = 1 - grid.line.to_status[:10];tracker.update()",
+        "grid.node.u_rated = grid.node.u_rated + 1;tracker.update()",
+    ]
+
+    do_performance_test(code_to_test, [10_000, 100_000], 1, setup_codes)
+
+
+if __name__ == "__main__":
+    perf_test_parse_elements()
+    perf_test_aggregated_elements()
+    perf_test_graph_layout()
+    perf_test_search()
+    perf_test_live_update()
@@ -7,13 +7,14 @@ Test for Generator Data Source
 """
 
 import numpy as np
+from numpy.testing import assert_array_equal
 
 from power_grid_model_ds._core.data_source.generator.arrays.line import LineGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.node import NodeGenerator
 from power_grid_model_ds._core.data_source.generator.arrays.source import SourceGenerator
-from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.data_source.generator.grid_generators import GridCorpusGenerator, RadialGridGenerator
 from power_grid_model_ds._core.load_flow import PowerGridModelInterface
-from power_grid_model_ds._core.model.arrays import LineArray, NodeArray, SourceArray, SymLoadArray
+from power_grid_model_ds._core.model.arrays import LineArray, NodeArray, SourceArray, SymLoadArray, TransformerArray
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 
@@ -206,6 +207,49 @@ def test_connect_nodes(grid: Grid):
     assert 2 == len(line_generator.line_array)
 
 
+def test_connect_all_nodes(grid: Grid):
+    """Connect all nodes, each voltage level forms a tree"""
+    nodes = NodeArray.zeros(8)
+    nodes.id = np.arange(8)
+    nodes.u_rated = [10_500] * 5 + [3_000] * 3
+
+    line_array = LineArray.zeros(1)
+    line_array.id = [10]
+    line_array.from_node = [0]
+    line_array.to_node = [1]
+    line_array.from_status = [1]
+    line_array.to_status = [1]
+
+    trafo_array = TransformerArray.zeros(1)
+    trafo_array.id = [11]
+    trafo_array.from_node = [1]
+    trafo_array.to_node = [5]
+
+    grid.append(nodes)
+    grid.append(line_array)
+    grid.append(trafo_array)
+
+    line_generator = LineGenerator(grid=grid, seed=0)
+    line_generator.line_array = line_array
+    line_generator.trafo_array = trafo_array
+    line_generator.set_unconnected_nodes()
+    line_generator.connect_all_nodes()
+
+    new_lines = line_generator.line_array[1:]
+    assert not line_generator.unconnected_nodes
+    assert_array_equal([12, 13, 14, 15, 16], np.sort(new_lines.id))
+    assert_array_equal([2, 3, 4, 6, 7], np.sort(new_lines.to_node))
+    # lines connect nodes of the same voltage
+    from_voltages = grid.node.u_rated[np.searchsorted(grid.node.id, new_lines.from_node)]
+    to_voltages = grid.node.u_rated[np.searchsorted(grid.node.id, new_lines.to_node)]
+    assert_array_equal(from_voltages, to_voltages)
+
+    # all nodes are connected without cycles
+    grid.append(new_lines)
+    assert 1 == len(grid.graphs.complete_graph.get_components())
+    assert grid.node.size - 1 == grid.graphs.complete_graph.nr_branches
+
+
 def test_create_nops(grid: Grid):
     """Create normally open points"""
     nodes = NodeArray.zeros(4)
@@ -257,3 +301,32 @@ def test_generate_random_grid_with_tranformers():
     core_interface = PowerGridModelInterface(grid=grid)
     core_interface.create_input_from_grid()
     core_interface.calculate_power_flow()
+
+
+def test_generate_grid_corpus():
+    """Generate a grid of independent substation areas"""
+    corpus_generator = GridCorpusGenerator(grid_class=Grid, nr_areas=3, nr_nodes_per_area=50, nr_nops_per_area=2)
+    grid = corpus_generator.run(seed=0, max_workers=1)
+    area = RadialGridGenerator(grid_class=Grid, nr_nodes=50, nr_sources=1, nr_nops=2).run(seed=0)
+
+    assert 3 * area.node.size == grid.node.size
+    assert 3 * area.line.size == grid.line.size
+    assert grid.max_id == grid.id_counter
+    grid.check_ids()
+    assert all(np.isin(grid.sym_load.node, grid.node.id))
+    assert len(grid.graphs.complete_graph.external_ids) == grid.node.size
+    assert grid.node.size - 3 == grid.graphs.active_graph.nr_branches
+
+    core_interface = PowerGridModelInterface(grid=grid)
+    core_interface.create_input_from_grid()
+    core_interface.calculate_power_flow()
+
+
+def test_generate_grid_corpus_in_worker_processes(tmp_path):
+    """The corpus does not depend on the number of workers"""
+    corpus_generator = GridCorpusGenerator(grid_class=Grid, nr_areas=3, nr_nodes_per_area=50)
+    grid = corpus_generator.run(seed=0, max_workers=1)
+
+    cache_path = corpus_generator.cache(tmp_path, "corpus", seed=0, max_workers=2)
+    cached_grid = Grid.from_cache(cache_path)
+    assert grid.fingerprint() == cached_grid.fingerprint()
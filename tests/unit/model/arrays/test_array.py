@@ -2,14 +2,17 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+import pickle
 from copy import copy
 
 import numpy as np
 import pytest
+from numpy.lib.recfunctions import repack_fields
 from numpy.testing import assert_array_equal
 from numpy.typing import NDArray
 
 from power_grid_model_ds._core import fancypy as fp
+from power_grid_model_ds._core.model.arrays.base._fingerprint import get_fingerprint
 from power_grid_model_ds._core.model.arrays.base.array import FancyArray
 from power_grid_model_ds._core.model.arrays.pgm_arrays import LineArray, TransformerArray
 from power_grid_model_ds._core.model.constants import EMPTY_ID, empty
@@ -17,7 +20,7 @@ from power_grid_model_ds._core.utils.misc import array_equal_with_nan
 from tests.conftest import FancyTestArray
 from tests.fixtures.arrays import ExtendedLineArray, FancyTestArray3
 
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring,missing-class-docstring
 
 
 class _DefaultStrLengthArray(FancyArray):
@@ -303,3 +306,106 @@ def test_from_extended_array():
     array = LineArray.from_extended(extended_array)
     assert not isinstance(array, ExtendedLineArray)
     array_equal_with_nan(array.data, extended_array[array.columns])
+
+
+class TestCapacityBacked:
+    def test_append(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.append(FancyTestArray(id=[4], test_int=[5], test_float=[6.0], test_str=["e"], test_bool=[1]))
+        assert fancy_test_array.is_capacity_backed
+        assert fancy_test_array.capacity >= 4
+        assert_array_equal(fancy_test_array.id, [1, 2, 3, 4])
+        assert_array_equal(fancy_test_array.test_str, ["a", "c", "d", "e"])
+
+    def test_append_one_by_one(self):
+        array = FancyTestArray()
+        for record_id in range(100):
+            array.append(FancyTestArray.zeros(1) if record_id % 2 else FancyTestArray.zeros(1).data)
+            array.id[-1] = record_id
+        assert len(array) == 100
+        assert array.data.size == 100
+        assert array.capacity >= 100
+        assert_array_equal(array.id, np.arange(100))
+
+    def test_append_self(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.append(fancy_test_array, fancy_test_array)
+        assert_array_equal(fancy_test_array.id, [1, 2, 3] * 3)
+
+    def test_append_mismatching_dtypes(self, fancy_test_array: FancyTestArray):
+        with pytest.raises(TypeError):
+            fancy_test_array.append(LineArray.zeros(1))
+
+    def test_reserve(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.reserve(100)
+        assert fancy_test_array.capacity == 100
+        assert len(fancy_test_array) == 3
+        assert_array_equal(fancy_test_array.id, [1, 2, 3])
+
+        fancy_test_array.append(FancyTestArray.zeros(10))
+        assert fancy_test_array.capacity == 100
+
+    def test_shrink_to_fit(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.reserve(100)
+        fancy_test_array.shrink_to_fit()
+        assert fancy_test_array.capacity == 3
+        assert fancy_test_array.is_capacity_backed
+        assert_array_equal(fancy_test_array.id, [1, 2, 3])
+
+    def test_replaced_data_is_not_capacity_backed(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.reserve(100)
+        fancy_test_array._data = fancy_test_array.data.copy()  # pylint: disable=protected-access
+        assert not fancy_test_array.is_capacity_backed
+        assert fancy_test_array.capacity == 3
+
+    def test_append_with_id_index(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.enable_id_index()
+        fancy_test_array.get(1)
+        new_records = FancyTestArray.zeros(2)
+        new_records.id = [5, 4]
+        fancy_test_array.append(new_records)
+        assert fancy_test_array.id_index.is_built
+        assert_array_equal(fancy_test_array.filter([4, 5]).id, [5, 4])
+
+    def test_pickle_without_buffer(self, fancy_test_array: FancyTestArray):
+        fancy_test_array.reserve(100)
+        unpickled = pickle.loads(pickle.dumps(fancy_test_array))
+        assert unpickled.capacity == 3
+        assert fp.array_equal(unpickled, fancy_test_array)
+
+
+class TestFingerprint:
+    def test_equal_arrays_have_equal_fingerprints(self, fancy_test_array: FancyTestArray):
+        copied = copy(fancy_test_array)
+        copied.test_float = np.nan
+        fancy_test_array.test_float = -np.nan  # different bit pattern
+        assert copied.fingerprint() == fancy_test_array.fingerprint()
+        assert hash(copied) == hash(fancy_test_array)
+
+    def test_fingerprint_changes_with_content(self, fancy_test_array: FancyTestArray):
+        fingerprint = fancy_test_array.fingerprint()
+        fancy_test_array.test_int = [3, 0, 5]
+        assert fancy_test_array.fingerprint() != fingerprint
+        fancy_test_array.test_int = [3, 0, 4]
+        assert fancy_test_array.fingerprint() == fingerprint
+
+    def test_fingerprint_beyond_printed_rows(self):
+        array = FancyTestArray.zeros(100)
+        other = copy(array)
+        other.test_int = np.arange(100) == 50
+        assert array.fingerprint() != other.fingerprint()
+        assert hash(array) != hash(other)
+
+    def test_fingerprint_ignores_padding(self, fancy_test_array: FancyTestArray):
+        view = fancy_test_array.data[["id", "test_int"]]
+        packed = repack_fields(view)
+        assert view.dtype.itemsize != packed.dtype.itemsize
+        assert get_fingerprint(view) == get_fingerprint(packed)
+
+    def test_fingerprint_includes_class(self):
+        assert LineArray.zeros(2).fingerprint() != ExtendedLineArray.zeros(2).fingerprint()
+
+    def test_fingerprint_changes_with_view(self, fancy_test_array: FancyTestArray):
+        fingerprint = fancy_test_array.fingerprint()
+        array_hash = hash(fancy_test_array)
+        fancy_test_array.test_int[0] = 10
+        assert fancy_test_array.fingerprint() != fingerprint
+        assert hash(fancy_test_array) != array_hash
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from copy import copy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds._core import fancypy as fp
+from power_grid_model_ds._core.model.arrays.base._index import IdIndex
+from power_grid_model_ds._core.model.arrays.base._modify import update_by_id
+from power_grid_model_ds._core.model.arrays.base.errors import MultipleRecordsReturned, RecordDoesNotExist
+from tests.conftest import FancyTestArray
+from tests.fixtures.arrays import FancyNonIdArray
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture(name="indexed_array")
+def fixture_indexed_array():
+    array = FancyTestArray.zeros(6)
+    array.id = [5, 3, 9, 1, 3, 7]
+    array.test_int = [0, 1, 2, 3, 4, 5]
+    array.enable_id_index()
+    yield array
+
+
+def test_lookup():
+    id_column = np.array([5, 3, 9, 1, 3, 7])
+    index = IdIndex()
+    assert_array_equal(index.lookup(id_column, np.array([3])), [1, 4])
+    assert_array_equal(index.lookup(id_column, np.array([7, 5, 5])), [0, 5])
+    assert_array_equal(index.lookup(id_column, np.array([2, 100])), [])
+    assert index.is_built
+
+
+def test_extend_with_larger_ids():
+    index = IdIndex()
+    id_column = np.array([3, 1, 2])
+    index.lookup(id_column, np.array([1]))
+    extended = index.extend(id_column, np.array([5, 4]))
+    assert extended.is_built
+    assert_array_equal(extended.lookup(np.array([3, 1, 2, 5, 4]), np.array([4, 2])), [2, 4])
+
+
+def test_extend_with_smaller_ids():
+    index = IdIndex()
+    id_column = np.array([3, 4])
+    index.lookup(id_column, np.array([3]))
+    extended = index.extend(id_column, np.array([1]))
+    assert not extended.is_built
+    assert_array_equal(extended.lookup(np.array([3, 4, 1]), np.array([1])), [2])
+
+
+def test_subset():
+    index = IdIndex()
+    id_column = np.array([5, 3, 9, 1])
+    index.lookup(id_column, np.array([1]))
+    keep_mask = np.array([True, False, True, True])
+    subset = index.subset(id_column, keep_mask)
+    assert subset.is_built
+    assert_array_equal(subset.lookup(id_column[keep_mask], np.array([1, 5, 3])), [0, 2])
+
+
+def test_enable_id_index_without_id_column():
+    with pytest.raises(AttributeError):
+        FancyNonIdArray.zeros(1).enable_id_index()
+
+
+def test_get_with_index(indexed_array: FancyTestArray):
+    assert indexed_array.get(9).test_int == 2
+    assert indexed_array.get(id=7).test_int == 5
+    assert indexed_array.get(id=3, test_int=4).test_int == 4
+    with pytest.raises(RecordDoesNotExist):
+        indexed_array.get(id=99)
+    with pytest.raises(MultipleRecordsReturned):
+        indexed_array.get(id=3)
+
+
+def test_filter_with_index(indexed_array: FancyTestArray):
+    assert_array_equal(indexed_array.filter([7, 3, 99]).test_int, [1, 4, 5])
+    assert_array_equal(indexed_array.filter(id={1, 5}).test_int, [0, 3])
+    assert_array_equal(indexed_array.filter(id=[]).test_int, [])
+    assert_array_equal(indexed_array.filter(id=3, test_int=[1, 2]).test_int, [1])
+    assert_array_equal(indexed_array.filter(id=3, test_int=2, mode_="OR").test_int, [1, 2, 4])
+
+
+def test_filter_with_index_matches_scan():
+    rng = np.random.default_rng(0)
+    array = FancyTestArray.zeros(1000)
+    array.id = rng.integers(0, 500, 1000)
+    array.test_int = np.arange(1000)
+    indexed = copy(array)
+    indexed.enable_id_index()
+
+    for _ in range(20):
+        ids = rng.integers(0, 600, rng.integers(1, 10))
+        assert fp.array_equal(indexed.filter(ids), array.filter(ids))
+        assert fp.array_equal(indexed.exclude(ids), array.exclude(ids))
+        assert_array_equal(indexed.filter_mask(ids), array.filter_mask(ids))
+
+
+def test_update_by_id_with_index(indexed_array: FancyTestArray):
+    indexed_array.update_by_id([1, 9], test_float=1.5)
+    assert_array_equal(indexed_array.test_float, [0, 0, 1.5, 1.5, 0, 0])
+    with pytest.raises(ValueError):
+        indexed_array.update_by_id([99], test_float=1.5)
+
+    updated = indexed_array.get_updated_by_id([7, 5], test_int=10)
+    assert_array_equal(updated.id, [5, 7])
+
+
+def test_update_by_id_returns_mask_with_index(indexed_array: FancyTestArray):
+    mask = update_by_id(indexed_array.data, [1, 7], allow_missing=False, index_=indexed_array.id_index, test_int=10)
+    assert_array_equal(mask, update_by_id(indexed_array.data, [1, 7], allow_missing=False))
+    assert_array_equal(mask, [False, False, False, True, False, True])
+
+
+def test_index_invalidated_on_setattr(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    indexed_array.id = [10, 11, 12, 13, 14, 15]
+    assert indexed_array.get(id=12).test_int == 2
+
+
+def test_index_invalidated_on_setitem(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    indexed_array[0] = indexed_array[2]
+    assert_array_equal(indexed_array.filter(id=9).test_int, [2, 2])
+
+    indexed_array["test_int"] = 1
+    assert indexed_array.id_index.is_built
+
+
+def test_index_invalidated_on_update_by_id(indexed_array: FancyTestArray):
+    indexed_array.update_by_id([9], id=99)
+    assert indexed_array.get(id=99).test_int == 2
+
+
+def test_index_invalidated_on_sort(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    fp.sort(indexed_array, order="id")
+    assert indexed_array.get(id=9).test_int == 2
+
+
+def test_index_carried_over_by_concatenate(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    new_records = FancyTestArray.zeros(2)
+    new_records.id = [20, 10]
+    new_records.test_int = [6, 7]
+
+    concatenated = fp.concatenate(indexed_array, new_records)
+    assert concatenated.id_index.is_built
+    assert concatenated.get(id=10).test_int == 7
+    assert concatenated.get(id=1).test_int == 3
+
+
+def test_index_carried_over_by_exclude(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    excluded = indexed_array.exclude(id=[3, 5])
+    assert excluded.id_index.is_built
+    assert_array_equal(excluded.id, [9, 1, 7])
+    assert excluded.get(id=7).test_int == 5
+
+
+def test_index_carried_over_by_copy(indexed_array: FancyTestArray):
+    indexed_array.get(id=9)
+    copied = copy(indexed_array)
+    copied.id = [0, 0, 0, 0, 0, 0]
+    assert indexed_array.get(id=9).test_int == 2
+
+
+def test_disable_id_index(indexed_array: FancyTestArray):
+    indexed_array.disable_id_index()
+    assert indexed_array.id_index is None
+    assert indexed_array.get(id=9).test_int == 2
@@ -5,12 +5,14 @@
 """Grid tests"""
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 
 from power_grid_model_ds._core.model.graphs.errors import GraphError
+from power_grid_model_ds._core.model.graphs.models import RustworkxGraphModel
 from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds.errors import MissingBranchError, MissingNodeError, NoPathBetweenNodes
@@ -373,3 +375,137 @@ class TestFindFirstConnected:
         graph.add_node(99)
         with pytest.raises(MissingNodeError):
             graph.find_first_connected(1, candidate_node_ids=[99])
+
+
+def test_get_components_as_array(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_node(6)
+    components = graph_with_2_routes.get_components(as_array=True)
+
+    assert all(isinstance(component, np.ndarray) for component in components)
+    assert sorted(sorted(component.tolist()) for component in components) == [[1, 2, 3, 4, 5], [6]]
+
+
+def test_get_connected_as_array(graph_with_2_routes: BaseGraphModel):
+    connected_nodes = graph_with_2_routes.get_connected(node_id=1, nodes_to_ignore=[5], as_array=True)
+
+    assert isinstance(connected_nodes, np.ndarray)
+    assert_array_equal(connected_nodes, [2, 3])
+
+
+def test_tmp_remove_nodes_restores_on_error(graph_with_2_routes: BaseGraphModel):
+    with pytest.raises(ValueError):
+        with graph_with_2_routes.tmp_remove_nodes([1]):
+            assert not graph_with_2_routes.has_node(1)
+            raise ValueError("error inside the context")
+
+    assert graph_with_2_routes.has_node(1)
+    assert graph_with_2_routes.nr_branches == 4
+
+
+def test_tmp_remove_nodes_keeps_internal_ids(graph_with_2_routes: BaseGraphModel):
+    internal_ids = [graph_with_2_routes.external_to_internal(node_id) for node_id in [1, 2, 3, 4, 5]]
+
+    with graph_with_2_routes.tmp_remove_nodes([1]):
+        assert set(graph_with_2_routes.external_ids) == {2, 3, 4, 5}
+        with pytest.raises(MissingNodeError):
+            graph_with_2_routes.external_to_internal(1)
+
+    assert internal_ids == [graph_with_2_routes.external_to_internal(node_id) for node_id in [1, 2, 3, 4, 5]]
+
+
+def test_tmp_remove_nodes_keeps_changes(graph_with_2_routes: BaseGraphModel):
+    graph = graph_with_2_routes
+    graph.add_branch(2, 3)  # parallel branch
+
+    with graph.tmp_remove_nodes([2]):
+        graph.add_node(99)
+        graph.add_branch(1, 99)
+        graph.add_branch(99, 3)
+        assert graph.get_shortest_path(1, 3) == ([1, 99, 3], 2)
+        assert set(graph.get_connected(1)) == {3, 4, 5, 99}
+
+    assert graph.has_node(2)
+    assert graph.has_node(99)
+    assert sorted(graph.external_ids) == [1, 2, 3, 4, 5, 99]
+    assert graph.nr_branches == 7
+    assert graph.get_shortest_path(1, 3, nodes_to_ignore=[99]) == ([1, 2, 3], 2)
+
+
+def test_tmp_remove_nodes_in_other_thread(graph_with_2_routes: BaseGraphModel):
+    graph = graph_with_2_routes
+    if not isinstance(graph, RustworkxGraphModel):
+        pytest.skip("only graph models that mask nodes leave the graph unchanged for other threads")
+
+    with graph.tmp_remove_nodes([2]):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            has_node, path = executor.submit(lambda: (graph.has_node(2), graph.get_shortest_path(1, 3))).result()
+        assert not graph.has_node(2)
+
+    assert has_node
+    assert path == ([1, 2, 3], 2)
+
+
+def test_get_components_nodes_to_ignore(graph_with_2_routes: BaseGraphModel):
+    components = graph_with_2_routes.get_components(nodes_to_ignore=[1])
+
+    assert sorted(sorted(component) for component in components) == [[2, 3], [4, 5]]
+    assert graph_with_2_routes.nr_nodes == 5
+
+
+def test_get_shortest_path_nodes_to_ignore(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_branch(3, 4)
+
+    assert graph_with_2_routes.get_shortest_path(1, 3) == ([1, 2, 3], 2)
+    assert graph_with_2_routes.get_shortest_path(1, 3, nodes_to_ignore=[2]) == ([1, 5, 4, 3], 3)
+    with pytest.raises(NoPathBetweenNodes):
+        graph_with_2_routes.get_shortest_path(1, 3, nodes_to_ignore=[2, 4])
+
+
+def test_get_bfs_tree(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_node(6)
+    node_ids, parents, depths = graph_with_2_routes.get_bfs_tree([1, 3])
+
+    assert set(node_ids[:2]) == {1, 3}
+    assert set(node_ids) == {1, 2, 3, 4, 5}
+    assert_array_equal(depths[np.argsort(node_ids)], [0, 1, 0, 2, 1])
+    parent_ids = {node: node_ids[parent] for node, parent in zip(node_ids, parents) if parent >= 0}
+    assert parent_ids[5] == 1
+    assert parent_ids[4] == 5
+    assert parent_ids[2] in (1, 3)
+
+
+def test_get_edges_and_from_edges(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_node(6)
+    edges = graph_with_2_routes.get_edges()
+    assert {tuple(sorted(edge)) for edge in edges.tolist()} == {(1, 2), (2, 3), (1, 5), (4, 5)}
+
+    new_graph = graph_with_2_routes.from_edges(graph_with_2_routes.external_ids, edges)
+    assert sorted(new_graph.external_ids) == [1, 2, 3, 4, 5, 6]
+    assert new_graph.nr_branches == 4
+    assert new_graph.get_shortest_path(3, 4) == ([3, 2, 1, 5, 4], 4)
+
+
+def test_get_bridges(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_node(6)
+    graph_with_2_routes.add_branch(3, 6)
+    graph_with_2_routes.add_branch(3, 6)
+    assert {tuple(sorted(bridge)) for bridge in graph_with_2_routes.get_bridges().tolist()} == {
+        (1, 2),
+        (2, 3),
+        (1, 5),
+        (4, 5),
+    }
+
+    graph_with_2_routes.add_branch(3, 4)  # closes the cycle 1-2-3-4-5
+    assert graph_with_2_routes.get_bridges().size == 0
+
+
+def test_get_bridges_fallback(graph_with_2_routes: BaseGraphModel):
+    graph_with_2_routes.add_branch(3, 4)
+    graph_with_2_routes.add_node(6)
+    graph_with_2_routes.add_branch(4, 6)
+    bridges = BaseGraphModel._get_bridges(graph_with_2_routes)  # pylint: disable=protected-access
+    assert_array_equal(
+        np.sort(graph_with_2_routes._internals_to_externals(bridges.ravel())),  # pylint: disable=protected-access
+        [4, 6],
+    )
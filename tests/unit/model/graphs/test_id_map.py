@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds._core.model.graphs.errors import MissingNodeError
+from power_grid_model_ds._core.model.graphs.models._id_map import NodeIdMap
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+@pytest.mark.parametrize("external_ids", [[10, 11, 12, 13], [10, 1_000_000, -5, 2**40]])
+def test_to_internal_and_back(external_ids):
+    id_map = NodeIdMap()
+    id_map.add(external_ids, [0, 1, 2, 3])
+
+    assert len(id_map) == 4
+    assert_array_equal(id_map.to_internal(external_ids[::-1]), [3, 2, 1, 0])
+    assert_array_equal(id_map.to_external([3, 2, 1, 0]), external_ids[::-1])
+    assert id_map.get_internal(external_ids[1]) == 1
+    assert id_map.get_external(2) == external_ids[2]
+
+
+def test_dense_and_sorted_lookup():
+    compact_map = NodeIdMap()
+    compact_map.add(np.arange(100, 200), np.arange(100))
+    compact_map.to_internal([100])
+    assert compact_map._sorted_externals is None
+
+    sparse_map = NodeIdMap()
+    sparse_map.add(np.arange(100) * 1000, np.arange(100))
+    sparse_map.to_internal([0])
+    assert sparse_map._sorted_externals is not None
+
+
+def test_missing_external_id():
+    id_map = NodeIdMap()
+    id_map.add([1, 2, 3], [0, 1, 2])
+
+    assert_array_equal(id_map.contains([1, 4, 3]), [True, False, True])
+    with pytest.raises(MissingNodeError, match="'4'"):
+        id_map.to_internal([1, 4])
+    with pytest.raises(MissingNodeError):
+        id_map.get_internal(4)
+
+
+def test_remove_and_reuse_internal_id():
+    id_map = NodeIdMap()
+    id_map.add([1, 2, 3], [0, 1, 2])
+    id_map.to_internal([1])  # build the lookup
+
+    id_map.remove([1])
+    assert len(id_map) == 2
+    assert_array_equal(id_map.contains([1, 2, 3]), [True, False, True])
+    assert_array_equal(id_map.external_ids, [1, 3])
+
+    id_map.add([5], [1])
+    assert id_map.get_internal(5) == 1
+    assert_array_equal(id_map.to_internal([5, 3]), [1, 2])
+    with pytest.raises(MissingNodeError):
+        id_map.get_internal(2)
+
+
+def test_add_one_by_one():
+    id_map = NodeIdMap()
+    for internal_id, external_id in enumerate(range(5000, 0, -1)):
+        id_map.add([external_id], [internal_id])
+        assert id_map.get_internal(external_id) == internal_id
+
+    assert_array_equal(id_map.to_internal([5000, 1]), [0, 4999])
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds import Grid
+from power_grid_model_ds._core.model.constants import EMPTY_ID
+from power_grid_model_ds._core.model.enums.nodes import NodeType
+from power_grid_model_ds._core.model.graphs.errors import MissingNodeError
+from power_grid_model_ds.generators import RadialGridGenerator
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.fixture(name="feeder_grid")
+def fixture_feeder_grid():
+    # S1 feeds 2 -> 3 -> (5 -> 6) and 2 -> 4, S10 feeds 11 -> 12. Node 99 is not connected.
+    grid = Grid.from_txt("S1 2", "2 3", "3 5", "5 6", "2 4", "S10 11", "11 12", "4 12 open")
+    grid.append(grid.node.__class__(id=[99], u_rated=[10_500.0]), check_max_id=False)
+    return grid
+
+
+def test_get_downstream_nodes(feeder_grid: Grid):
+    feeder_tree = feeder_grid.feeder_tree
+
+    assert_array_equal(feeder_tree.get_downstream_nodes(3), [5, 6])
+    assert_array_equal(feeder_tree.get_downstream_nodes(3, inclusive=True), [3, 5, 6])
+    assert_array_equal(feeder_tree.get_downstream_nodes(6), [])
+    assert set(feeder_tree.get_downstream_nodes(2)) == {3, 4, 5, 6}
+    with pytest.raises(MissingNodeError):
+        feeder_tree.get_downstream_nodes(99)
+
+
+def test_get_upstream_path(feeder_grid: Grid):
+    assert_array_equal(feeder_grid.feeder_tree.get_upstream_path(6), [6, 5, 3, 2, 1])
+    assert_array_equal(feeder_grid.feeder_tree.get_upstream_path(10), [10])
+
+
+def test_batched_queries(feeder_grid: Grid):
+    feeder_tree = feeder_grid.feeder_tree
+    node_ids = np.array([1, 2, 6, 12, 99])
+
+    assert_array_equal(feeder_tree.get_substation_nodes(node_ids), [1, 1, 1, 10, EMPTY_ID])
+    assert_array_equal(feeder_tree.get_upstream_nodes(node_ids), [EMPTY_ID, 1, 5, 11, EMPTY_ID])
+    assert_array_equal(feeder_tree.get_distances(node_ids), [0, 1, 4, 2, -1])
+    assert_array_equal(feeder_tree.count_downstream_nodes(node_ids), [5, 4, 0, 0, 0])
+    assert_array_equal(feeder_tree.is_downstream([6, 6, 2, 12, 2, 99], [2, 11, 6, 10, 2, 1]), [1, 0, 0, 1, 0, 0])
+
+
+def test_is_radial(feeder_grid: Grid):
+    assert_array_equal(feeder_grid.feeder_tree.is_radial([1, 6, 12, 99]), [True, True, True, False])
+
+    feeder_grid.make_active(feeder_grid.line.get(from_node=4, to_node=12))
+    assert_array_equal(feeder_grid.feeder_tree.is_radial([1, 6, 12]), [False, False, False])
+
+
+def test_feeder_tree_is_rebuilt_after_make_active(feeder_grid: Grid):
+    assert feeder_grid.feeder_tree is feeder_grid.feeder_tree
+    assert feeder_grid.feeder_tree.get_distances([12]).item() == 2
+
+    feeder_grid.make_inactive(feeder_grid.line.get(from_node=11, to_node=12))
+    assert feeder_grid.feeder_tree.get_distances([12]).item() == -1
+
+    feeder_grid.make_active(feeder_grid.line.get(from_node=4, to_node=12))
+    assert_array_equal(feeder_grid.feeder_tree.get_upstream_path(12), [12, 4, 2, 1])
+
+
+def test_feeder_tree_matches_graph_search():
+    grid = RadialGridGenerator(grid_class=Grid, nr_nodes=200, nr_sources=2, nr_nops=10).run(seed=0)
+    substation_node_ids = grid.node.filter(node_type=NodeType.SUBSTATION_NODE.value).id.tolist()
+
+    for node_id in grid.node.filter(node_type=NodeType.UNSPECIFIED.value).id[:50]:
+        expected = grid.graphs.active_graph.get_downstream_nodes(node_id, substation_node_ids)
+        assert set(grid.get_downstream_nodes(node_id)) == set(expected)
@@ -5,6 +5,7 @@
 """Grid tests"""
 
 import dataclasses
+from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
@@ -15,10 +16,14 @@ from power_grid_model_ds._core.model.arrays import (
     LineArray,
     LinkArray,
     NodeArray,
+    SymPowerSensorArray,
+    SymVoltageSensorArray,
     TransformerArray,
     TransformerTapRegulatorArray,
 )
+from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
 from power_grid_model_ds._core.model.constants import EMPTY_ID
+from power_grid_model_ds._core.model.grids._text_sources import TextSource
 from power_grid_model_ds._core.model.grids.base import Grid
 from tests.fixtures.grid_classes import ExtendedGrid
 from tests.fixtures.grids import build_basic_grid
@@ -120,6 +125,79 @@ def test_grid_delete_node(basic_grid: Grid):
     assert target_node.id not in grid.node.id
 
 
+def test_grid_delete_nodes(basic_grid: Grid):
+    grid = basic_grid
+    voltage_sensor = SymVoltageSensorArray.zeros(1)
+    voltage_sensor.measured_object = 104
+    power_sensor = SymPowerSensorArray.zeros(2)
+    power_sensor.measured_object = [202, 401]
+    regulator = TransformerTapRegulatorArray.zeros(1)
+    regulator.regulated_object = 301
+    grid.append(voltage_sensor)
+    grid.append(power_sensor)
+    grid.append(regulator)
+
+    grid.delete_nodes([102, 104])
+
+    assert_array_equal(grid.node.id, [101, 103, 105, 106])
+    assert_array_equal(grid.line.id, [204])
+    assert 0 == grid.transformer.size
+    assert 0 == grid.link.size
+    assert_array_equal(grid.sym_load.id, [402, 404])
+    assert 0 == grid.sym_voltage_sensor.size
+    assert 0 == grid.sym_power_sensor.size
+    assert 0 == grid.transformer_tap_regulator.size
+
+    for graph in (grid.graphs.active_graph, grid.graphs.complete_graph):
+        assert set(graph.external_ids) == {101, 103, 105, 106}
+        assert 1 == graph.nr_branches
+        assert graph.has_branch(101, 105)
+
+
+def test_grid_delete_nodes_missing_node(basic_grid: Grid):
+    with pytest.raises(RecordDoesNotExist, match=r"\[999\]"):
+        basic_grid.delete_nodes([101, 999])
+    assert 6 == basic_grid.node.size
+
+
+def test_grid_delete_nodes_three_winding_transformer(grid_with_3wt: Grid):
+    grid = grid_with_3wt
+    grid.delete_nodes([102])
+
+    assert 0 == grid.three_winding_transformer.size
+    assert not grid.graphs.complete_graph.has_branch(101, 103)
+
+
+def test_grid_delete_branches(basic_grid: Grid):
+    grid = basic_grid
+    power_sensor = SymPowerSensorArray.zeros(2)
+    power_sensor.measured_object = [201, 204]
+    regulator = TransformerTapRegulatorArray.zeros(1)
+    regulator.regulated_object = 301
+    grid.append(power_sensor)
+    grid.append(regulator)
+
+    grid.delete_branches([201, 203, 301])
+
+    assert_array_equal(grid.line.id, [202, 204])
+    assert 0 == grid.transformer.size
+    assert_array_equal(grid.sym_power_sensor.measured_object, [204])
+    assert 0 == grid.transformer_tap_regulator.size
+    assert 6 == grid.node.size
+
+    assert not grid.graphs.complete_graph.has_branch(101, 102)
+    assert not grid.graphs.complete_graph.has_branch(103, 104)
+    assert not grid.graphs.complete_graph.has_branch(102, 106)
+    assert 3 == grid.graphs.complete_graph.nr_branches
+    assert 3 == grid.graphs.active_graph.nr_branches
+
+
+def test_grid_delete_branches_missing_branch(basic_grid: Grid):
+    with pytest.raises(RecordDoesNotExist, match=r"\[999\]"):
+        basic_grid.delete_branches([201, 999])
+    assert 4 == basic_grid.line.size
+
+
 # pylint: disable=no-member
 def test_grid_add_line(basic_grid: Grid):
     grid = basic_grid
@@ -292,6 +370,74 @@ def test_grid_as_str(basic_grid: Grid):
     assert "103 104 203,open" in grid_as_string
 
 
+class TestBranchCache:
+    def test_branches_are_cached(self, basic_grid: Grid):
+        branch_cache = basic_grid._get_branch_cache()
+        _ = basic_grid.branches
+        assert basic_grid._get_branch_cache() is branch_cache
+
+    def test_branches_are_writable(self, basic_grid: Grid):
+        branches = basic_grid.branches
+        branches.from_status[0] = 0
+        branches.feeder_branch_id = 1
+        assert basic_grid.branches.from_status[0] == 1
+        assert not np.any(basic_grid.branches.feeder_branch_id == 1)
+
+    def test_branch_source_map(self, basic_grid: Grid):
+        array_index, row_index = basic_grid.branch_source_map
+        for branch, array_position, row in zip(basic_grid.branches, array_index, row_index):
+            source_array = basic_grid.branch_arrays[array_position]
+            assert source_array[row].id == branch.id
+
+    def test_invalidated_on_replaced_array(self, basic_grid: Grid):
+        branches = basic_grid.branches
+        basic_grid.line = basic_grid.line.exclude(id=203)
+        assert basic_grid.branches is not branches
+        assert 203 not in basic_grid.branches.id
+
+    def test_invalidated_on_append(self, basic_grid: Grid):
+        branches = basic_grid.branches
+        new_line = LineArray.zeros(1)
+        new_line.id = 999
+        new_line.from_node = 102
+        new_line.to_node = 103
+        basic_grid.append(new_line)
+        assert len(basic_grid.branches) == len(branches) + 1
+
+    def test_invalidated_on_modified_array(self, basic_grid: Grid):
+        _ = basic_grid.branches
+        basic_grid.line.update_by_id(202, from_status=0)
+        assert basic_grid.branches.get(202).from_status == 0
+
+        basic_grid.line.feeder_node_id = 42
+        assert basic_grid.branches.get(202).feeder_node_id == 42
+
+    def test_invalidated_on_make_inactive(self, basic_grid: Grid):
+        _ = basic_grid.branches
+        basic_grid.make_inactive(basic_grid.line.get(202))
+        assert basic_grid.branches.get(202).to_status == 0
+
+    def test_invalidated_on_write_through_view(self, basic_grid: Grid):
+        _ = basic_grid.branches
+        basic_grid.line.from_status[0] = 0
+        assert basic_grid.branches.get(basic_grid.line.id[0]).from_status == 0
+
+        basic_grid.transformer.data["to_node"][0] = 999
+        assert basic_grid.branches.get(basic_grid.transformer.id[0]).to_node == 999
+
+    def test_invalidate_branches(self, basic_grid: Grid):
+        _ = basic_grid.branches
+        basic_grid.line.data["from_status"][:] = 0
+        basic_grid.invalidate_branches()
+        assert_array_equal(basic_grid.branches.filter(id=basic_grid.line.id).from_status, 0)
+
+    def test_cache_not_stored(self, basic_grid: Grid, tmp_path: Path):
+        _ = basic_grid.branches
+        assert "_branch_cache" not in basic_grid.__getstate__()
+        cache_path = basic_grid.cache(cache_dir=tmp_path, cache_name="grid", compress=False)
+        assert Grid.from_cache(cache_path).branches.size == basic_grid.branches.size
+
+
 class TestFromTxt:
     def test_from_txt_lines(self):
         grid = Grid.from_txt(
@@ -364,3 +510,42 @@ class TestFromTxt:
         assert 1 == grid.branches.filter(to_status=0).size
         assert 1 == grid.transformer.size
         np.testing.assert_array_equal([14, 10, 11, 12, 13, 15, 16, 17], grid.branches.id)
+
+    def test_from_txt_file_in_chunks(self, tmp_path: Path):
+        txt_file = tmp_path / "tmp_grid"
+        txt_file.write_text("S1 2\n# comment\nS1 3 open\n\n2 7\n3 5\n3 6 transformer\n5 7", encoding="utf-8")
+        grid = TextSource(grid_class=Grid).load_from_txt_file(txt_file, chunk_size=3)
+
+        assert 6 == grid.node.size
+        assert 1 == grid.transformer.size
+        np.testing.assert_array_equal([12, 8, 9, 10, 11, 13], grid.branches.id)
+        assert grid.graphs.complete_graph.nr_branches == 6
+
+    def test_from_txt_with_mixed_branch_ids(self):
+        grid = Grid.from_txt("S1 2", "2 3 20", "3 4", "4 5 link", "5 6 30")
+
+        np.testing.assert_array_equal([7, 20, 21, 30], grid.line.id)
+        np.testing.assert_array_equal([22], grid.link.id)
+
+    def test_from_txt_with_duplicate_branches(self):
+        grid = Grid.from_txt("S1 2", "2 3", "S1 2 open")
+
+        assert 2 == grid.line.size
+        np.testing.assert_array_equal([0, 1], grid.line.to_status)
+
+    def test_from_txt_with_multiple_branch_ids(self):
+        with pytest.raises(ValueError):
+            Grid.from_txt("S1 2 10,11")
+
+
+def test_fingerprint(basic_grid: Grid):
+    fingerprint = basic_grid.fingerprint()
+    assert deepcopy(basic_grid).fingerprint() == fingerprint
+
+    basic_grid.make_inactive(basic_grid.line.get(201))
+    assert basic_grid.fingerprint() != fingerprint
+    assert Grid.empty().fingerprint() != fingerprint
+
+    fingerprint = basic_grid.fingerprint()
+    basic_grid.line.from_status[0] = 0
+    assert basic_grid.fingerprint() != fingerprint
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from collections import Counter
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds import Grid
+from power_grid_model_ds._core.model.arrays import LineArray, NodeArray
+from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
+from power_grid_model_ds._core.model.graphs.models.base import BaseGraphModel
+
+# pylint: disable=missing-function-docstring
+
+
+def _new_line(from_node: int, to_node: int) -> LineArray:
+    line = LineArray.zeros(1)
+    line.from_node = from_node
+    line.to_node = to_node
+    line.from_status = 1
+    line.to_status = 1
+    return line
+
+
+def _get_branch_counts(graph: BaseGraphModel) -> Counter:
+    return Counter(frozenset(branch) for branch in graph.all_branches)
+
+
+@pytest.fixture(name="large_grid")
+def fixture_large_grid(basic_grid: Grid) -> Grid:
+    """The basic grid extended with a long feeder, so that a batch session changes only a small part of it"""
+    nodes = NodeArray.zeros(50)
+    nodes.id = np.arange(1000, 1050)
+    basic_grid.append(nodes)
+    lines = LineArray.zeros(50)
+    lines.from_node = np.concatenate([[102], nodes.id[:-1]])
+    lines.to_node = nodes.id
+    lines.from_status = 1
+    lines.to_status = 1
+    basic_grid.append(lines)
+    return basic_grid
+
+
+def test_batch_updates_graphs_in_bulk(large_grid: Grid):
+    graphs = large_grid.graphs
+
+    with large_grid.batch():
+        large_grid.add_node(NodeArray.zeros(1))
+        new_node_id = large_grid.node.id[-1]
+        large_grid.add_branch(_new_line(1049, new_node_id))
+        large_grid.make_inactive(large_grid.line.get(201))
+        large_grid.make_inactive(large_grid.line.get(from_node=1010))
+        large_grid.make_active(large_grid.line.get(203))
+        large_grid.delete_nodes([106])
+        large_grid.delete_branches([204])
+
+    assert large_grid.graphs is graphs
+    rebuilt_graphs = GraphContainer.from_arrays(large_grid)
+    assert sorted(large_grid.graphs.complete_graph.external_ids) == sorted(rebuilt_graphs.complete_graph.external_ids)
+    for graph, rebuilt_graph in [
+        (large_grid.graphs.complete_graph, rebuilt_graphs.complete_graph),
+        (large_grid.graphs.active_graph, rebuilt_graphs.active_graph),
+    ]:
+        assert _get_branch_counts(graph) == _get_branch_counts(rebuilt_graph)
+
+
+def test_batch_rebuilds_graphs_after_many_changes(large_grid: Grid):
+    graphs = large_grid.graphs
+
+    with large_grid.batch():
+        large_grid.delete_nodes(np.arange(1000, 1050))
+
+    assert large_grid.graphs is not graphs
+    assert 6 == large_grid.graphs.complete_graph.nr_nodes
+
+
+def test_batch_defers_graph_updates(basic_grid: Grid):
+    graphs = basic_grid.graphs
+
+    with basic_grid.batch():
+        basic_grid.add_node(NodeArray.zeros(1))
+        new_node_id = basic_grid.node.id[-1]
+        basic_grid.add_branch(_new_line(105, new_node_id))
+        basic_grid.make_inactive(basic_grid.line.get(201))
+        assert not graphs.complete_graph.has_node(new_node_id)
+        assert graphs.active_graph.has_branch(101, 102)
+
+    assert basic_grid.graphs.complete_graph.has_branch(105, new_node_id)
+    assert basic_grid.graphs.active_graph.has_branch(105, new_node_id)
+    assert not basic_grid.graphs.active_graph.has_branch(101, 102)
+    assert basic_grid.graphs.complete_graph.has_branch(101, 102)
+
+
+def test_batch_defers_deletions(basic_grid: Grid):
+    with basic_grid.batch():
+        basic_grid.delete_node(basic_grid.node.get(106))
+        basic_grid.delete_branch(basic_grid.line.get(201))
+        basic_grid.delete_branches([202])
+        assert 106 in basic_grid.node.id
+        assert 4 == basic_grid.line.size
+
+    assert 106 not in basic_grid.node.id
+    assert 0 == basic_grid.transformer.size
+    assert_array_equal(basic_grid.line.id, [203, 204])
+    assert not basic_grid.graphs.complete_graph.has_node(106)
+    assert not basic_grid.graphs.complete_graph.has_branch(101, 102)
+    assert not basic_grid.graphs.complete_graph.has_branch(102, 103)
+
+
+def test_batch_appends_in_place(basic_grid: Grid):
+    with basic_grid.batch():
+        for _ in range(10):
+            basic_grid.append(NodeArray.zeros(1))
+        assert basic_grid.node.is_capacity_backed
+
+    assert 16 == basic_grid.node.size
+    assert 16 == basic_grid.graphs.complete_graph.nr_nodes
+
+
+def test_batch_copies_modified_arrays_only(basic_grid: Grid):
+    node, line, transformer = basic_grid.node, basic_grid.line, basic_grid.transformer
+
+    with basic_grid.batch():
+        basic_grid.append(NodeArray.zeros(1))
+        basic_grid.make_inactive(basic_grid.line.get(201))
+
+    assert 6 == node.size
+    assert 1 == line.get(201).to_status
+    assert basic_grid.transformer is transformer
+
+
+def test_batch_arrays_are_not_capacity_backed_after_commit(basic_grid: Grid):
+    with basic_grid.batch():
+        basic_grid.append(NodeArray.zeros(1))
+    node = basic_grid.node
+
+    assert not node.is_capacity_backed
+    basic_grid.append(NodeArray.zeros(1))
+    assert 7 == node.size
+    assert 8 == basic_grid.node.size
+
+
+def test_batch_rollback(basic_grid: Grid):
+    original_grid = deepcopy(basic_grid)
+    graphs = basic_grid.graphs
+
+    with pytest.raises(ValueError):
+        with basic_grid.batch():
+            basic_grid.append(NodeArray.zeros(3))
+            basic_grid.make_inactive(basic_grid.line.get(201))
+            basic_grid.delete_nodes([102])
+            raise ValueError("abort")
+
+    assert basic_grid.graphs is graphs
+    assert basic_grid.id_counter == original_grid.id_counter
+    for array, original_array in zip(basic_grid.all_arrays(), original_grid.all_arrays()):
+        assert array.data.tobytes() == original_array.data.tobytes()  # nan != nan
+
+
+def test_batch_rollback_on_invalid_deletion(basic_grid: Grid):
+    with pytest.raises(RecordDoesNotExist):
+        with basic_grid.batch():
+            basic_grid.delete_nodes([102])
+            basic_grid.delete_nodes([999])
+
+    assert 6 == basic_grid.node.size
+
+
+def test_nested_batch(basic_grid: Grid):
+    with basic_grid.batch():
+        with basic_grid.batch():
+            basic_grid.delete_nodes([106])
+        assert 106 in basic_grid.node.id
+
+    assert 106 not in basic_grid.node.id
+    assert np.all(basic_grid.graphs.complete_graph.external_ids != 106)
@@ -4,12 +4,20 @@
 
 """Grid tests"""
 
+import json
 import shutil
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from power_grid_model_ds._core import fancypy as fp
+from power_grid_model_ds._core.model.arrays import LineArray
+from power_grid_model_ds._core.model.graphs.container import GraphContainer
+from power_grid_model_ds._core.model.graphs.models import RustworkxGraphModel
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.utils.pickle import save_to_pickle
 from tests.fixtures.grid_classes import ExtendedGrid
@@ -18,6 +26,31 @@ from tests.fixtures.grids import build_basic_grid
 # pylint: disable=missing-function-docstring
 
 
+class _CustomGraphModel(RustworkxGraphModel):
+    pass
+
+
+class _CustomGraphContainer(GraphContainer):
+    pass
+
+
+class _CustomGraphGrid(Grid):
+    @classmethod
+    def empty(cls, graph_model=_CustomGraphModel):
+        grid = super().empty(graph_model=graph_model)
+        grid.graphs = _CustomGraphContainer.empty(graph_model=graph_model)
+        return grid
+
+
+class _OtherLineArray(LineArray):
+    pass
+
+
+@dataclass
+class _OtherLineGrid(Grid):
+    line: _OtherLineArray
+
+
 def test_cache_empty_grid(grid):
     """Test that empty grid can be cached"""
     cache_dir = Path("tmp")
@@ -134,3 +167,150 @@ def test_load_invalid_grid():
     with pytest.raises(TypeError):
         Grid.from_cache(cache_path)
     cache_path.unlink()
+
+
+def test_cache_and_load_columnar(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=False, columnar=True)
+    assert cache_path.is_dir()
+
+    new_grid = Grid.from_cache(cache_path)
+
+    for old, new in zip(basic_grid.all_arrays(), new_grid.all_arrays()):
+        assert fp.array_equal(old, new)
+    assert basic_grid.id_counter == new_grid.id_counter
+    assert basic_grid.graphs.active_graph.nr_branches == new_grid.graphs.active_graph.nr_branches
+    assert basic_grid.graphs.complete_graph.nr_branches == new_grid.graphs.complete_graph.nr_branches
+    assert isinstance(new_grid.node.data, np.memmap)
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_loads_graphs(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", columnar=True)
+
+    with patch.object(GraphContainer, "from_arrays") as from_arrays:
+        new_grid = Grid.from_cache(cache_path)
+    from_arrays.assert_not_called()
+
+    for old_graph, new_graph in zip(
+        (basic_grid.graphs.active_graph, basic_grid.graphs.complete_graph),
+        (new_grid.graphs.active_graph, new_grid.graphs.complete_graph),
+    ):
+        assert new_graph.active_only == old_graph.active_only
+        assert sorted(new_graph.external_ids) == sorted(old_graph.external_ids)
+        assert Counter(map(frozenset, new_graph.get_edges().tolist())) == Counter(
+            map(frozenset, old_graph.get_edges().tolist())
+        )
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_loads_graphs_of_grid_class():
+    grid = build_basic_grid(_CustomGraphGrid.empty())
+    cache_dir = Path("tmp")
+    cache_path = grid.cache(cache_dir=cache_dir, cache_name="my_cache", columnar=True)
+
+    with patch.object(GraphContainer, "from_arrays") as from_arrays:
+        new_grid = _CustomGraphGrid.from_cache(cache_path)
+    from_arrays.assert_not_called()
+
+    assert isinstance(new_grid.graphs, _CustomGraphContainer)
+    assert isinstance(new_grid.graphs.active_graph, _CustomGraphModel)
+    assert isinstance(new_grid.graphs.complete_graph, _CustomGraphModel)
+    assert new_grid.graphs.complete_graph.nr_branches == grid.graphs.complete_graph.nr_branches
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_rebuilds_outdated_graphs(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=False, columnar=True)
+
+    # modify the topology of the cached arrays, without updating the cached graphs
+    line = np.load(cache_path / "line.npy")
+    line["to_status"][0] = 0
+    np.save(cache_path / "line.npy", line)
+
+    new_grid = Grid.from_cache(cache_path)
+    assert new_grid.graphs.active_graph.nr_branches == basic_grid.graphs.active_graph.nr_branches - 1
+    shutil.rmtree(cache_dir)
+
+
+def test_cache_and_load_columnar_with_compression(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=True, columnar=True)
+
+    new_grid = Grid.from_cache(cache_path)
+
+    for old, new in zip(basic_grid.all_arrays(), new_grid.all_arrays()):
+        assert fp.array_equal(old, new)
+    assert not isinstance(new_grid.node.data, np.memmap)
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_is_copy_on_write(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=False, columnar=True)
+
+    new_grid = Grid.from_cache(cache_path)
+    new_grid.line.from_status = 0
+    new_grid.append(new_grid.node.__class__(id=[999], u_rated=[10_500.0]))
+    del new_grid
+
+    reloaded_grid = Grid.from_cache(cache_path)
+    assert fp.array_equal(basic_grid.line, reloaded_grid.line)
+    assert fp.array_equal(basic_grid.node, reloaded_grid.node)
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_overwrite_memory_mapped_grid(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=False, columnar=True)
+
+    new_grid = Grid.from_cache(cache_path, memory_map=True)
+    new_grid.line.from_status = 0
+    new_grid.cache(cache_dir=cache_dir, cache_name="my_cache", compress=False, columnar=True)
+
+    reloaded_grid = Grid.from_cache(cache_path)
+    assert fp.array_equal(new_grid.line, reloaded_grid.line)
+    assert fp.array_equal(basic_grid.node, reloaded_grid.node)
+    assert [path.name for path in cache_dir.iterdir()] == ["my_cache"]
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_of_other_grid_class(basic_grid):
+    cache_dir = Path("tmp")
+    cache_path = basic_grid.cache(cache_dir=cache_dir, cache_name="my_cache", columnar=True)
+
+    with pytest.raises(TypeError, match="contains a"):
+        _CustomGraphGrid.from_cache(cache_path)
+    shutil.rmtree(cache_dir)
+
+
+def test_columnar_cache_of_other_array_class():
+    grid = build_basic_grid(Grid.empty())
+    cache_dir = Path("tmp")
+    cache_path = grid.cache(cache_dir=cache_dir, cache_name="my_cache", columnar=True)
+    manifest = json.loads((cache_path / "manifest.json").read_text(encoding="utf-8"))
+    manifest["container_class"] = f"{_OtherLineGrid.__module__}.{_OtherLineGrid.__qualname__}"
+    (cache_path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    with pytest.raises(TypeError, match="'line' is a"):
+        _OtherLineGrid.from_cache(cache_path)
+    shutil.rmtree(cache_dir)
+
+
+def test_cache_and_load_extended_grid_columnar():
+    grid = build_basic_grid(ExtendedGrid.empty())
+    grid.extra_value = 456
+
+    cache_dir = Path("tmp")
+    cache_path = grid.cache(cache_dir=cache_dir, cache_name="my_cache", columnar=True)
+    new_grid = ExtendedGrid.from_cache(cache_path)
+
+    for old, new in zip(grid.all_arrays(), new_grid.all_arrays()):
+        assert fp.array_equal(old, new)
+    assert 456 == new_grid.extra_value
+
+    with pytest.raises(TypeError):
+        Grid.from_cache(cache_path)
+    shutil.rmtree(cache_dir)
@@ -7,6 +7,7 @@ import pytest
 
 from power_grid_model_ds import Grid
 from power_grid_model_ds._core.model.arrays.base.errors import RecordDoesNotExist
+from power_grid_model_ds._core.model.constants import EMPTY_ID
 from power_grid_model_ds._core.model.enums.nodes import NodeType
 
 # pylint: disable=missing-function-docstring
@@ -25,12 +26,36 @@ def test_grid_get_nearest_substation_node_no_substation(basic_grid):
         basic_grid.get_nearest_substation_node(node_id=103)
 
 
+def test_grid_get_nearest_substation_nodes():
+    grid = Grid.from_txt("S1 2", "2 3", "3 5", "S10 11", "11 12", "5 12 open", "7 8")
+    substation_node_ids, distances = grid.get_nearest_substation_nodes()
+
+    np.testing.assert_array_equal(grid.node.id, [1, 10, 2, 3, 5, 7, 8, 11, 12])
+    np.testing.assert_array_equal(substation_node_ids, [1, 10, 1, 1, 1, EMPTY_ID, EMPTY_ID, 10, 10])
+    np.testing.assert_array_equal(distances, [0, 0, 1, 2, 3, -1, -1, 1, 2])
+
+
+def test_grid_get_nearest_substation_nodes_subset(basic_grid):
+    node_ids = basic_grid.node.id[::-1]
+    substation_node_ids, distances = basic_grid.get_nearest_substation_nodes(node_ids)
+
+    for node_id, substation_node_id, distance in zip(node_ids, substation_node_ids, distances):
+        assert basic_grid.get_nearest_substation_node(node_id).id == substation_node_id
+        path, _ = basic_grid.graphs.active_graph.get_shortest_path(node_id, substation_node_id)
+        assert len(path) - 1 == distance
+
+
 class TestGetDownstreamNodes:
     def test_get_downstream_nodes(self):
         grid = Grid.from_txt("S1 11", "S1 2", "2 3", "3 5", "5 6", "2 4", "4 99", "99 100")
         downstream_nodes = grid.get_downstream_nodes(node_id=3)
         assert [5, 6] == downstream_nodes
 
+    def test_get_downstream_nodes_meshed(self):
+        grid = Grid.from_txt("S1 2", "2 3", "3 4", "2 4")
+        assert [4] == grid.get_downstream_nodes(node_id=3)
+        assert {3, 4} == set(grid.get_downstream_nodes(node_id=2))
+
     def test_get_downstream_nodes_from_substation_node(self):
         grid = Grid.from_txt("S1 11", "S1 2", "2 3", "3 5", "5 6", "2 4", "4 99", "99 100")
         with pytest.raises(NotImplementedError):
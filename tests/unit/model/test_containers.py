@@ -290,3 +290,27 @@ class TestReverseBranches:
 
     def test_reverse_no_branches(self, basic_grid: Grid):
         basic_grid.reverse_branches(BranchArray())
+
+
+def test_append_to_capacity_backed_array():
+    container = Grid.empty()
+    container.node.reserve(10)
+    node = container.node
+
+    container.append(NodeArray.empty(3))
+    container.append(NodeArray.empty(2))
+
+    assert container.node is node
+    assert container.node.capacity == 10
+    assert np.array_equal(container.node.id, [1, 2, 3, 4, 5])
+    assert container.graphs.active_graph.nr_nodes == 5
+
+
+def test_append_to_array_replaces_array():
+    container = Grid.empty()
+    node = container.node
+
+    container.append(NodeArray.empty(3))
+
+    assert container.node is not node
+    assert not container.node.is_capacity_backed
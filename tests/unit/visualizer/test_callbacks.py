@@ -2,11 +2,20 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 import pytest
+from dash import Patch
 from dash.exceptions import PreventUpdate
 
+from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.visualizer.callbacks.config import scale_elements, update_arrows
+from power_grid_model_ds._core.visualizer.callbacks.element_selection import display_selected_element
+from power_grid_model_ds._core.visualizer.callbacks.grid_changes import apply_grid_changes
+from power_grid_model_ds._core.visualizer.callbacks.level_of_detail import expand_group
 from power_grid_model_ds._core.visualizer.callbacks.search_form import search_element
-from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import DEFAULT_STYLESHEET
+from power_grid_model_ds._core.visualizer.layout.cytoscape_styling import DEFAULT_STYLESHEET, SEARCH_MATCH_CLASS
+from power_grid_model_ds._core.visualizer.level_of_detail import LevelOfDetail
+from power_grid_model_ds._core.visualizer.live_update import ElementTracker
+from power_grid_model_ds._core.visualizer.server_state import register_state
 
 _EDGE_INDEX = 3
 
@@ -22,19 +31,34 @@ def test_scale_elements_default_values():
 
 def test_search_element_no_input():
     with pytest.raises(PreventUpdate):
-        search_element(group="", column="", operator="", value="", stylesheet=DEFAULT_STYLESHEET)
+        search_element(group="", column="", operator="", value="", grid_key=None)
 
 
 def test_search_element_with_input():
+    grid = Grid.from_txt("S1 2", "2 3")
     group = "node"
     column = "id"
     operator = "="
-    value = "1"
+    value = "2"
 
-    expected_selector = f'[{column} {operator} "{value}"]'
+    result = search_element(group, column, operator, value, register_state(grid))
+    assert result == ["2"]
 
-    result = search_element(group, column, operator, value, DEFAULT_STYLESHEET)
-    assert result[-1]["selector"] == expected_selector
+
+def test_search_element_no_match():
+    grid = Grid.from_txt("S1 2", "2 3")
+
+    result = search_element("node", "id", "=", "4", register_state(grid))
+    assert result == []
+
+
+def test_display_selected_element():
+    grid = Grid.from_txt("S1 2", "2 3")
+
+    data_table = display_selected_element([{"id": "2", "group": "node"}], [], register_state(grid))
+    assert data_table.data[0]["id"] == 2
+    # the columns that are not in the element data are looked up in the grid
+    assert set(data_table.data[0]) == set(grid.node.columns)
 
 
 def test_show_arrows():
@@ -45,3 +69,53 @@ def test_show_arrows():
 def test_hide_arrows():
     stylesheet = update_arrows(False, DEFAULT_STYLESHEET)
     assert stylesheet[_EDGE_INDEX]["style"]["target-arrow-shape"] == "none"
+
+
+def test_expand_group():
+    level_of_detail = LevelOfDetail(RadialGridGenerator(Grid).run(seed=0))
+    key = register_state(level_of_detail)
+    group = level_of_detail.groups[0]
+    node_data = {"id": level_of_detail.get_aggregate_id(group), "group": "aggregate", "feeder_branch_id": group}
+
+    elements, expanded_groups = expand_group(node_data, [], key, [])
+    assert isinstance(elements, Patch)
+    assert expanded_groups == [group]
+
+    with pytest.raises(PreventUpdate):
+        expand_group(node_data, expanded_groups, key, [])
+
+
+def test_expand_group_with_search_matches():
+    level_of_detail = LevelOfDetail(RadialGridGenerator(Grid).run(seed=0))
+    group = level_of_detail.groups[0]
+    aggregate_id = level_of_detail.get_aggregate_id(group)
+    node_data = {"id": aggregate_id, "group": "aggregate", "feeder_branch_id": group}
+
+    elements, _ = expand_group(node_data, [], register_state(level_of_detail), [aggregate_id])
+    operations = elements.to_plotly_json()["operations"]
+    removed_aggregate = next(
+        operation["params"]["value"]
+        for operation in operations
+        if operation["operation"] == "Remove" and operation["params"]["value"]["data"]["id"] == aggregate_id
+    )
+    # the aggregated element is removed by value, like it is in the browser
+    assert removed_aggregate["classes"] == SEARCH_MATCH_CLASS
+
+
+def test_expand_group_no_aggregate():
+    with pytest.raises(PreventUpdate):
+        expand_group({"id": "1", "group": "node"}, [], None, [])
+
+
+def test_apply_grid_changes():
+    grid = Grid.from_txt("S1 2", "2 3")
+    tracker = ElementTracker(grid)
+    key = register_state(tracker)
+    with pytest.raises(PreventUpdate):
+        apply_grid_changes(1, 0, key)
+
+    grid.line.from_status = 0
+    tracker.update()
+    elements, version = apply_grid_changes(2, 0, key)
+    assert isinstance(elements, Patch)
+    assert version == 1
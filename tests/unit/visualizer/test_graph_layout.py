@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from power_grid_model_ds._core.model.enums.nodes import NodeType
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer import graph_layout
+from power_grid_model_ds._core.visualizer.graph_layout import X_SPACING, Y_SPACING, get_node_positions
+
+
+@pytest.fixture
+def meshed_grid() -> Grid:
+    return Grid.from_txt("S1 2", "2 3", "3 4", "2 5", "S1 6", "6 7", "7 3", "8 9")
+
+
+def test_tree_layout(meshed_grid: Grid):
+    positions = get_node_positions(meshed_grid, layout="tree") / [X_SPACING, Y_SPACING]
+
+    # substation on top, each node one level below its parent
+    assert_array_equal(positions[:, 1], [0, -1, -2, -3, -2, -1, -2, -5, -5])
+    # a parent is centered above its children
+    assert positions[1, 0] == np.mean(positions[[2, 4], 0])
+    # nodes that are not connected to a substation are placed in a row below the trees
+    assert positions[7, 0] != positions[8, 0]
+
+
+def test_force_layout(meshed_grid: Grid):
+    tree_positions = get_node_positions(meshed_grid, layout="tree")
+    positions = get_node_positions(meshed_grid, layout="force")
+
+    # only the nodes on the cycle (except the substation) are moved
+    is_moved = np.any(positions != tree_positions, axis=1)
+    assert_array_equal(is_moved, [False, True, True, False, False, True, True, False, False])
+    assert np.all(np.isfinite(positions))
+
+
+def test_layout_is_cached(meshed_grid: Grid):
+    get_node_positions(meshed_grid, layout="tree")
+    with patch.object(graph_layout, "get_tree_layout") as get_tree_layout:
+        get_node_positions(meshed_grid, layout="tree")
+        get_tree_layout.assert_not_called()
+
+        meshed_grid.make_inactive(meshed_grid.line.get(from_node=2, to_node=3))
+        get_node_positions(meshed_grid, layout="tree")
+        get_tree_layout.assert_called_once()
+
+
+def test_layout_cache_includes_node_types(meshed_grid: Grid):
+    positions = get_node_positions(meshed_grid, layout="tree")
+
+    meshed_grid.node.update_by_id(8, node_type=NodeType.SUBSTATION_NODE.value)
+    new_positions = get_node_positions(meshed_grid, layout="tree")
+    assert new_positions[7, 1] == 0
+    assert not np.array_equal(positions, new_positions)
+
+
+def test_unknown_layout(meshed_grid: Grid):
+    with pytest.raises(ValueError):
+        get_node_positions(meshed_grid, layout="cose")  # type: ignore[arg-type]
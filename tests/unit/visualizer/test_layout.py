@@ -1,6 +1,8 @@
 # SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
 #
 # SPDX-License-Identifier: MPL-2.0
+import pytest
+
 from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
 from power_grid_model_ds._core.model.grids.base import Grid
 from power_grid_model_ds._core.visualizer.app import get_app_layout
@@ -16,3 +18,31 @@ def test_get_cytoscape_html():
 def test_get_app_layout():
     grid = RadialGridGenerator(Grid).run()
     assert get_app_layout(grid)
+
+
+def test_get_app_layout_aggregated():
+    grid = RadialGridGenerator(Grid).run()
+    assert get_app_layout(grid, aggregate_by="feeder")
+
+
+def test_get_app_layout_server_side_layout():
+    grid = RadialGridGenerator(Grid).run()
+    app_layout = get_app_layout(grid, layout="tree")
+    cytoscape = next(
+        child.children
+        for child in app_layout.children
+        if getattr(getattr(child, "children", None), "id", None) == "cytoscape-graph"
+    )
+    assert cytoscape.layout == {"name": "preset"}
+    assert all("position" in element for element in cytoscape.elements if "source" not in element["data"])
+
+
+def test_get_app_layout_live_update():
+    grid = RadialGridGenerator(Grid).run()
+    assert get_app_layout(grid, live_update=True)
+
+
+def test_get_app_layout_live_update_aggregated():
+    grid = RadialGridGenerator(Grid).run()
+    with pytest.raises(ValueError):
+        get_app_layout(grid, aggregate_by="feeder", live_update=True)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+import pytest
+
+from power_grid_model_ds._core.data_source.generator.grid_generators import RadialGridGenerator
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.level_of_detail import AGGREGATE_GROUP, LevelOfDetail
+from power_grid_model_ds._core.visualizer.parsers import parse_branches, parse_node_array
+
+
+@pytest.fixture
+def radial_grid() -> Grid:
+    return RadialGridGenerator(Grid, nr_nodes=50, nr_nops=5).run(seed=0)
+
+
+def _get_ids(elements) -> set[str]:
+    return {element["data"]["id"] for element in elements}
+
+
+def test_get_elements(radial_grid: Grid):
+    level_of_detail = LevelOfDetail(radial_grid, aggregate_by="feeder")
+    elements = level_of_detail.get_elements()
+
+    aggregates = [element for element in elements if element["data"]["group"] == AGGREGATE_GROUP]
+    feeder_branch_ids = radial_grid.node.feeder_branch_id[~radial_grid.node.is_empty("feeder_branch_id")]
+    assert _get_ids(aggregates) == {f"feeder_{branch_id}" for branch_id in set(feeder_branch_ids)}
+    assert sum(element["data"]["nr_nodes"] for element in aggregates) == radial_grid.node.size - radial_grid.source.size
+
+    # all edges are connected to visible elements
+    node_ids = {element["data"]["id"] for element in elements if "source" not in element["data"]}
+    for edge in (element for element in elements if "source" in element["data"]):
+        assert edge["data"]["source"] in node_ids
+        assert edge["data"]["target"] in node_ids
+
+
+def test_aggregate_by_substation(radial_grid: Grid):
+    level_of_detail = LevelOfDetail(radial_grid, aggregate_by="substation")
+    aggregates = [element for element in level_of_detail.get_elements() if element["data"]["group"] == AGGREGATE_GROUP]
+    assert _get_ids(aggregates) == {f"substation_{node_id}" for node_id in radial_grid.source.node}
+
+
+def test_aggregate_by_unknown(radial_grid: Grid):
+    with pytest.raises(ValueError):
+        LevelOfDetail(radial_grid, aggregate_by="unknown")  # type: ignore[arg-type]
+
+
+def test_expand_all_groups(radial_grid: Grid):
+    level_of_detail = LevelOfDetail(radial_grid, aggregate_by="feeder")
+    elements = level_of_detail.get_elements()
+
+    expanded_groups: set[int] = set()
+    for group in level_of_detail.groups:
+        removed, added = level_of_detail.expand(group, expanded_groups)
+        for element in removed:
+            elements.remove(element)  # the removed elements are exactly as they were added
+        elements += added
+        expanded_groups.add(group)
+
+    expected_elements = parse_node_array(radial_grid.node) + parse_branches(radial_grid)
+    assert sorted(map(repr, elements)) == sorted(map(repr, expected_elements))
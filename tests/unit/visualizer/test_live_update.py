@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+import gc
+from typing import Any
+
+import numpy as np
+import pytest
+from dash import Patch
+
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.live_update import (
+    ElementTracker,
+    push_changes,
+    register_tracker,
+    unregister_tracker,
+)
+from power_grid_model_ds._core.visualizer.parsers import parse_branches, parse_node_array
+from power_grid_model_ds.arrays import LineArray, NodeArray
+
+
+@pytest.fixture
+def live_grid() -> Grid:
+    return Grid.from_txt("S1 2", "2 3", "3 4", "4 5", "S1 5 open")
+
+
+def _apply(elements: list[dict[str, Any]], patch: Patch) -> list[dict[str, Any]]:
+    """Apply a patch of the elements like the browser does"""
+    elements = list(elements)
+    for operation in patch.to_plotly_json()["operations"]:
+        if operation["operation"] == "Assign":
+            elements[operation["location"][0]] = operation["params"]["value"]
+        elif operation["operation"] == "Delete":
+            del elements[operation["location"][0]]
+        else:
+            elements.extend(operation["params"]["value"])
+    return elements
+
+
+def _get_ids(elements: list[dict[str, Any]]) -> set[str]:
+    return {element["data"]["id"] for element in elements}
+
+
+def test_no_changes(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+
+    assert tracker.update() == 0
+    assert tracker.version == 0
+
+
+def test_status_change(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    elements = list(tracker.elements)
+    line = live_grid.line.get(from_node=2, to_node=3)
+
+    live_grid.make_inactive(line)
+    assert tracker.update() == 1
+
+    patch, version = tracker.get_changes(0)
+    assert version == 1
+    new_elements = _apply(elements, patch)
+    assert new_elements == tracker.elements
+    changed_line = next(element for element in new_elements if element["data"]["id"] == str(line.id.item()))
+    assert changed_line["data"]["to_status"] == 0
+
+
+def test_updated_column_keeps_position(live_grid: Grid):
+    tracker = ElementTracker(live_grid, positions=np.array([[x, 0] for x in range(live_grid.node.size)]))
+
+    live_grid.node.node_type = 2
+    assert tracker.update() == live_grid.node.size
+
+    node_elements = [element for element in tracker.elements if element["data"]["group"] == "node"]
+    assert all(element["data"]["node_type"] == 2 for element in node_elements)
+    assert [element["position"]["x"] for element in node_elements] == list(range(live_grid.node.size))
+
+
+def test_added_and_removed_assets(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    elements = list(tracker.elements)
+
+    live_grid.append(NodeArray(id=[100], u_rated=[10_500]))
+    line = LineArray.zeros(1)
+    line.id, line.from_node, line.to_node, line.from_status, line.to_status = 101, 5, 100, 1, 1
+    live_grid.append(line)
+    live_grid.line = live_grid.line.exclude(from_node=3)
+    tracker.update()
+
+    patch, _ = tracker.get_changes(0)
+    new_elements = _apply(elements, patch)
+    assert new_elements == tracker.elements
+    assert _get_ids(new_elements) == _get_ids(parse_node_array(live_grid.node) + parse_branches(live_grid))
+
+
+def test_changed_branch_nodes(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    elements = list(tracker.elements)
+
+    line_id = live_grid.line.get(from_node=4, to_node=5).id.item()
+    live_grid.line.update_by_id(line_id, to_node=1)
+    tracker.update()
+
+    patch, _ = tracker.get_changes(0)
+    new_elements = _apply(elements, patch)
+    changed_line = next(element for element in new_elements if element["data"]["id"] == str(line_id))
+    assert changed_line["data"]["target"] == "1"
+
+
+def test_get_changes_since_version(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    live_grid.node.node_type = 2
+    tracker.update()
+    elements = list(tracker.elements)
+    live_grid.line.from_status = 0
+    tracker.update()
+
+    patch, version = tracker.get_changes(1)
+    assert version == 2
+    assert _apply(elements, patch) == tracker.elements
+
+
+def test_get_changes_too_old(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    for node_type in range(110):
+        live_grid.node.node_type = node_type
+        tracker.update()
+
+    changes, version = tracker.get_changes(0)
+    assert changes == tracker.elements
+    assert version == 110
+
+
+def test_push_changes(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    register_tracker(tracker)
+
+    live_grid.line.from_status = 0
+    assert push_changes(live_grid) == live_grid.line.size
+    assert tracker.version == 1
+    assert push_changes(Grid.empty()) == 0
+
+
+def test_unregister_tracker(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+    register_tracker(tracker)
+    unregister_tracker(tracker)
+
+    live_grid.line.from_status = 0
+    assert push_changes(live_grid) == 0
+    assert tracker.version == 0
+
+
+def test_unused_trackers_are_released(live_grid: Grid):
+    register_tracker(ElementTracker(live_grid))
+    gc.collect()
+
+    live_grid.line.from_status = 0
+    assert push_changes(live_grid) == 0
+
+
+def test_other_columns_are_not_sent(live_grid: Grid):
+    tracker = ElementTracker(live_grid)
+
+    live_grid.line.r1 = 0.5
+    live_grid.node.u_rated = 400
+    assert tracker.update() == 0
+    assert tracker.version == 0
@@ -7,7 +7,13 @@ from numpy.typing import NDArray
 
 from power_grid_model_ds._core.model.arrays import LineArray, NodeArray
 from power_grid_model_ds._core.model.arrays.pgm_arrays import Branch3Array
-from power_grid_model_ds._core.visualizer.parsers import parse_branch3_array, parse_branch_array, parse_node_array
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.parsers import (
+    get_element_record,
+    parse_branch3_array,
+    parse_branch_array,
+    parse_node_array,
+)
 
 
 class CoordinatedNodeArray(NodeArray):
@@ -20,6 +26,7 @@ class TestParseNodeArray:
         nodes = NodeArray.zeros(3)
         nodes["id"] = [1, 2, 3]
         nodes["u_rated"] = [10, 20.4, 30.99]
+        nodes["node_type"] = [1, 0, 0]
 
         parsed = parse_node_array(nodes)
         assert len(parsed) == 3
@@ -35,9 +42,9 @@ class TestParseNodeArray:
         assert node_2_data["id"] == "2"
         assert node_3_data["id"] == "3"
 
-        assert node_1_data["u_rated"] == 10
-        assert node_2_data["u_rated"] == 20.4
-        assert node_3_data["u_rated"] == 30.99
+        assert node_1_data["node_type"] == 1
+        assert node_2_data["node_type"] == 0
+        assert "u_rated" not in node_1_data  # only the columns that are used by the stylesheet are sent
 
     def test_parse_coordinated_node_array(self):
         nodes = CoordinatedNodeArray.zeros(3)
@@ -90,3 +97,52 @@ class TestParseBranches:
         assert parsed[2]["data"]["source"] == "2"
         assert parsed[2]["data"]["target"] == "3"
         assert parsed[2]["data"]["group"] == "transformer"
+
+    def test_parse_branch3_array_record_data(self):
+        branch3 = Branch3Array.zeros(2)
+        branch3["id"] = [200, 300]
+        branch3["node_1"] = [1, 4]
+        branch3["node_2"] = [2, 5]
+        branch3["node_3"] = [3, 6]
+        branch3["status_3"] = [1, 0]
+
+        parsed = parse_branch3_array(branch3, "transformer")
+        assert [element["data"]["id"] for element in parsed] == [
+            "200_1_2",
+            "200_1_3",
+            "200_2_3",
+            "300_4_5",
+            "300_4_6",
+            "300_5_6",
+        ]
+        # the other values of the three-winding transformer are looked up when an element is selected
+        assert "status_3" not in parsed[3]["data"]
+
+
+class TestGetElementRecord:
+    def test_get_node_record(self):
+        grid = Grid.from_txt("S1 2", "2 3")
+        record = get_element_record(grid, parse_node_array(grid.node)[1]["data"])
+
+        assert record is not None
+        assert record["id"] == 2
+        assert set(record) == set(grid.node.columns)
+
+    def test_get_branch3_record(self):
+        grid = Grid.empty()
+        branch3 = grid.three_winding_transformer.__class__.zeros(1)
+        branch3["id"] = [200]
+        branch3["node_1"], branch3["node_2"], branch3["node_3"] = [1], [2], [3]
+        grid.three_winding_transformer = branch3
+
+        record = get_element_record(grid, parse_branch3_array(branch3, "transformer")[2]["data"])
+        assert record is not None
+        assert record["id"] == 200
+
+    def test_get_aggregate_record(self):
+        grid = Grid.from_txt("S1 2", "2 3")
+        assert get_element_record(grid, {"id": "feeder_1", "group": "aggregate"}) is None
+
+    def test_get_removed_record(self):
+        grid = Grid.from_txt("S1 2", "2 3")
+        assert get_element_record(grid, {"id": "99", "group": "line"}) is None
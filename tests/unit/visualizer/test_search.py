@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+import pytest
+
+from power_grid_model_ds._core.model.grids.base import Grid
+from power_grid_model_ds._core.visualizer.parsers import parse_branches
+from power_grid_model_ds._core.visualizer.search import search_element_ids
+from power_grid_model_ds.arrays import ThreeWindingTransformerArray
+
+
+@pytest.fixture
+def search_grid() -> Grid:
+    grid = Grid.from_txt("S1 2", "2 3", "3 4", "4 5 link", "5 6 transformer")
+    grid.line.r1 = [0.1, 0.2, 0.3]
+    three_winding_transformer = ThreeWindingTransformerArray.zeros(1)
+    three_winding_transformer.id = 100
+    three_winding_transformer.node_1, three_winding_transformer.node_2, three_winding_transformer.node_3 = 1, 3, 6
+    grid.append(three_winding_transformer)
+    return grid
+
+
+def test_search_nodes(search_grid: Grid):
+    assert search_element_ids(search_grid, "node", "id", "=", "3") == ["3"]
+    assert search_element_ids(search_grid, "node", "id", "!=", "3") == ["1", "2", "4", "5", "6"]
+    assert search_element_ids(search_grid, "node", "id", ">", "4") == ["5", "6"]
+    assert search_element_ids(search_grid, "node", "id", "<", "2") == ["1"]
+
+
+def test_search_branches(search_grid: Grid):
+    line_ids = search_grid.line.id.astype(str).tolist()
+
+    assert search_element_ids(search_grid, "line", "r1", ">", "0.15") == line_ids[1:]
+    assert search_element_ids(search_grid, "branch", "from_node", "=", "4") == search_grid.link.id.astype(str).tolist()
+
+
+def test_search_three_winding_transformer(search_grid: Grid):
+    element_ids = {element["data"]["id"] for element in parse_branches(search_grid)}
+
+    found_ids = search_element_ids(search_grid, "transformer", "id", "=", "100")
+    assert len(found_ids) == 3
+    assert element_ids.issuperset(found_ids)
+
+
+def test_search_invalid_value(search_grid: Grid):
+    assert not search_element_ids(search_grid, "node", "id", "=", "abc")
+
+
+def test_search_value_out_of_range(search_grid: Grid):
+    assert not search_element_ids(search_grid, "line", "from_status", "=", "99999999999")
+
+
+def test_search_unknown_column(search_grid: Grid):
+    assert not search_element_ids(search_grid, "link", "r1", "=", "0.1")
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: Contributors to the Power Grid Model project <powergridmodel@lfenergy.org>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+import pytest
+from dash.exceptions import PreventUpdate
+
+from power_grid_model_ds._core.visualizer.server_state import MAX_STATES, get_state, register_state
+
+
+def test_get_state():
+    state = object()
+    assert get_state(register_state(state)) is state
+
+
+def test_get_unknown_state():
+    with pytest.raises(PreventUpdate):
+        get_state("unknown")
+    with pytest.raises(PreventUpdate):
+        get_state(None)
+
+
+def test_least_recently_used_states_are_released():
+    used_key = register_state("used")
+    unused_key = register_state("unused")
+    for i in range(MAX_STATES - 2):
+        register_state(i)
+    assert get_state(used_key) == "used"
+
+    register_state("new")
+    assert get_state(used_key) == "used"
+    with pytest.raises(PreventUpdate):
+        get_state(unused_key)